@@ -0,0 +1,283 @@
+# Asignación de celdas con basura a toda la flota a la vez (GameBoard con allocation="assignment").
+# En lugar de que cada robot tome la basura más cercana en el orden en que lo activa el
+# scheduler, se resuelve un problema de asignación (método húngaro) entre los robots que van
+# por basura y las celdas con basura, con la distancia de recorrido como costo.
+#
+# Los robots que ya van en camino a una celda también entran en la asignación: si a otro robot
+# le queda más cerca, se la cede y toma otra. La asignación se vuelve a resolver cuando algún
+# robot se queda sin celda (al empezar el paso, o al recoger o vaciar la basura a mitad del paso).
+#
+# Con allocation="tour" cada robot planea de una vez un recorrido por varias celdas con basura
+# que llena lo que le queda de capacidad y termina en la papelera (TourPlanner).
+#
+# Para no calcular la distancia de cada robot a todas las celdas, cada robot solo considera sus
+# 'n' celdas más cercanas ('n' robots en la asignación): en una asignación óptima ningún robot
+# toma una celda más lejana que esas, porque a lo más n - 1 robots pueden ocupar las más cercanas.
+import time
+from collections import deque
+
+import numpy as np
+
+from pathfinding import DistanceField
+
+# Costo de una celda que no está entre las más cercanas de un robot y de quedarse sin celda
+MISSING = 1e9
+NO_TARGET = 1e6
+
+# Ventaja de la celda que el robot ya tenía, para que no cambie de objetivo por un empate
+KEEP_BONUS = 1
+
+
+# Método húngaro (caminos aumentantes más cortos con potenciales) para una matriz de costos de
+# n x m con n <= m. Regresa la columna asignada a cada renglón.
+def hungarian(cost):
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    # Renglón asignado a cada columna (índices desde 1, 0 = ninguno) y columna anterior en el camino
+    row_of = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        row_of[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        while True:
+            used[j0] = True
+            i0 = row_of[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            used_columns = np.flatnonzero(used)
+            u[row_of[used_columns]] += delta
+            v[used_columns] -= delta
+            minv[1:][free] -= delta
+
+            j0 = j1
+            if row_of[j0] == 0:
+                break
+
+        while j0:
+            j1 = way[j0]
+            row_of[j0] = row_of[j1]
+            j0 = j1
+
+    assignment = [-1] * n
+    for column in range(1, m + 1):
+        if row_of[column]:
+            assignment[row_of[column] - 1] = column - 1
+    return assignment
+
+
+# Distancia de 'start' a sus 'k' celdas objetivo más cercanas en 'graph' (BFS que se detiene al
+# encontrarlas). Las celdas objetivo son las de 'litter' y las de 'claimed'.
+def nearest_costs(graph, start, k, litter, claimed=()):
+    height = graph.height
+    neighbors = graph.neighbors
+    wall = graph.wall
+
+    start_id = start[0] * height + start[1]
+    found = {start: 0} if start in litter or start in claimed else {}
+    dist = {start_id: 0}
+    cola = deque([start_id])
+
+    while cola and len(found) < k:
+        cell = cola.popleft()
+        next_dist = dist[cell] + 1
+        for vecino in neighbors[cell]:
+            if vecino not in dist and not wall[vecino]:
+                dist[vecino] = next_dist
+                pos = divmod(vecino, height)
+                if pos in litter or pos in claimed:
+                    found[pos] = next_dist
+                cola.append(vecino)
+    return found
+
+
+class LitterAllocator:
+
+    def __init__(self, graph):
+        # Grafo solo con los muros: el costo no depende de dónde estén los demás robots en este paso
+        self.graph = graph
+
+        # Asignaciones resueltas, tiempo total y robots que cambiaron de celda en camino
+        self.solves = 0
+        self.seconds = 0.0
+        self.reassigned = 0
+        # (paso, celdas con basura) de la última asignación que dejó robots sin celda
+        self.last_idle = None
+        self.idle = set()
+
+    # Robots que participan en la asignación: limpiando, con espacio y sin ir a la papelera ni
+    # estar ya sobre su celda. Un robot terminado ("done") ya se contó en robots_finished y puede
+    # estar dormido, así que una celda asignada a él se quedaría sin recoger
+    @staticmethod
+    def pool(model):
+        return [robot for robot in model.schedule.agents
+                if robot.state == "cleaning" and not robot.alreadyCleaned and robot.load < robot.capacity
+                and robot.targetCell != model.paperBin_pos
+                and (not robot.targetCell or robot.pos != robot.targetCell)]
+
+    def needs_solve(self, model):
+        return any(not robot.targetCell for robot in self.pool(model))
+
+    def solve(self, model):
+        pool = self.pool(model)
+        if not pool:
+            return
+
+        # Si en este paso ya se resolvió, quedaron robots sin celda y no hay basura nueva, no
+        # hay nada que mejorar
+        key = (model.current_step, len(model.litterCoords))
+        if self.last_idle == key and all(robot.targetCell or robot.unique_id in self.idle for robot in pool):
+            return
+
+        start = time.perf_counter()
+        self.solves += 1
+
+        claimed = {robot.targetCell for robot in pool if robot.targetCell}
+        costs = [nearest_costs(self.graph, robot.pos, len(pool), model.litterCoords, claimed) for robot in pool]
+        columns = sorted({cell for robot_costs in costs for cell in robot_costs})
+        index = {cell: j for j, cell in enumerate(columns)}
+
+        # Una columna extra por robot para quedarse sin celda cuando no alcanzan
+        matrix = np.full((len(pool), len(columns) + len(pool)), MISSING)
+        matrix[:, len(columns):] = NO_TARGET
+        for i, (robot, robot_costs) in enumerate(zip(pool, costs)):
+            for cell, dist in robot_costs.items():
+                matrix[i, index[cell]] = dist - (KEEP_BONUS if cell == robot.targetCell else 0)
+
+        assignment = hungarian(matrix)
+        new_targets = [columns[j] if j < len(columns) and matrix[i, j] < MISSING else ()
+                       for i, j in enumerate(assignment)]
+
+        # Primero se liberan las celdas que cambian de dueño y después se reclaman las nuevas
+        changed = [(robot, target) for robot, target in zip(pool, new_targets) if target != robot.targetCell]
+        for robot, _ in changed:
+            if robot.targetCell:
+                model.litterCoords.add(robot.targetCell)
+                self.reassigned += 1
+        for robot, target in changed:
+            if target:
+                model.litterCoords.discard(target)
+            robot.targetCell = target
+            robot.queuedMovements = []
+
+        self.idle = {robot.unique_id for robot in pool if not robot.targetCell}
+        self.last_idle = key if self.idle else None
+        self.seconds += time.perf_counter() - start
+
+
+# Celdas con basura más cercanas que se consideran para armar un recorrido
+TOUR_CANDIDATES = 10
+
+
+# Recorridos con capacidad (allocation="tour"): cuando un robot se queda sin celda, elige entre
+# sus celdas con basura más cercanas las que llenan lo que le queda de capacidad, insertando cada
+# vez la que menos alarga el camino, y después mejora el orden con 2-opt. El robot recorre las
+# celdas en ese orden. Si las celdas alcanzan para llenarlo, al recoger la última va directo a la
+# papelera, así que el camino que se mide es robot -> ... -> papelera; si no alcanzan, al terminar
+# planea otro recorrido y el camino termina en la última celda.
+# Las distancias entre las celdas del recorrido salen de BFS locales y la distancia a la papelera
+# de un campo de distancias que solo se recalcula si cambian los muros conocidos.
+class TourPlanner:
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.binField = DistanceField(graph)
+
+        # Recorridos planeados, celdas en ellos y tiempo total
+        self.tours = 0
+        self.cells = 0
+        self.seconds = 0.0
+
+    def bin_distance(self, cell):
+        dist = self.binField.dist[cell[0] * self.graph.height + cell[1]]
+        return dist if dist >= 0 else MISSING
+
+    # Largo del camino start -> route (-> papelera si 'to_bin') con las distancias de 'pairs'
+    def length(self, route, pairs, to_bin):
+        total = 0
+        for a, b in zip(route, route[1:]):
+            total += pairs[a].get(b, MISSING)
+        return total + (self.bin_distance(route[-1]) if to_bin else 0)
+
+    # Celdas (en orden) que debe visitar un robot en 'start' con 'remaining' de capacidad libre
+    def plan(self, start, remaining, litter, litter_counts, paperBin_pos):
+        clock = time.perf_counter()
+        if self.binField.key != self.graph.version:
+            self.binField.compute([paperBin_pos], self.graph.version)
+
+        # Las celdas más cercanas hasta juntar el doble de la capacidad libre (a lo más TOUR_CANDIDATES)
+        candidates = []
+        found = 0
+        for cell in nearest_costs(self.graph, start, TOUR_CANDIDATES, litter):
+            if found >= 2 * remaining:
+                break
+            candidates.append(cell)
+            found += int(litter_counts[cell])
+
+        # El recorrido termina en la papelera solo si las candidatas llenan al robot
+        to_bin = sum(int(litter_counts[cell]) for cell in candidates) >= remaining
+        end = self.bin_distance if to_bin else lambda cell: 0
+
+        # Distancias entre el inicio y las celdas candidatas: una búsqueda desde cada celda de
+        # 'nodes' encuentra su distancia a todas las que le siguen en la lista
+        nodes = [start] + candidates
+        pairs = {cell: {cell: 0} for cell in nodes}
+        for i, cell in enumerate(nodes[:-1]):
+            rest = set(nodes[i + 1:])
+            for other, dist in nearest_costs(self.graph, cell, len(rest), rest).items():
+                pairs[cell][other] = pairs[other][cell] = dist
+
+        # Un orden sirve si el robot no se llena antes de la última celda; si no, iría a la
+        # papelera a la mitad del recorrido
+        def fits(route):
+            return sum(int(litter_counts[cell]) for cell in route[1:-1]) < remaining
+
+        # Inserción más barata: cada celda nueva va donde menos alarga el recorrido (al final
+        # siempre se puede, porque las celdas anteriores no llenan al robot)
+        route = [start]
+        left = remaining
+        while left > 0 and candidates:
+            best = None
+            for cell in candidates:
+                for i in range(1, len(route) + 1):
+                    if i < len(route) and not fits(route[:i] + [cell] + route[i:]):
+                        continue
+                    before = route[i - 1]
+                    after_cost = pairs[cell].get(route[i], MISSING) if i < len(route) else end(cell)
+                    old_cost = pairs[before].get(route[i], MISSING) if i < len(route) else end(before)
+                    extra = pairs[before].get(cell, MISSING) + after_cost - old_cost
+                    key = (extra, -int(litter_counts[cell]))
+                    if best is None or key < best[0]:
+                        best = (key, cell, i)
+            _, cell, i = best
+            route.insert(i, cell)
+            candidates.remove(cell)
+            left -= int(litter_counts[cell])
+
+        # 2-opt sobre las celdas del recorrido (el inicio queda fijo)
+        improved = True
+        while improved and len(route) > 3:
+            improved = False
+            for i in range(1, len(route) - 1):
+                for j in range(i + 1, len(route)):
+                    candidate = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+                    if fits(candidate) and self.length(candidate, pairs, to_bin) < self.length(route, pairs, to_bin):
+                        route = candidate
+                        improved = True
+
+        self.tours += 1
+        self.cells += len(route) - 1
+        self.seconds += time.perf_counter() - clock
+        return route[1:]
@@ -0,0 +1,85 @@
+# Ejecución sin visualización de varias simulaciones en paralelo.
+# Cada trabajo es una combinación (archivo de input, número de robots, semilla) y se
+# corre en un proceso distinto; al final se juntan los resultados en una tabla.
+#
+# Uso (desde la carpeta Python):
+#   python batch.py --inputs inputs/input1.txt inputs/input2.txt --robots 3 5 8 --seeds 0 1 2
+#   python batch.py --inputs inputs/input3.txt --robots 5 --seeds 0 1 --csv outputs/sweep.csv
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cleaningRobots import GameBoard
+from gridlayer import GridLayer
+
+# Límite de pasos por simulación, para que un mapa sin solución no bloquee el barrido
+MAX_STEPS = 5000
+
+RESULT_FIELDS = ['input', 'robots', 'seed', 'step_exploration_done', 'total_steps', 'finished', 'seconds']
+
+
+# Corre una simulación completa sin visualización y regresa sus métricas
+def run_job(job):
+    input_path, robots, seed = job[:3]
+    max_steps = job[3] if len(job) > 3 else MAX_STEPS
+
+    gameboard = GridLayer.from_file(input_path)
+    start = time.perf_counter()
+
+    model = GameBoard(gameboard.width, gameboard.height, gameboard, robots, collect_data=False, seed=seed)
+    while model.simulation_continue and model.current_step < max_steps:
+        model.step()
+
+    return {
+        'input': os.path.basename(input_path),
+        'robots': robots,
+        'seed': seed,
+        'step_exploration_done': model.step_exploration_done,
+        'total_steps': model.current_step,
+        'finished': not model.simulation_continue,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+# Corre todos los trabajos en un pool de procesos. Los resultados conservan el orden de 'jobs'.
+def run_sweep(jobs, workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_job, jobs))
+
+
+def make_jobs(inputs, robots, seeds, max_steps=MAX_STEPS):
+    return [(input_path, robot_count, seed, max_steps)
+            for input_path, robot_count, seed in itertools.product(inputs, robots, seeds)]
+
+
+def print_table(results):
+    widths = {field: max(len(field), *(len(str(row[field])) for row in results)) for field in RESULT_FIELDS}
+    print("  ".join(field.rjust(widths[field]) for field in RESULT_FIELDS))
+    for row in results:
+        print("  ".join(str(row[field]).rjust(widths[field]) for field in RESULT_FIELDS))
+
+
+def write_csv(results, path):
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Barrido de simulaciones sin visualización")
+    parser.add_argument('--inputs', nargs='+', default=['./inputs/input1.txt'])
+    parser.add_argument('--robots', nargs='+', type=int, default=[5])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-steps', type=int, default=MAX_STEPS)
+    parser.add_argument('--csv', default=None, help="archivo donde guardar la tabla de resultados")
+    args = parser.parse_args()
+
+    results = run_sweep(make_jobs(args.inputs, args.robots, args.seeds, args.max_steps), args.workers)
+    print_table(results)
+    if args.csv:
+        write_csv(results, args.csv)
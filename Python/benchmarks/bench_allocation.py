@@ -0,0 +1,63 @@
+# Compara los dos modos de allocation de GameBoard: "greedy" (cada robot toma la basura más
+# cercana cuando se queda sin celda) contra "assignment" (asignación de toda la flota por
+# distancia de recorrido). Reporta los pasos de limpieza (pasos totales menos los de
+# exploración), el tiempo de cada simulación y, para "assignment", cuántas asignaciones se
+# resolvieron, cuántas veces un robot cedió su celda y el tiempo de CPU del asignador.
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/bench_allocation.py [robots] [semillas]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cleaningRobots import GameBoard
+from gridlayer import GridLayer
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['input1.txt', 'input2.txt', 'input3.txt', 'input4.txt', 'input5.txt', 'final-test.txt']
+MAX_STEPS = 8000
+
+
+def run(filename, robots, seed, allocation):
+    gameboard = GridLayer.from_file(os.path.join(INPUTS_DIR, filename))
+    start = time.perf_counter()
+
+    model = GameBoard(gameboard.width, gameboard.height, gameboard, robots,
+                      allocation=allocation, collect_data=False, seed=seed)
+    while model.simulation_continue and model.current_step < MAX_STEPS:
+        model.step()
+
+    cleaning = model.current_step - model.step_exploration_done if model.step_exploration_done else 0
+    return model, cleaning, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    robots = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    seeds = range(1, int(sys.argv[2]) + 1) if len(sys.argv) > 2 else [1]
+
+    for filename in MAPS:
+        greedy_total = assignment_total = 0
+        greedy_time = assignment_time = allocator_time = 0.0
+        solves = reassigned = unfinished = 0
+
+        for seed in seeds:
+            greedy, greedy_steps, seconds = run(filename, robots, seed, "greedy")
+            greedy_total += greedy_steps
+            greedy_time += seconds
+
+            assignment, assignment_steps, seconds = run(filename, robots, seed, "assignment")
+            assignment_total += assignment_steps
+            assignment_time += seconds
+            allocator_time += assignment.allocator.seconds
+            solves += assignment.allocator.solves
+            reassigned += assignment.allocator.reassigned
+            unfinished += greedy.simulation_continue + assignment.simulation_continue
+
+        saved = greedy_total - assignment_total
+        note = f" ({unfinished} corridas llegaron a {MAX_STEPS} pasos)" if unfinished else ""
+        print(f"{filename:>15} | greedy {greedy_total:6} pasos {greedy_time:6.2f} s | "
+              f"assignment {assignment_total:6} pasos {assignment_time:6.2f} s | "
+              f"ahorro {saved:5} pasos ({100 * saved / max(greedy_total, 1):5.1f} %) | "
+              f"asignador {allocator_time:5.2f} s, {solves} asignaciones, {reassigned} cedidas{note}")
@@ -0,0 +1,110 @@
+# Micro-benchmark del BFS: compara la versión original (cola en lista con el camino
+# completo en cada entrada, sobre el grafo de diccionario) contra el Pathfinder con
+# arreglos de padres sobre el OccupancyGraph.
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/bench_bfs.py [pares_por_mapa]
+import os
+import random as rd
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from gridlayer import FREE, ROBOT, GridLayer
+from pathfinding import NEIGHBOR_OFFSETS, OccupancyGraph, Pathfinder
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['input1.txt', 'input2.txt', 'input3.txt', 'input4.txt', 'input5.txt', 'final-test.txt']
+
+
+# Construcción original del grafo (GameBoard.updateMapToGraph), se reconstruía en cada movimiento
+def legacy_graph(matrix):
+    graph = {}
+    for i in range(len(matrix)):
+        for j in range(len(matrix[i])):
+            connections = []
+            if matrix[i][j] != 'X':
+                for di, dj in NEIGHBOR_OFFSETS:
+                    new_i, new_j = i + di, j + dj
+                    if (0 <= new_i < len(matrix) and
+                        0 <= new_j < len(matrix[i]) and
+                        matrix[new_i][new_j] not in ('X', 'S')):
+                        connections.append((new_i, new_j))
+            graph[(i, j)] = connections
+    return graph
+
+
+# BFS original de GameBoard, se conserva aquí solo como referencia para comparar
+def legacy_bfs(grafo, inicio, objetivo):
+    visitados = set()
+    cola = [(inicio, [inicio])]
+
+    while cola:
+        (nodo_actual, camino) = cola.pop(0)
+
+        if nodo_actual == objetivo:
+            return camino
+
+        if nodo_actual not in visitados:
+            visitados.add(nodo_actual)
+
+            for vecino in grafo[nodo_actual]:
+                nuevo_camino = list(camino)
+                nuevo_camino.append(vecino)
+                cola.append((vecino, nuevo_camino))
+    return None
+
+
+# El mapa se lee como lo conocerían los robots al terminar de explorar: solo importan los muros
+def load_matrix(filename):
+    with open(os.path.join(INPUTS_DIR, filename)) as file:
+        gameboard = [line.split() for line in file.read().splitlines() if line][1:]
+    return [['X' if cell == 'X' else '0' for cell in row] for row in gameboard]
+
+
+def bench_map(filename, pairs):
+    matrix = load_matrix(filename)
+    width, height = len(matrix), len(matrix[0])
+    graph = legacy_graph(matrix)
+    occupancy = OccupancyGraph.from_layer(GridLayer.from_codes(matrix))
+    free = [(x, y) for x in range(width) for y in range(height) if matrix[x][y] != 'X']
+
+    random = rd.Random(2008)
+    queries = [(random.choice(free), random.choice(free)) for _ in range(pairs)]
+
+    start = time.perf_counter()
+    legacy_paths = [legacy_bfs(graph, a, b) for a, b in queries]
+    legacy_time = time.perf_counter() - start
+
+    pathfinder = Pathfinder(width, height)
+    start = time.perf_counter()
+    new_paths = [pathfinder.bfs(occupancy, a, b) for a, b in queries]
+    new_time = time.perf_counter() - start
+
+    if legacy_paths != new_paths:
+        raise AssertionError(f"{filename}: los caminos del Pathfinder no coinciden con el BFS original")
+
+    print(f"{filename:>15} {width}x{height:<4} {pairs} búsquedas | "
+          f"original {legacy_time * 1000:9.1f} ms | nuevo {new_time * 1000:8.1f} ms | "
+          f"x{legacy_time / new_time:.1f}")
+
+    # Costo de mantener el grafo: reconstruirlo completo contra actualizar una celda
+    start = time.perf_counter()
+    legacy_graph(matrix)
+    rebuild_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for cell in free:
+        occupancy.set_cell(cell, ROBOT)
+        occupancy.set_cell(cell, FREE)
+    patch_time = (time.perf_counter() - start) / (2 * len(free))
+
+    print(f"{'':>15} grafo: reconstrucción {rebuild_time * 1000:8.2f} ms | "
+          f"actualizar una celda {patch_time * 1e6:6.2f} us")
+
+
+if __name__ == '__main__':
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for filename in MAPS:
+        bench_map(filename, pairs)
@@ -0,0 +1,66 @@
+# Compara el routing "bfs" contra "cooperative" (tabla de reservaciones espacio-tiempo) en
+# los mapas grandes con varios tamaños de flota. Reporta los pasos totales, el paso en el que
+# terminó la exploración y el tiempo que se pasó planeando caminos (bfs, reparaciones, campo
+# de la papelera y búsquedas en la tabla de reservaciones).
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/bench_reservations.py [semilla] [pasos_máximos] [robots ...]
+#   python benchmarks/bench_reservations.py 1 8000 3 5 8 12
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cleaningRobots import GameBoard, load_gameboard
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['input3.txt', 'final-test.txt']
+ROBOTS = [3, 5, 8, 12]
+MAX_STEPS = 8000
+
+
+# Envuelve un método del modelo para acumular el tiempo que tarda en 'timer'
+def timed(method, timer):
+    def wrapper(*args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            timer[0] += time.perf_counter() - start
+    return wrapper
+
+
+def run(filename, robots, seed, routing, max_steps):
+    gameboard = load_gameboard(os.path.join(INPUTS_DIR, filename))
+    timer = [0.0]
+    start = time.perf_counter()
+
+    model = GameBoard(len(gameboard), len(gameboard[0]), gameboard, robots,
+                      routing=routing, collect_data=False, seed=seed)
+    for name in ('planPath', 'reservedStep', 'paperBinField'):
+        setattr(model, name, timed(getattr(model, name), timer))
+    while model.simulation_continue and model.current_step < max_steps:
+        model.step()
+
+    return (model.step_exploration_done, model.current_step, not model.simulation_continue,
+            timer[0], time.perf_counter() - start)
+
+
+def report(routing, result):
+    explored, steps, finished, planner, total = result
+    status = "terminó" if finished else "no terminó"
+    print(f"{'':>15} {routing:>11}: exploración {explored:5} | pasos {steps:5} {status:>10} | "
+          f"planeación {planner:6.2f} s | total {total:6.2f} s")
+
+
+if __name__ == '__main__':
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    max_steps = int(sys.argv[2]) if len(sys.argv) > 2 else MAX_STEPS
+    fleet_sizes = [int(arg) for arg in sys.argv[3:]] or ROBOTS
+
+    for filename in MAPS:
+        for robots in fleet_sizes:
+            print(f"{filename:>15} con {robots} robots")
+            for routing in ("bfs", "cooperative"):
+                report(routing, run(filename, robots, seed, routing, max_steps))
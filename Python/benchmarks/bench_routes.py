@@ -0,0 +1,41 @@
+# Compara los dos modos de routing de GameBoard: "bfs" (búsqueda completa en cada paso)
+# contra "reuse" (cada robot conserva su ruta y la repara). Reporta pasos, búsquedas
+# hechas por el Pathfinder y tiempo de cada simulación.
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/bench_routes.py [robots] [semilla]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cleaningRobots import GameBoard, load_gameboard
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['input1.txt', 'input2.txt', 'input3.txt', 'input4.txt', 'input5.txt', 'final-test.txt']
+MAX_STEPS = 5000
+
+
+def run(filename, robots, seed, routing):
+    gameboard = load_gameboard(os.path.join(INPUTS_DIR, filename))
+    start = time.perf_counter()
+
+    model = GameBoard(len(gameboard), len(gameboard[0]), gameboard, robots,
+                      routing=routing, collect_data=False, seed=seed)
+    while model.simulation_continue and model.current_step < MAX_STEPS:
+        model.step()
+
+    # search_id cuenta las búsquedas (bfs y nearest) que hizo el Pathfinder
+    return model.current_step, model.pathfinder.search_id, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    robots = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    for filename in MAPS:
+        bfs_steps, bfs_searches, bfs_time = run(filename, robots, seed, "bfs")
+        reuse_steps, reuse_searches, reuse_time = run(filename, robots, seed, "reuse")
+        print(f"{filename:>15} | bfs {bfs_steps:5} pasos {bfs_searches:6} búsquedas {bfs_time:6.2f} s | "
+              f"reuse {reuse_steps:5} pasos {reuse_searches:6} búsquedas {reuse_time:6.2f} s")
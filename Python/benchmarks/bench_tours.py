@@ -0,0 +1,96 @@
+# Compara allocation "greedy" (una celda con basura a la vez) contra "tour" (recorridos que
+# llenan la capacidad del robot, ver allocation.TourPlanner) en la fase de limpieza.
+#
+# Cada corrida explora el mapa con las opciones por defecto, guarda un checkpoint al terminar la
+# exploración y desde él limpia con cada modo (mismo mapa conocido, mismas posiciones y misma
+# secuencia aleatoria). Las semillas cuya exploración no termina en EXPLORE_STEPS pasos se
+# omiten. Reporta los pasos de limpieza, los viajes a la papelera, cuántas veces se eligió
+# objetivo (celdas en "greedy", recorridos en "tour"), las búsquedas de camino del Pathfinder y
+# el tiempo del planeador de recorridos.
+#
+# allocation "tour" es experimental: en los mapas incluidos elige menos objetivos pero no ahorra
+# pasos de limpieza ni viajes a la papelera (ver el README).
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/bench_tours.py [robots] [semillas] [mapas...]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from checkpoint import restore, snapshot
+from cleaningRobots import GameBoard
+from gridlayer import GridLayer
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['final-test.txt']
+EXPLORE_STEPS = 4000
+MAX_STEPS = 30000
+
+counts = {'trips': 0, 'targets': 0}
+
+
+def counted(key, method):
+    def wrapper(*args, **kwargs):
+        counts[key] += 1
+        return method(*args, **kwargs)
+    return wrapper
+
+
+# Checkpoint al terminar la exploración, o None si no termina en EXPLORE_STEPS pasos
+def explored(filename, robots, seed):
+    gameboard = GridLayer.from_file(os.path.join(INPUTS_DIR, filename))
+    model = GameBoard(gameboard.width, gameboard.height, gameboard, robots, collect_data=False, seed=seed)
+    while model.exploredCellsCount != model.cellsCount and model.current_step < EXPLORE_STEPS:
+        model.step()
+    return snapshot(model) if model.exploredCellsCount == model.cellsCount else None
+
+
+def clean(state, allocation):
+    model = restore(state, allocation=allocation)
+    # Cada vez que un robot vacía su carga es un viaje a la papelera
+    for robot in model.schedule.agents:
+        robot.disposePaperBin = counted('trips', robot.disposePaperBin)
+    # En "greedy" se cuenta cada celda elegida y en "tour" cada recorrido planeado
+    if allocation == "tour":
+        model.tourPlanner.plan = counted('targets', model.tourPlanner.plan)
+    else:
+        model.nearestTarget = counted('targets', model.nearestTarget)
+
+    counts.update(trips=0, targets=0)
+    start_step = model.current_step
+    start = time.perf_counter()
+    while model.simulation_continue and model.current_step - start_step < MAX_STEPS:
+        model.step()
+
+    return {
+        'steps': model.current_step - start_step,
+        'finished': not model.simulation_continue,
+        'trips': counts['trips'],
+        'targets': counts['targets'],
+        'searches': model.pathfinder.search_id,
+        'planner': model.tourPlanner.seconds,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+if __name__ == '__main__':
+    robots = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    seeds = range(1, int(sys.argv[2]) + 1) if len(sys.argv) > 2 else range(1, 5)
+    maps = sys.argv[3:] or MAPS
+
+    for filename in maps:
+        for seed in seeds:
+            state = explored(filename, robots, seed)
+            if state is None:
+                print(f"{filename:>15} semilla {seed}: la exploración no terminó en {EXPLORE_STEPS} pasos")
+                continue
+
+            for allocation in ("greedy", "tour"):
+                result = clean(state, allocation)
+                note = "" if result['finished'] else f" (sin terminar en {MAX_STEPS} pasos)"
+                print(f"{filename:>15} semilla {seed} {allocation:>6} | {result['steps']:5} pasos de limpieza | "
+                      f"{result['trips']:4} viajes a la papelera | {result['targets']:5} objetivos elegidos | "
+                      f"{result['searches']:6} búsquedas | planeador {result['planner']:5.2f} s | "
+                      f"total {result['seconds']:6.2f} s{note}")
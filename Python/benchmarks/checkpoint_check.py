@@ -0,0 +1,74 @@
+# Verifica que un checkpoint reanuda la simulación exactamente: corre cada mapa hasta la mitad,
+# toma un checkpoint, sigue hasta el final y compara contra la corrida restaurada desde el
+# checkpoint (posición y carga de cada robot en cada paso), con cada ruteo y cada asignación.
+# También mide cuánto tarda guardar y restaurar contra repetir la simulación desde el paso 0.
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/checkpoint_check.py [robots] [semilla] [pasos_máximos]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from checkpoint import restore, snapshot
+from cleaningRobots import GameBoard, load_gameboard
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['input1.txt', 'input2.txt', 'input3.txt', 'input5.txt', 'final-test.txt']
+# Opciones del modelo de cada corrida: los ruteos y las asignaciones que guardan estado propio
+CASES = [{"routing": "bfs"}, {"routing": "reuse"}, {"routing": "cooperative"},
+         {"allocation": "assignment"}, {"allocation": "tour"}]
+
+
+def robots_state(model):
+    return [(agent.unique_id, agent.pos, agent.load, agent.state)
+            for agent in sorted(model.schedule.agents, key=lambda agent: agent.unique_id)]
+
+
+def trace(model, max_steps):
+    states = []
+    while model.simulation_continue and model.current_step < max_steps:
+        model.step()
+        states.append(robots_state(model))
+    return states, model.current_step, int(model.cellLitter.sum())
+
+
+if __name__ == '__main__':
+    robots = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    max_steps = int(sys.argv[3]) if len(sys.argv) > 3 else 3000
+
+    ok = True
+    for filename in MAPS:
+        gameboard = load_gameboard(os.path.join(INPUTS_DIR, filename))
+        for options in CASES:
+            model = GameBoard(len(gameboard), len(gameboard[0]), gameboard, robots,
+                              **options, collect_data=False, seed=seed)
+            full = trace(model, max_steps)
+            middle = full[1] // 2
+
+            start = time.perf_counter()
+            model = GameBoard(len(gameboard), len(gameboard[0]), gameboard, robots,
+                              **options, collect_data=False, seed=seed)
+            trace(model, middle)
+            replay_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            data = snapshot(model)
+            save_time = time.perf_counter() - start
+            start = time.perf_counter()
+            resumed = restore(data)
+            restore_time = time.perf_counter() - start
+
+            rest = trace(resumed, max_steps)
+            same = full[0][middle:] == rest[0] and full[1:] == rest[1:]
+            ok &= same
+            label = " ".join(options.values())
+            print(f"{filename:>15} {label:>11}: checkpoint en el paso {middle:5} de {full[1]:5} | "
+                  f"{len(data) / 1024:7.1f} KB | guardar {1000 * save_time:6.1f} ms | "
+                  f"restaurar {1000 * restore_time:6.1f} ms | repetir {1000 * replay_time:8.1f} ms | "
+                  + ("igual" if same else "DIFERENTE"))
+
+    if not ok:
+        sys.exit("Alguna corrida restaurada no siguió los mismos pasos")
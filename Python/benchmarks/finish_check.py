@@ -0,0 +1,74 @@
+# Verifica que las simulaciones terminen: corre cada caso con muchas semillas y falla si alguna
+# corrida llega a MAX_STEPS sin terminar o termina con basura en el piso. Sirve para detectar
+# robots que se quedan bloqueados para siempre (por ejemplo, uno dormido sobre la celda que otro
+# necesita, o uno ya terminado al que la asignación le da una celda que nunca va a recoger).
+#
+# Con exploration "nearest", input1.txt se atora explorando en algunas semillas desde la versión
+# original del modelo, así que ese caso no está en la lista.
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/finish_check.py [semillas]
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cleaningRobots import GameBoard
+from gridlayer import GridLayer
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+ROBOTS = 5
+SEEDS = 60
+MAX_STEPS = 3000
+
+# (mapa, opciones del modelo)
+CASES = [
+    ('input2.txt', {}),
+    ('input2.txt', {'exploration': "frontier"}),
+    ('input2.txt', {'routing': "reuse"}),
+    ('input2.txt', {'routing': "cooperative"}),
+    ('input1.txt', {'exploration': "frontier"}),
+    ('input2.txt', {'allocation': "assignment"}),
+    ('input2.txt', {'allocation': "tour"}),
+]
+
+
+def run(gameboard, seed, options):
+    model = GameBoard(gameboard.width, gameboard.height, gameboard, ROBOTS,
+                      collect_data=False, seed=seed, **options)
+    while model.simulation_continue and model.current_step < MAX_STEPS:
+        model.step()
+    return model
+
+
+def main():
+    seeds = int(sys.argv[1]) if len(sys.argv) > 1 else SEEDS
+    problems = []
+
+    for filename, options in CASES:
+        gameboard = GridLayer.from_file(os.path.join(INPUTS_DIR, filename))
+        stalled = []
+        litter_left = []
+        for seed in range(seeds):
+            model = run(gameboard, seed, options)
+            if model.simulation_continue:
+                stalled.append(seed)
+            elif model.cellLitter.any():
+                litter_left.append(seed)
+
+        label = f"{filename} {options or ''}"
+        status = "ok"
+        if stalled:
+            problems.append(f"{label}: sin terminar en {MAX_STEPS} pasos con las semillas {stalled}")
+            status = f"{len(stalled)} sin terminar"
+        if litter_left:
+            problems.append(f"{label}: terminó con basura con las semillas {litter_left}")
+            status = f"{len(litter_left)} con basura" if status == "ok" else status + f", {len(litter_left)} con basura"
+        print(f"{label:>50}: {seeds} semillas | {status}")
+
+    if problems:
+        sys.exit("\n".join(problems))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+# Compara el motor vectorizado (fleet.py) contra el modelo de Mesa en los inputs incluidos.
+# Los dos motores no siguen exactamente los mismos pasos (uno activa a los robots uno por
+# uno y el otro resuelve a toda la flota a la vez; fleet sigue campos de distancias
+# compartidos, así que el modelo de Mesa se corre con exploration="frontier"), así que se
+# revisan las reglas en cada paso y se compara el resultado de la corrida:
+#   - en cada motor: nunca hay dos robots en la misma celda (salvo la celda inicial) ni un robot
+#     en un muro, ningún robot carga más de CAPACITY basuras y la basura no aparece ni desaparece
+#   - entre los dos: los dos terminan (o ninguno), recogen la misma basura, hacen el mismo número
+#     de viajes a la papelera y tardan lo mismo en explorar y en terminar, con las tolerancias
+#     de TOLERANCES. Con más de COMPARE_MAX_ROBOTS robots las diferencias solo se reportan
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/fleet_parity.py [robots] [semilla] [pasos_máximos]
+#   python benchmarks/fleet_parity.py 100 1 3000    (solo el motor vectorizado, con la flota grande)
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cleaningRobots import GameBoard, load_gameboard
+from fleet import CAPACITY, FleetEngine
+from gridlayer import WALL
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['input1.txt', 'input2.txt', 'input3.txt', 'input4.txt', 'input5.txt', 'final-test.txt']
+
+# Con más robots que esto solo se corre el motor vectorizado
+MESA_MAX_ROBOTS = 20
+# Con más robots que esto las diferencias entre los motores no hacen fallar la revisión: mientras
+# más robots siguen el mismo campo en fleet, más se separan los pasos y los viajes de GameBoard
+COMPARE_MAX_ROBOTS = 5
+
+# Diferencia permitida entre los dos motores: (relativa, absoluta); vale la mayor de las dos.
+# En GameBoard cada robot toma su propia celda objetivo y ve lo que ya movieron los robots
+# activados antes que él; en fleet todos siguen el mismo campo, así que en los mapas chicos
+# varios robots van a la misma celda y tardan unas decenas de pasos más
+TOLERANCES = {
+    'explored': (0.3, 15),
+    'steps': (0.15, 50),
+    'trips': (0.05, 5),
+}
+
+# Envuelve disposePaperBin de un robot (solo esa instancia) para sumar en 'delivered' la basura
+# que vacía y los viajes a la papelera
+def count_deliveries(robot, delivered):
+    dispose = robot.disposePaperBin
+
+    def wrapper():
+        if robot.load:
+            delivered['litter'] += robot.load
+            delivered['trips'] += 1
+        return dispose()
+    robot.disposePaperBin = wrapper
+
+
+# Reglas del modelo de Mesa en el paso actual
+def check_mesa(model, start, initial_litter, delivered):
+    problems = []
+    robots = [agent for agent in model.schedule.agents if agent.type == 1]
+
+    shared = model.cellRobots > 1
+    shared[start] = False
+    if shared.any():
+        problems.append("dos robots en la misma celda")
+    if any(model.cellKind[robot.pos] == WALL for robot in robots):
+        problems.append("un robot sobre un muro")
+    loads = [robot.load for robot in robots]
+    if max(loads) > CAPACITY or min(loads) < 0:
+        problems.append("carga fuera de rango")
+    if int(model.cellLitter.sum()) + sum(loads) + delivered['litter'] != initial_litter:
+        problems.append("la basura no se conserva")
+    return problems
+
+
+def run_mesa(gameboard, robots, seed, max_steps):
+    start = time.perf_counter()
+    problems = set()
+
+    model = GameBoard(len(gameboard), len(gameboard[0]), gameboard, robots,
+                      exploration="frontier", collect_data=False, seed=seed)
+    # Basura vaciada y viajes a la papelera
+    delivered = {'litter': 0, 'trips': 0}
+    for robot in (agent for agent in model.schedule.agents if agent.type == 1):
+        count_deliveries(robot, delivered)
+    start_cell = tuple(np.argwhere(np.array(gameboard) == 'S')[0])
+    initial_litter = int(model.cellLitter.sum())
+    while model.simulation_continue and model.current_step < max_steps:
+        model.step()
+        problems.update(check_mesa(model, start_cell, initial_litter, delivered))
+
+    finished = not model.simulation_continue
+    remaining = int(model.cellLitter.sum()) + sum(agent.load for agent in model.schedule.agents)
+    if finished and remaining:
+        problems.add("terminó con basura pendiente")
+    return {'explored': model.step_exploration_done, 'steps': model.current_step, 'finished': finished,
+            'collected': delivered['litter'], 'trips': delivered['trips'],
+            'seconds': time.perf_counter() - start, 'problems': problems}
+
+
+def run_fleet(gameboard, robots, seed, max_steps):
+    start = time.perf_counter()
+    problems = set()
+
+    engine = FleetEngine(gameboard, robots, seed=seed)
+    while not engine.finished and engine.current_step < max_steps:
+        engine.step()
+        problems.update(engine.check())
+
+    if engine.finished and (engine.litter.any() or engine.load.any()):
+        problems.add("terminó con basura pendiente")
+    return {'explored': engine.step_exploration_done, 'steps': engine.current_step, 'finished': engine.finished,
+            'collected': engine.delivered, 'trips': engine.trips,
+            'seconds': time.perf_counter() - start, 'problems': problems}
+
+
+# Diferencias entre los resultados de los dos motores que pasan de las tolerancias
+def compare(mesa, fleet):
+    problems = []
+    if mesa['finished'] != fleet['finished']:
+        problems.append("solo uno de los motores terminó")
+    elif mesa['finished'] and mesa['collected'] != fleet['collected']:
+        problems.append(f"basura recogida {mesa['collected']} contra {fleet['collected']}")
+
+    # Sin terminar, los pasos y los viajes dependen de dónde se cortó la corrida
+    names = TOLERANCES if mesa['finished'] and fleet['finished'] else ['explored']
+    for name in names:
+        relative, absolute = TOLERANCES[name]
+        allowed = max(relative * max(mesa[name], fleet[name]), absolute)
+        if abs(mesa[name] - fleet[name]) > allowed:
+            problems.append(f"{name} {mesa[name]} contra {fleet[name]} (tolerancia {allowed:.0f})")
+    return problems
+
+
+def report(name, result):
+    status = "terminó" if result['finished'] else "no terminó"
+    print(f"{'':>15} {name:>5}: exploración {result['explored']:5} | pasos {result['steps']:5} {status:>10} | "
+          f"recogida {result['collected']:5} | viajes {result['trips']:4} | {result['seconds']:6.2f} s"
+          + (f" | PROBLEMAS: {', '.join(sorted(result['problems']))}" if result['problems'] else ""))
+    return not result['problems']
+
+
+if __name__ == '__main__':
+    robots = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    max_steps = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+
+    ok = True
+    for filename in MAPS:
+        gameboard = load_gameboard(os.path.join(INPUTS_DIR, filename))
+        print(f"{filename:>15} con {robots} robots")
+        fleet = run_fleet(gameboard, robots, seed, max_steps)
+        if robots <= MESA_MAX_ROBOTS:
+            mesa = run_mesa(gameboard, robots, seed, max_steps)
+            ok &= report("mesa", mesa)
+            ok &= report("fleet", fleet)
+            differences = compare(mesa, fleet)
+            if differences:
+                print(f"{'':>15} DIFERENCIAS: {', '.join(differences)}")
+                ok &= robots > COMPARE_MAX_ROBOTS
+        else:
+            ok &= report("fleet", fleet)
+
+    if not ok:
+        sys.exit("Alguna regla no se cumplió o los motores no coinciden")
@@ -0,0 +1,44 @@
+# Corre una simulación con GameBoard(..., profile=True) e imprime el tiempo de cada fase del
+# paso y los contadores de búsqueda. Con --out se guarda el perfil de cada paso en CSV, JSON
+# o en formato "folded" (para flamegraph.pl o speedscope), según la extensión.
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/profile_run.py inputs/input5.txt --robots 5 --out outputs/perfil.csv
+#   python benchmarks/profile_run.py inputs/input3.txt --routing cooperative --out outputs/perfil.folded
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cleaningRobots import GameBoard
+from gridlayer import GridLayer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perfil por fases de una simulación")
+    parser.add_argument('input', help="archivo de entrada con el mapa")
+    parser.add_argument('--robots', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--max-steps', type=int, default=5000)
+    parser.add_argument('--exploration', default="nearest")
+    parser.add_argument('--routing', default="bfs")
+    parser.add_argument('--collect', action='store_true', help="guardar también los cuadros de cada paso")
+    parser.add_argument('--out', nargs='*', default=[], help="archivos .csv, .json o .folded")
+    args = parser.parse_args()
+
+    gameboard = GridLayer.from_file(args.input)
+    model = GameBoard(gameboard.width, gameboard.height, gameboard, args.robots,
+                      exploration=args.exploration, routing=args.routing,
+                      collect_data=args.collect, seed=args.seed, profile=True)
+    while model.simulation_continue and model.current_step < args.max_steps:
+        model.step()
+
+    print(model.profiler.summary())
+    for path in args.out:
+        model.profiler.save(path)
+        print(f"Perfil guardado en {path}")
+
+
+if __name__ == '__main__':
+    main()
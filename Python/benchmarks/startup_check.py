@@ -0,0 +1,94 @@
+# Verifica el tiempo de arranque de los puntos de entrada. Cada módulo se importa en un
+# proceso nuevo y se mide el tiempo total de la importación (incluidos NumPy y Mesa). Se revisa:
+#   - que entre los módulos que carga no haya ninguno de los prohibidos: la visualización y los
+#     servidores se cargan solo desde sus propios puntos de entrada
+#   - que el tiempo propio del módulo no pase de TARGET_MS
+#
+# Costo de Mesa: el núcleo importa mesa.agent, mesa.model, mesa.space y mesa.time, pero importar
+# cualquier módulo de Mesa ejecuta el __init__ del paquete, que carga su visualización (tornado),
+# el batchrunner y el DataCollector (pandas), y mesa.space importa networkx. Eso no depende de
+# este repositorio, así que se mide aparte importando solo Mesa ("mesa") y se reporta en cada
+# punto de entrada que lo usa: su tiempo propio es el total menos el de Mesa, y los módulos que
+# carga Mesa por su cuenta no cuentan como prohibidos. Los que no usan Mesa (fleet y el
+# servidor de repeticiones) no pueden cargar ninguno de ellos.
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/startup_check.py [objetivo_ms]
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+PATHS = [os.path.join(ROOT, 'Python'), os.path.join(ROOT, 'Server')]
+
+TARGET_MS = 150
+RUNS = 5
+
+HEAVY = ['matplotlib', 'PIL', 'render', 'pandas', 'tornado', 'networkx', 'mesa.visualization']
+
+# Módulos de Mesa que importa el núcleo de la simulación
+MESA = ['mesa.agent', 'mesa.model', 'mesa.space', 'mesa.time']
+
+# (módulo, módulos prohibidos)
+ENTRY_POINTS = [
+    ('cleaningRobots', HEAVY + ['http.server', 'asyncio']),
+    ('checkpoint', HEAVY + ['http.server', 'asyncio']),
+    ('batch', HEAVY + ['http.server', 'asyncio']),
+    ('fleet', HEAVY + ['mesa', 'http.server', 'asyncio']),
+    ('stream_server', HEAVY + ['http.server']),
+    ('tc2008B_server', HEAVY + ['mesa', 'cleaningRobots']),
+]
+
+SNIPPET = """
+import json, sys, time
+sys.path[:0] = {paths!r}
+before = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def measure(modules):
+    code = SNIPPET.format(paths=PATHS, modules=modules)
+    runs = [json.loads(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                      check=True).stdout) for _ in range(RUNS)]
+    return statistics.median(run['seconds'] for run in runs), set(runs[0]['modules'])
+
+
+def main():
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else TARGET_MS
+    problems = []
+
+    mesa_seconds, mesa_modules = measure(MESA)
+    print(f"{'mesa':>15}: total {1000 * mesa_seconds:6.1f} ms | {len(mesa_modules):4} módulos | "
+          f"carga {', '.join(name for name in HEAVY if name in mesa_modules)}")
+
+    for module, forbidden in ENTRY_POINTS:
+        seconds, modules = measure([module])
+        uses_mesa = 'mesa' in modules
+        own = modules - mesa_modules if uses_mesa else modules
+        own_seconds = max(seconds - mesa_seconds, 0.0) if uses_mesa else seconds
+        loaded = [name for name in forbidden
+                  if any(loaded == name or loaded.startswith(name + '.') for loaded in own)]
+
+        status = "ok"
+        if loaded:
+            problems.append(f"{module} carga {', '.join(loaded)}")
+            status = "CARGA " + ", ".join(loaded)
+        if 1000 * own_seconds > target_ms:
+            problems.append(f"{module} tarda {1000 * own_seconds:.0f} ms sin contar Mesa (objetivo {target_ms:.0f} ms)")
+            status = "LENTO" if status == "ok" else status + ", LENTO"
+
+        print(f"{module:>15}: total {1000 * seconds:6.1f} ms | propio {1000 * own_seconds:6.1f} ms"
+              f"{' (sin Mesa)' if uses_mesa else '           '} | {len(own):4} módulos propios | {status}")
+
+    if problems:
+        sys.exit("\n".join(problems))
+
+
+if __name__ == '__main__':
+    main()
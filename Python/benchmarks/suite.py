@@ -0,0 +1,178 @@
+# Suite de rendimiento de GameBoard sobre los mapas incluidos y sobre pisos sintéticos (mapgen)
+# de 100x100 hasta 1000x1000. Cada caso corre sin visualización, con semilla fija, en un proceso
+# nuevo (para medir la memoria máxima de ese caso) y uno a la vez (para que los tiempos no
+# compitan por el CPU). Por caso se reporta:
+#   - pasos simulados, pasos por segundo y si la simulación terminó
+#   - memoria máxima del proceso (MB)
+#   - tiempo en búsqueda de caminos y en actualización de los mapas de los robots (profiler)
+#   - búsquedas y nodos expandidos
+#
+# Cada caso se simula --repeats veces en su proceso y se reporta el mejor tiempo, para que una
+# interrupción del sistema no cuente como regresión.
+#
+# Los resultados se pueden guardar como línea base en JSON (--save) y comparar contra una línea
+# base anterior (--baseline): si algún caso baja sus pasos por segundo más que --threshold, el
+# script termina con error. Los casos que tardan menos de --min-seconds (en la línea base o en
+# la corrida actual) solo se reportan: en unas decenas de milisegundos el ruido de la medición
+# es del mismo tamaño que el umbral. Si cambia el número de pasos, el comportamiento de la
+# simulación cambió y se avisa (en ese caso conviene guardar una línea base nueva).
+#
+# Uso (desde la carpeta Python):
+#   python benchmarks/suite.py --save benchmarks/baseline.json
+#   python benchmarks/suite.py --baseline benchmarks/baseline.json --threshold 0.2
+#   python benchmarks/suite.py --maps input1.txt --robots 5 --sizes 100 250 500 1000
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cleaningRobots import GameBoard
+from gridlayer import GridLayer
+from mapgen import generate_map
+
+INPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'inputs')
+MAPS = ['input1.txt', 'input2.txt', 'input3.txt', 'final-test.txt']
+ROBOTS = [3, 5, 8]
+SEEDS = [1]
+MAX_STEPS = 3000
+
+# Pisos sintéticos: solo se simulan SYNTHETIC_STEPS pasos, lo que interesa es cómo escala cada paso
+SIZES = [100, 250, 500, 1000]
+SYNTHETIC_ROBOTS = 5
+SYNTHETIC_STEPS = 200
+
+THRESHOLD = 0.2
+REPEATS = 3
+# Tiempo mínimo de simulación de un caso para compararlo contra el umbral
+MIN_SECONDS = 0.1
+
+
+def case_key(case):
+    return f"{case['map']}:{case['robots']}:{case['seed']}"
+
+
+def simulate(gameboard, case):
+    start = time.perf_counter()
+    model = GameBoard(gameboard.width, gameboard.height, gameboard, case['robots'],
+                      collect_data=False, seed=case['seed'], profile=True)
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while model.simulation_continue and model.current_step < case['max_steps']:
+        model.step()
+    return model, setup, time.perf_counter() - start
+
+
+def run_case(case):
+    if case['map'].startswith('synthetic-'):
+        size = int(case['map'].split('-')[1])
+        gameboard = GridLayer.from_codes(generate_map(size, size, seed=case['seed']))
+    else:
+        gameboard = GridLayer.from_file(os.path.join(INPUTS_DIR, case['map']))
+
+    # Con la misma semilla cada repetición simula lo mismo; se queda el mejor tiempo
+    runs = [simulate(gameboard, case) for _ in range(case.get('repeats', 1))]
+    model, setup, seconds = min(runs, key=lambda run: run[2])
+
+    totals = model.profiler.totals()
+    phases = totals['phases']
+    return dict(case,
+                steps=model.current_step,
+                finished=not model.simulation_continue,
+                setup_seconds=round(setup, 3),
+                seconds=round(seconds, 3),
+                steps_per_sec=round(model.current_step / seconds, 1),
+                # En Linux ru_maxrss está en KB
+                peak_mb=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+                pathfinding_seconds=round(sum(t for path, t in phases.items() if path.endswith('pathfinding')), 3),
+                map_update_seconds=round(sum(t for path, t in phases.items() if path.endswith('map_update')), 3),
+                searches=totals['counters'].get('searches', 0),
+                expanded=totals['counters'].get('expanded', 0))
+
+
+def make_cases(maps, robots, seeds, max_steps, sizes, repeats=REPEATS):
+    cases = [{'map': name, 'robots': count, 'seed': seed, 'max_steps': max_steps, 'repeats': repeats}
+             for name in maps for count in robots for seed in seeds]
+    cases += [{'map': f'synthetic-{size}', 'robots': SYNTHETIC_ROBOTS, 'seed': seed, 'max_steps': SYNTHETIC_STEPS,
+               'repeats': repeats}
+              for size in sizes for seed in seeds]
+    return cases
+
+
+# Un proceso nuevo por caso (max_tasks_per_child=1) para que ru_maxrss sea solo de ese caso
+def run_cases(cases, workers=1):
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+        for result in executor.map(run_case, cases):
+            report(result)
+            yield result
+
+
+def report(result):
+    status = "terminó" if result['finished'] else ""
+    print(f"{case_key(result):>24} | {result['steps']:5} pasos {status:>7} | {result['steps_per_sec']:8.1f} pasos/s | "
+          f"{result['peak_mb']:7.1f} MB | inicio {result['setup_seconds']:6.2f} s | caminos {result['pathfinding_seconds']:6.2f} s | "
+          f"mapas {result['map_update_seconds']:6.2f} s | {result['searches']:6} búsquedas", flush=True)
+
+
+# Casos que bajaron su rendimiento más que 'threshold' respecto a la línea base. Los que duran
+# menos de 'min_seconds' no cuentan
+def compare(results, baseline, threshold, min_seconds=MIN_SECONDS):
+    regressions = []
+    for result in results:
+        previous = baseline.get(case_key(result))
+        if previous is None:
+            continue
+        if previous['steps'] != result['steps']:
+            print(f"Aviso: {case_key(result)} simuló {result['steps']} pasos (antes {previous['steps']})")
+        change = result['steps_per_sec'] / previous['steps_per_sec'] - 1
+        if min(previous['seconds'], result['seconds']) < min_seconds:
+            print(f"Sin comparar {case_key(result)}: dura menos de {min_seconds} s ({100 * change:+.1f} %)")
+            continue
+        if change < -threshold:
+            regressions.append((case_key(result), previous['steps_per_sec'], result['steps_per_sec'], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de rendimiento de GameBoard")
+    parser.add_argument('--maps', nargs='*', default=MAPS)
+    parser.add_argument('--robots', nargs='+', type=int, default=ROBOTS)
+    parser.add_argument('--seeds', nargs='+', type=int, default=SEEDS)
+    parser.add_argument('--max-steps', type=int, default=MAX_STEPS)
+    parser.add_argument('--sizes', nargs='*', type=int, default=SIZES, help="lados de los pisos sintéticos")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=REPEATS, help="veces que se simula cada caso")
+    parser.add_argument('--min-seconds', type=float, default=MIN_SECONDS,
+                        help="duración mínima de un caso para compararlo contra el umbral")
+    parser.add_argument('--save', help="guardar los resultados como línea base (JSON)")
+    parser.add_argument('--baseline', help="línea base (JSON) contra la cual comparar")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="caída máxima permitida de pasos por segundo (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    cases = make_cases(args.maps, args.robots, args.seeds, args.max_steps, args.sizes, args.repeats)
+    results = list(run_cases(cases, args.workers))
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({case_key(result): result for result in results}, file, indent=1)
+        print(f"Línea base guardada en {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold, args.min_seconds)
+        for key, before, after, change in regressions:
+            print(f"REGRESIÓN {key}: {before:.1f} -> {after:.1f} pasos/s ({100 * change:+.1f} %)")
+        if regressions:
+            sys.exit(f"{len(regressions)} caso(s) bajaron más de {100 * args.threshold:.0f} %")
+        print(f"Sin regresiones mayores a {100 * args.threshold:.0f} %")
+
+
+if __name__ == '__main__':
+    main()
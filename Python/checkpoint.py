@@ -0,0 +1,248 @@
+# Checkpoints de un GameBoard en marcha: guardan todo lo que determina los pasos siguientes
+# (contenido del grid, estado de cada robot, los dos mapas de los robots y sus grafos, las
+# celdas con basura y sin explorar, el estado de la asignación y de los recorridos, el contador
+# de pasos y el estado del generador de números aleatorios) para reanudar la simulación sin
+# repetirla desde el paso 0. Desde un mismo checkpoint se pueden lanzar varias corridas "qué
+# pasaría si" con otra semilla o con otras opciones del modelo.
+#
+# El checkpoint es un archivo .npz de NumPy (bytes) con arreglos simples: los grids, los muros de
+# los grafos y la máscara de celdas sin explorar van como arreglos, y el resto (contadores,
+# robots, reservaciones, ...) como un JSON guardado en el arreglo 'meta'. Se lee con
+# allow_pickle=False, así que cargar un checkpoint no ejecuta código. VERSION cambia cada vez que
+# cambia el formato; un checkpoint de otra versión se rechaza. No incluye los cuadros ya grabados
+# por el TrajectoryRecorder: la grabación de la corrida restaurada empieza en el paso del
+# checkpoint.
+#
+#   state = snapshot(model)                   # bytes en memoria
+#   fork = restore(state, seed=7)             # misma situación, otra secuencia aleatoria
+#   save_checkpoint(model, 'outputs/paso500.ckpt')
+#   model = load_checkpoint('outputs/paso500.ckpt', routing="cooperative")
+import io
+import json
+
+import numpy as np
+
+from cleaningRobots import GameBoard
+from gridlayer import ROBOT, GridLayer
+
+VERSION = 2
+
+# Atributos de cada robot que se guardan tal cual; los de ROBOT_CELLS son una celda y los de
+# ROBOT_PATHS una lista de celdas (JSON los regresa como listas)
+ROBOT_FIELDS = ['state', 'capacity', 'load', 'queuedMovements', 'targetCell', 'targetCell_aux', 'tour',
+                'alreadyCleaned']
+ROBOT_CELLS = ['targetCell', 'targetCell_aux']
+ROBOT_PATHS = ['queuedMovements', 'tour']
+
+# Contadores y opciones del modelo que se guardan tal cual
+MODEL_FIELDS = ['simulation_continue', 'current_state', 'total_steps', 'step_exploration_done',
+                'robots_finished', 'robots_count', 'paperBin_pos', 'exploredCellsCount', 'claimedCells',
+                'litterCount']
+OPTIONS = ['exploration', 'target_metric', 'routing', 'allocation', 'collect_data']
+GRAPHS = ['internalGraph', 'posGraph', 'wallGraph']
+
+
+def cell(value):
+    return tuple(value) if value is not None else None
+
+
+def cells(values):
+    return [tuple(value) for value in values]
+
+
+def graph_state(graph, arrays, name):
+    arrays[name + '.wall'] = np.frombuffer(graph.wall, dtype=np.uint8)
+    arrays[name + '.blocked'] = np.frombuffer(graph.blocked, dtype=np.uint8)
+    return graph.version
+
+
+def set_graph_state(graph, arrays, name, version):
+    graph.wall = bytearray(arrays[name + '.wall'].tobytes())
+    graph.blocked = bytearray(arrays[name + '.blocked'].tobytes())
+    graph.version = version
+
+
+def route_state(model, route):
+    graphs = {id(model.posGraph): 'pos', id(model.internalGraph): 'internal'}
+    return route.path, route.index, route.goal, graphs.get(id(route.graph)), route.version
+
+
+def set_route_state(model, route, state):
+    path, route.index, goal, graph, route.version = state
+    route.path = cells(path) if path is not None else None
+    route.goal = cell(goal)
+    route.graph = {'pos': model.posGraph, 'internal': model.internalGraph}.get(graph)
+
+
+# NearestIndex (basura): las celdas en orden de inserción con su número
+def nearest_index_state(index):
+    return {'cells': [[x, y, seq] for (x, y), seq in index.cells.items()], 'next_seq': index.next_seq}
+
+
+def set_nearest_index_state(index, state):
+    index.cells = {}
+    index.buckets = {}
+    for x, y, seq in state['cells']:
+        index.cells[(x, y)] = seq
+        index.buckets.setdefault((x // index.bucket_size, y // index.bucket_size), {})[(x, y)] = seq
+    index.next_seq = state['next_seq']
+
+
+# DenseIndex (celdas sin explorar): la máscara, los números de inserción y el conteo por cubeta
+def dense_index_state(index, arrays, name):
+    arrays[name + '.mask'] = index.mask
+    arrays[name + '.seq'] = index.seq
+    arrays[name + '.counts'] = index.counts
+    return {'next_seq': index.next_seq, 'count': index.count}
+
+
+def set_dense_index_state(index, arrays, name, state):
+    index.mask = arrays[name + '.mask'].copy()
+    index.seq = arrays[name + '.seq'].copy()
+    index.counts = arrays[name + '.counts'].copy()
+    index.next_seq = state['next_seq']
+    index.count = state['count']
+
+
+# LitterAllocator y TourPlanner: contadores y los robots que la última asignación dejó sin celda.
+# El campo de distancias a la papelera se recalcula solo porque su llave no coincide con la del grafo.
+def allocator_state(allocator):
+    return {'solves': allocator.solves, 'seconds': allocator.seconds, 'reassigned': allocator.reassigned,
+            'last_idle': allocator.last_idle, 'idle': sorted(allocator.idle)}
+
+
+def set_allocator_state(allocator, state):
+    allocator.solves, allocator.seconds, allocator.reassigned = state['solves'], state['seconds'], state['reassigned']
+    allocator.last_idle = cell(state['last_idle'])
+    allocator.idle = set(state['idle'])
+
+
+def tour_planner_state(planner):
+    return {'tours': planner.tours, 'cells': planner.cells, 'seconds': planner.seconds}
+
+
+def set_tour_planner_state(planner, state):
+    planner.tours, planner.cells, planner.seconds = state['tours'], state['cells'], state['seconds']
+
+
+def snapshot(model):
+    robots = sorted(model.schedule.agents, key=lambda agent: agent.unique_id)
+    arrays = {
+        'cellKind': model.cellKind,
+        'cellLitter': model.cellLitter,
+        'internal_map.kind': model.robots_internal_map.kind,
+        'internal_map.litter': model.robots_internal_map.litter,
+        'pos_map.kind': model.robots_pos_map.kind,
+        'pos_map.litter': model.robots_pos_map.litter,
+    }
+    meta = {
+        'version': VERSION,
+        'width': model.grid.width,
+        'height': model.grid.height,
+        'options': {name: getattr(model, name) for name in OPTIONS},
+        'model': {name: getattr(model, name) for name in MODEL_FIELDS},
+        'current_step': model.current_step,
+        'schedule': (model.schedule.steps, model.schedule.time, sorted(model.schedule.sleeping)),
+        'random': model.random.getstate(),
+        'graphs': {name: graph_state(getattr(model, name), arrays, name) for name in GRAPHS},
+        'litterCoords': nearest_index_state(model.litterCoords),
+        'unexploredCells': dense_index_state(model.unexploredCells, arrays, 'unexploredCells'),
+        'allocator': allocator_state(model.allocator),
+        'tourPlanner': tour_planner_state(model.tourPlanner),
+        'reservations': {
+            'reserved': [[cell, step, unique_id] for (cell, step), unique_id in model.reservations.reserved.items()],
+            'plans': [[unique_id, *plan] for unique_id, plan in model.reservations.plans.items()],
+        },
+        'robots': [{
+            'unique_id': robot.unique_id,
+            'pos': robot.pos,
+            'last_position': getattr(robot, 'last_position', None),
+            'route': route_state(model, robot.route),
+            **{name: getattr(robot, name) for name in ROBOT_FIELDS},
+        } for robot in robots],
+    }
+    arrays['meta'] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+# Modelo nuevo en el estado guardado en 'data'. 'seed' cambia la secuencia aleatoria a partir del
+# checkpoint y 'options' reemplaza opciones del modelo (exploration, routing, ...).
+def restore(data, seed=None, **options):
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        arrays = dict(archive)
+    meta = json.loads(arrays.pop('meta').tobytes())
+    if meta.get('version') != VERSION:
+        raise ValueError(f"Versión de checkpoint no soportada: {meta.get('version')}")
+
+    # Se construye un modelo con el mismo mapa y número de robots (los robots se crean en el
+    # mismo orden, así que conservan su unique_id) y después se le copia el estado guardado
+    width, height = meta['width'], meta['height']
+    kind = arrays['cellKind']
+    gameboard = GridLayer(width, height)
+    gameboard.kind[:] = kind
+    gameboard.kind[tuple(meta['robots'][0]['pos'])] = ROBOT
+
+    model = GameBoard(width, height, gameboard, len(meta['robots']),
+                      **{**meta['options'], **options}, seed=seed)
+
+    model.cellKind[:] = kind
+    model.cellLitter[:] = arrays['cellLitter']
+    model.robots_internal_map.kind[:] = arrays['internal_map.kind']
+    model.robots_internal_map.litter[:] = arrays['internal_map.litter']
+    model.robots_pos_map.kind[:] = arrays['pos_map.kind']
+    model.robots_pos_map.litter[:] = arrays['pos_map.litter']
+    for name, version in meta['graphs'].items():
+        set_graph_state(getattr(model, name), arrays, name, version)
+    set_nearest_index_state(model.litterCoords, meta['litterCoords'])
+    set_dense_index_state(model.unexploredCells, arrays, 'unexploredCells', meta['unexploredCells'])
+    set_allocator_state(model.allocator, meta['allocator'])
+    set_tour_planner_state(model.tourPlanner, meta['tourPlanner'])
+
+    reservations = meta['reservations']
+    model.reservations.reserved = {(cell, step): unique_id for cell, step, unique_id in reservations['reserved']}
+    model.reservations.plans = {unique_id: (goal, now, path, [tuple(key) for key in keys])
+                                for unique_id, goal, now, path, keys in reservations['plans']}
+
+    for name, value in meta['model'].items():
+        setattr(model, name, value)
+    model.paperBin_pos = cell(model.paperBin_pos)
+    model.claimedCells = cells(model.claimedCells)
+    model.current_step = meta['current_step']
+
+    agents = {agent.unique_id: agent for agent in model.schedule.agents}
+    for saved in meta['robots']:
+        robot = agents[saved['unique_id']]
+        model.move_agent(robot, cell(saved['pos']))
+        for name in ROBOT_FIELDS:
+            setattr(robot, name, saved[name])
+        for name in ROBOT_CELLS:
+            setattr(robot, name, cell(saved[name]))
+        for name in ROBOT_PATHS:
+            setattr(robot, name, cells(saved[name]))
+        if saved['last_position'] is not None:
+            robot.last_position = cell(saved['last_position'])
+        set_route_state(model, robot.route, saved['route'])
+
+    model.schedule.steps, model.schedule.time, sleeping = meta['schedule']
+    for unique_id in sleeping:
+        robot = agents[unique_id]
+        model.schedule.sleep(robot, robot.shouldWake)
+
+    if seed is None:
+        version, internal, gauss = meta['random']
+        model.random.setstate((version, tuple(internal), gauss))
+    model.gridVersion += 1
+    return model
+
+
+def save_checkpoint(model, path):
+    with open(path, 'wb') as file:
+        file.write(snapshot(model))
+
+
+def load_checkpoint(path, seed=None, **options):
+    with open(path, 'rb') as file:
+        return restore(file.read(), seed=seed, **options)
@@ -1,51 +1,48 @@
 # Importamos las clases que se requieren para manejar los agentes (Agent) y su entorno (Model).
-# Cada modelo puede contener múltiples agentes.
-from mesa import Agent, Model
+# Cada modelo puede contener múltiples agentes. Se importan de los módulos del núcleo de Mesa
+# (mesa.agent, mesa.model, mesa.space, mesa.time) y no del paquete completo.
+from mesa.agent import Agent
+from mesa.model import Model
 
 # Debido a que necesitamos que existan varios agents por celda, elegimos ''MultiGrid''
 # En la primera iteración.
 from mesa.space import MultiGrid
 
-# Con ''SimultaneousActivation, hacemos que todos los agentes se activen ''al mismo tiempo''.
-from mesa.time import RandomActivation
+# Solo los robots son agentes; el scheduler (ver scheduler.py) los activa en orden aleatorio
+# en cada paso y se salta a los que están dormidos.
+from scheduler import RobotActivation
 
-# Haremos uso de ''DataCollector'' para obtener información de cada paso de la simulación.
-from mesa.datacollection import DataCollector
+# Para guardar cada paso de la simulación usamos un registro de cambios por celda (ver trajectory.py)
+# en lugar del ''DataCollector'', que guardaba el grid completo en cada paso.
 
-# matplotlib lo usaremos crear una animación de cada uno de los pasos del modelo.
-
-import matplotlib
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.colors import ListedColormap
-
-plt.rcParams["animation.html"] = "jshtml"
-matplotlib.rcParams['animation.embed_limit'] = 2**128
+# matplotlib se usa para crear una animación de cada uno de los pasos del modelo (ver render.py); se
+# importa dentro de render_animation para que las ejecuciones sin visualización no lo carguen.
 
 # Importamos los siguientes paquetes para el mejor manejo de valores numéricos.
+import logging
 import numpy as np
-import random as rd
 
-from http.server import BaseHTTPRequestHandler, HTTPServer
-import logging
-import json
+from pathfinding import DistanceField, OccupancyGraph, Pathfinder, Route
+from reservation import ReservationTable
+from allocation import LitterAllocator, TourPlanner
+from spatialindex import DenseIndex, NearestIndex
+from gridlayer import BIN, FREE, ROBOT, ROBOT_BIN, UNKNOWN, WALL, GridLayer
+from trajectory import TrajectoryRecorder, decode_frame
+from runfile import save_run
+from profiler import NullProfiler, StepProfiler
 
-# --- Definición de Agentes ---
-class Litter(Agent):
-    def __init__(self, id, model):
-        super().__init__(id, model)
-        self.type = 2
+# Los mensajes de la simulación van por logging: DEBUG muestra el paso y la exploración de cada
+# robot, INFO solo el resultado. Sin configurar logging (batch, servidores) no se imprime nada.
+log = logging.getLogger("cleaningRobots")
 
-class Wall(Agent):
-    def __init__(self, id, model):
-        super().__init__(id, model)
-        self.type = 3
-
-class PaperBin(Agent):
-    def __init__(self, id, model):
-        super().__init__(id, model)
-        self.type = 4
+# Desplazamientos de los movimientos al azar a una celda vecina, en el orden en que se eligen
+MOVES = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+# Posición de cada desplazamiento en la ventana de 3x3 alrededor de la celda, aplanada
+MOVES_WINDOW = [(dx + 1) * 3 + dy + 1 for dx, dy in MOVES]
 
+# --- Definición de Agentes ---
+# Las basuras, los muros y la papelera no son agentes: GameBoard los guarda como datos del
+# grid (cellKind y cellLitter), así que el scheduler solo tiene que activar a los robots.
 class Robot(Agent):
     
     #--- Constructor del Robot ---
@@ -58,9 +55,13 @@ class Robot(Agent):
         self.load = 0
         
         self.queuedMovements = []
+        # Ruta planeada que se conserva entre pasos cuando el modelo usa routing "reuse"
+        self.route = Route()
         
         self.targetCell = ()
         self.targetCell_aux = ()
+        # Celdas con basura que le quedan por visitar con allocation "tour"
+        self.tour = []
         self.alreadyCleaned = False
     
     def step(self):
@@ -68,7 +69,7 @@ class Robot(Agent):
         if self.model.exploredCellsCount != self.model.cellsCount :
             if self.model.current_step >= 1:
                 self.explore_missing()
-                print(f"Se han explorado {self.model.exploredCellsCount}/{self.model.cellsCount} celdas")
+                log.debug("Se han explorado %d/%d celdas", self.model.exploredCellsCount, self.model.cellsCount)
         
         #Recolectar basura
         else:
@@ -125,61 +126,50 @@ class Robot(Agent):
 
     def can_move(self, pos):
         
-        if self.model.grid.out_of_bounds(pos):
-            return False
-        # Verificar si hay algún robot o muro en la celda de destino
-        return not any(agent.type == 1 or 
-                       agent.type == 3 
-                       for agent in self.model.grid.get_cell_list_contents([pos]))
+        # Verificar si hay algún robot o muro en la celda de destino (o si está fuera del grid)
+        return not self.model.cellBlocked[pos[0] + 1, pos[1] + 1]
     
     #Elige una celda a su alrededor para explorar, si se puede mover, lo hará.
     def explore_random(self):
         
-        # Definir las posibles direcciones de movimiento
-        sp = self.pos
-        possible_moves = [(sp[0], sp[1] + 1), (sp[0], sp[1] - 1), 
-                          (sp[0]+ 1, sp[1]), (sp[0] - 1, sp[1]), 
-                          (sp[0] + 1, sp[1] + 1), (sp[0] + 1, sp[1] - 1), 
-                          (sp[0] - 1, sp[1] + 1), (sp[0] - 1, sp[1] - 1)]
-        valid_moves = [pos for pos in possible_moves if self.can_move(pos)] # Filtrar movimientos válidos
+        valid_moves = self.model.freeNeighbors(self.pos)
         
         if valid_moves:
-            next_pos = rd.choice(valid_moves)
-            self.model.grid.move_agent(self, next_pos)
+            next_pos = self.model.random.choice(valid_moves)
+            self.model.move_agent(self, next_pos)
             self.update_internal_map()
             self.update_pos_map()
     
     #Elige una de las celdas que faltan de explorar, si puede moverse, generará la mejor ruta para ir a ella
     def explore_missing(self):
+        if self.model.exploration == "frontier":
+            self.explore_frontier()
+            return
+        
         self.model.updateUnexplored()
         self.update_internal_map()      
         self.update_pos_map()
-        self.model.updateMapToGraph(self.model.robots_internal_map)
             
         #print(f"Atributos del Robot - SP: {self.pos} TC: {self.targetCell} QM: {self.queuedMovements}")
             
         if not self.targetCell:
                 
-            nearestUCDist = 71
             #Sin movimientos pendientes, sin target, con celdas por descubrir
             if self.model.unexploredCells:
                 
                 #print(f"{len(self.model.unexploredCells)} Celdas por explorar: {self.model.unexploredCells}")
-                for cell in self.model.unexploredCells:
-                    
-                    dist = np.sqrt( (self.pos[0]-cell[0])**2 + (self.pos[1]-cell[1])**2 )
-                    
-                    if dist < nearestUCDist:
-                        nearestUCDist = dist
-                        self.targetCell = (cell[0],cell[1])
-                self.model.unexploredCells.remove(self.targetCell)
+                nearestCell = self.model.nearestTarget(self.pos, self.model.unexploredCells, self.model.internalGraph)
+                
+                if nearestCell:
+                    self.targetCell = nearestCell
+                    self.model.claimUnexplored(self.targetCell)
             
             else:
                 #print(f"[Robot en {self.pos}] Mision completada. Esperando a los demás...")
                 self.move_random()
                 return
         
-        self.queuedMovements = self.model.bfs(self.model.cellsGraph, self.pos, self.targetCell)
+        self.queuedMovements = self.model.planPath(self, self.model.internalGraph, self.targetCell)
         
         if(self.queuedMovements and len(self.queuedMovements) > 1):
             self.queuedMovements.pop(0)
@@ -189,7 +179,7 @@ class Robot(Agent):
             #Seguir el movimiento para llegar a la celda seleccionada
             if self.can_move(self.queuedMovements[0]):
                 
-                self.model.grid.move_agent(self, self.queuedMovements[0])
+                self.model.move_agent(self, self.queuedMovements[0])
                 #print(f"El robot se movio a la celda {self.pos}")
                 
                 if self.pos == self.targetCell:
@@ -200,7 +190,7 @@ class Robot(Agent):
         else: 
             #print(f"No se encontró un camino de {self.pos} a {self.targetCell}")
             
-            if self.model.robots_internal_map[self.targetCell[0]][self.targetCell[1]] == 'X':
+            if self.model.robots_internal_map.kind[self.targetCell] == WALL:
                 self.targetCell = ()
                 
             if self.pos == self.targetCell:
@@ -211,33 +201,46 @@ class Robot(Agent):
         self.update_internal_map()      
         self.update_pos_map()
             
+    #Avanza hacia la celda sin explorar más cercana siguiendo el campo de distancias compartido
+    def explore_frontier(self):
+        self.update_internal_map()
+        self.update_pos_map()
+        
+        next_pos = self.model.frontierField().next_step(self.pos)
+        
+        if next_pos is None:
+            #Las celdas que faltan no son alcanzables desde aquí
+            self.move_random()
+        elif self.can_move(next_pos):
+            self.model.move_agent(self, next_pos)
+        
+        self.update_internal_map()
+        self.update_pos_map()
+    
     #Elige una celda con basura como objetivo
     def assignLitter(self):
         
-        if self.model.litterCoords:
-            
-            nearestLitterDist = 71
-            nearestLitterPos = ()
+        if self.model.litterCoords or self.tour:
             
-            for litterPos in self.model.litterCoords:
-                
-                dist = np.sqrt( (self.pos[0]-litterPos[0])**2 + (self.pos[1]-litterPos[1])**2 )
+            #Con allocation "assignment" la celda la decide la asignación de toda la flota
+            if self.model.allocation == "assignment":
+                self.model.allocateLitter()
+            #Con allocation "tour" el robot sigue el recorrido que planeó
+            elif self.model.allocation == "tour":
+                self.model.nextTourCell(self)
+            else:
+                nearestLitterPos = self.model.nearestTarget(self.pos, self.model.litterCoords, self.model.posGraph)
                 
-                if dist < nearestLitterDist:
-                    nearestLitterDist = dist
-                    nearestLitterPos = (litterPos[0],litterPos[1])
-            
-            self.targetCell = nearestLitterPos
-            self.model.litterCoords.remove(self.targetCell)
+                self.targetCell = nearestLitterPos or ()
+                if self.targetCell:
+                    self.model.litterCoords.remove(self.targetCell)
             #print(f"[Robot en {self.pos}] TC asignada {self.targetCell}")
             
             #Ir a la celda asignada
             if self.pos != self.targetCell:
                 
-                self.model.updateMapToGraph(self.model.robots_pos_map)
-                
                 #Busca un camino
-                path = self.model.bfs(self.model.cellsGraph, self.pos, self.targetCell)
+                path = self.model.planPath(self, self.model.posGraph, self.targetCell)
                 if path:
                     #print(f"[Robot en {self.pos}] El camino más corto encontrado es: {path}")
                     if len(path) > 1:
@@ -251,10 +254,8 @@ class Robot(Agent):
                         self.move_random()
                         #print(f"[Robot en papelera] Me movía a {self.pos}")
                     
-                    for agent in self.model.grid.get_cell_list_contents(self.targetCell):
-                        if agent.type == 1:
-                            #print(f"Ya hay un robot en {self.targetCell}. Esperando un step...")
-                            break
+                    #if self.targetCell and self.model.cellRobots[self.targetCell]:
+                        #print(f"Ya hay un robot en {self.targetCell}. Esperando un step...")
 
         else:
             if self.pos == self.model.paperBin_pos:
@@ -263,23 +264,33 @@ class Robot(Agent):
                 self.alreadyCleaned = True
                 self.moveToPaperBin()
             else:
-                print(f"[Robot en {self.pos}] Ya no hay basura, esperando a los demás...")
+                log.debug("[Robot en %s] Ya no hay basura, esperando a los demás...", self.pos)
                 if self.state == "cleaning":
                     self.state = "done"
                     self.model.robots_finished += 1    
             self.move_random()
+            self.waitIdle()
+    
+    #Sin basura pendiente, el robot se duerme hasta que aparezca basura, llegue otro robot a su lado
+    #o algún robot despierto necesite su celda (como objetivo o en su camino), para poder quitarse
+    def waitIdle(self):
+        if self.state == "done" and self.load == 0 and not self.targetCell and not self.model.litterCoords:
+            self.model.schedule.sleep(self, self.shouldWake)
+    
+    def shouldWake(self):
+        return (bool(self.model.litterCoords) or self.model.robotsAround(self.pos) > 0
+                or self.model.cellWanted(self.pos))
     
 
     def pickUpLitter(self):
-        cell = self.model.grid.get_cell_list_contents(self.pos)
-        toCollect = min(self.capacity-self.load, len(cell)-1)
-        #print(f"[Robot en {self.pos}] Puedo limpiar {self.capacity-self.load} basuras, en la celda hay {len(cell)-1} basuras")
-        
-        for i in range(toCollect):
-            if cell[i].type == 2:
-                self.model.grid.remove_agent(cell[i])
-                self.model.schedule.remove(cell[i])
-                self.load += 1
+        litter = int(self.model.cellLitter[self.pos])
+        #Como cuando se contaban los agentes de la celda, los demás robots en ella también cuentan
+        toCollect = min(self.capacity-self.load, self.model.cellAgents(self.pos)-1, litter)
+        #print(f"[Robot en {self.pos}] Puedo limpiar {self.capacity-self.load} basuras, en la celda hay {litter} basuras")
+        
+        if toCollect > 0:
+            self.model.removeLitter(self.pos, toCollect)
+            self.load += toCollect
         if self.load == 5:
             #print(f"[Robot en {self.pos}] Ya no tengo espacio")
             self.alreadyCleaned = True
@@ -294,7 +305,7 @@ class Robot(Agent):
         self.queuedMovements = []
         self.alreadyCleaned = False
         
-        missingTrash = len(self.model.grid.get_cell_list_contents(self.targetCell_aux))
+        missingTrash = self.model.cellAgents(self.targetCell_aux) if self.targetCell_aux else 0
         
         #print(f"[Robot en papelera] Ya dejé la basura, hay {missingTrash} basura(s) en mi celda asignada {self.targetCell_aux}")
         
@@ -312,33 +323,39 @@ class Robot(Agent):
     def moveToPaperBin(self):
 
         self.targetCell = self.model.paperBin_pos
-        self.model.updateMapToGraph(self.model.robots_pos_map)
-        path = self.model.bfs(self.model.cellsGraph, self.pos, self.model.paperBin_pos)
         
-        if path:
-            
-            if(len(path) > 1):
-                path.pop(0)
-            #print(f"[Robot en {self.pos}] se moverá al paperBin. Steps: {path}")
+        if self.model.routing == "cooperative":
+            self.moveReserved(self.targetCell)
+            return
+        
+        #El campo de distancias a la papelera se comparte entre todos los robots
+        next_pos = self.model.paperBinField().next_step(self.pos)
+        
+        if next_pos:
+            #print(f"[Robot en {self.pos}] se moverá al paperBin por {next_pos}")
             
-            if self.can_move(path[0]):
-                self.model.grid.move_agent(self, path[0])
+            if self.can_move(next_pos):
+                self.model.move_agent(self, next_pos)
                 self.update_pos_map()
-                path.pop(0)
                 #print(f"[Robot se movio a {self.pos}]")
             
             #else:
-                #print(f"[Robot en {self.pos}] No me puedo mover a {path[0]}. Me esperaré un step")
+                #print(f"[Robot en {self.pos}] No me puedo mover a {next_pos}. Me esperaré un step")
                 
         #else:
             #print(f"[Robot en {self.pos}] La papelera está ocupada. Se esperará un step")
     
 
     def move(self):
+        if self.model.routing == "cooperative":
+            self.queuedMovements = []
+            self.moveReserved(self.targetCell)
+            return
+        
         if self.queuedMovements:
             #print(f"[Robot en {self.pos}] Tengo movimientos pendientes: {self.queuedMovements}")
             if self.can_move(self.queuedMovements[0]):
-                self.model.grid.move_agent(self, self.queuedMovements[0])
+                self.model.move_agent(self, self.queuedMovements[0])
                 self.update_pos_map()
                 self.queuedMovements.pop(0)
                 #print(f"[Robot se movió a {self.pos}]")
@@ -349,15 +366,14 @@ class Robot(Agent):
             #else:
                 #print(f"[Robot en {self.pos}] No tengo movimientos pendientes. Intentaré ir a {self.targetCell}")
             
-            self.model.updateMapToGraph(self.model.robots_pos_map)
-            path = self.model.bfs(self.model.cellsGraph, self.pos, self.targetCell)
+            path = self.model.planPath(self, self.model.posGraph, self.targetCell)
             
             if path:
                 if(len(path) > 1):
                     path.pop(0)
                 #print(f"[Robot en {self.pos}] se moverá a {self.targetCell}. Steps: {path}")
                 if self.can_move(path[0]):
-                    self.model.grid.move_agent(self, path[0])
+                    self.model.move_agent(self, path[0])
                     self.update_pos_map()
                     path.pop(0)
                     #print(f"[Robot se movio a {self.pos}]")
@@ -375,89 +391,113 @@ class Robot(Agent):
                 #print(f"[Robot en {self.pos}] No encontré camino a {self.targetCell}. Me esperaré un step")
     
     
+    #Con routing "cooperative" el robot sigue el plan que reservó en la tabla del modelo:
+    #si otro robot va a pasar por su camino, espera o lo rodea en lugar de moverse al azar
+    def moveReserved(self, objetivo):
+        next_pos = self.model.reservedStep(self, objetivo)
+        
+        if next_pos is None:
+            if self.pos == self.model.paperBin_pos:
+                self.move_random()
+        
+        elif next_pos != self.pos:
+            if self.can_move(next_pos):
+                self.model.move_agent(self, next_pos)
+                self.update_pos_map()
+            else:
+                #Un robot sin reservaciones le estorba: vuelve a planear en el siguiente step
+                self.model.reservations.cancel(self)
+    
     def move_random(self):
-        # Definir las posibles direcciones de movimiento
-        sp = self.pos
-        possible_moves = [(sp[0], sp[1] + 1), (sp[0], sp[1] - 1), 
-                          (sp[0]+ 1, sp[1]), (sp[0] - 1, sp[1]), 
-                          (sp[0] + 1, sp[1] + 1), (sp[0] + 1, sp[1] - 1), 
-                          (sp[0] - 1, sp[1] + 1), (sp[0] - 1, sp[1] - 1)]
-        valid_moves = [pos for pos in possible_moves if self.can_move(pos)] # Filtrar movimientos válidos
+        valid_moves = self.model.freeNeighbors(self.pos)
         
         if valid_moves:
-            next_pos = rd.choice(valid_moves)
+            next_pos = self.model.random.choice(valid_moves)
             if next_pos != self.model.paperBin_pos:
-                self.model.grid.move_agent(self, next_pos)
+                self.model.move_agent(self, next_pos)
                 self.update_pos_map()
     
     
     def update_pos_map(self):
-        # Si last_position está definida, quita la 'S' de esa posición
-        if hasattr(self, 'last_position'):
-            self.model.robots_pos_map[self.last_position[0]][self.last_position[1]] = ''
-
-        # Guardar la última posición
-        self.last_position = self.pos
-
-        # Marca la posición actual del robot como 'S'
-        self.model.robots_pos_map[self.pos[0]][self.pos[1]] = 'S'
-
-        # Otras partes del código no relacionadas con el rastreo del robot
-        neighbors = self.model.grid.get_neighbors(self.pos, moore=True, include_center=False)
-
-        for agent in neighbors:
-            if agent.type == 3:
-                self.model.robots_pos_map[agent.pos[0]][agent.pos[1]] = 'X'
-            elif agent.type == 4:
-                self.model.robots_pos_map[agent.pos[0]][agent.pos[1]] = 'P'
-        if self.model.robots_pos_map[self.pos[0]][self.pos[1]] == '':
-            self.model.robots_pos_map[self.pos[0]][self.pos[1]] = '0'
+        with self.model.profiler.phase("map_update"):
+            # Si last_position está definida, quita la marca de robot (ROBOT) de esa posición
+            if hasattr(self, 'last_position'):
+                self.model.setPosCell(self.last_position, UNKNOWN)
+
+            # Guardar la última posición
+            self.last_position = self.pos
+
+            # Marca la posición actual del robot como ROBOT
+            self.model.setPosCell(self.pos, ROBOT)
+
+            # Otras partes del código no relacionadas con el rastreo del robot
+            for pos in self.model.grid.get_neighborhood(self.pos, moore=True, include_center=False):
+                if self.model.cellKind[pos] == WALL:
+                    self.model.setPosCell(pos, WALL)
+                elif self.model.cellKind[pos] == BIN:
+                    self.model.setPosCell(pos, BIN)
+            if self.model.robots_pos_map.kind[self.pos] == UNKNOWN:
+                self.model.setPosCell(self.pos, FREE)
     
 
     #Con cada movimiento de un Robot, se llena un mapa con lo que hay en esa celda. Si hay muros los registrará
     def update_internal_map(self):
+        with self.model.profiler.phase("map_update"):
         
-        if self.model.robots_internal_map[self.pos[0]][self.pos[1]] == '':
-            self.model.exploredCellsCount += 1
+            internal_map = self.model.robots_internal_map
         
-        cell_content = self.model.grid.get_cell_list_contents(self.pos)
-        neighbors = self.model.grid.get_neighbors(self.pos, moore = True, include_center = False)
-        litter = 0
-        # Actualizar el mapa interno, dependiendo del tipo de agente (2 = Basura, 3 = Pared, 4 = Papelera)
-        for agent in cell_content:
-            
-            if agent != 1:
-                if agent.type == 2:
-                    litter += 1
-                    self.model.robots_internal_map[self.pos[0]][self.pos[1]] = str(litter)
-                
-                if agent.type == 4:
-                    self.model.robots_internal_map[self.pos[0]][self.pos[1]] = 'P'
-        litter = 0
+            if internal_map.kind[self.pos] == UNKNOWN:
+                self.model.exploredCellsCount += 1
+        
+            litter = self.model.cellLitter[self.pos]
+            # Actualizar el mapa interno con lo que hay en el grid: basura, muros y papelera
+            if self.model.cellKind[self.pos] == BIN:
+                self.model.setInternalCell(self.pos, BIN)
         
-        for agent in neighbors:
+            if litter:
+                self.model.setInternalCell(self.pos, FREE, litter)
+        
+            for pos in self.model.grid.get_neighborhood(self.pos, moore=True, include_center=False):
             
-            if agent.type == 3:
-                if self.model.robots_internal_map[agent.pos[0]][agent.pos[1]] == '':
-                    self.model.exploredCellsCount += 1
+                if self.model.cellKind[pos] == WALL:
+                    if internal_map.kind[pos] == UNKNOWN:
+                        self.model.exploredCellsCount += 1
                 
-                self.model.robots_internal_map[agent.pos[0]][agent.pos[1]] = 'X'
+                    self.model.setInternalCell(pos, WALL)
         
-        #Si la celda no contiene agentes, entonces está 'libre'
-        if self.model.robots_internal_map[self.pos[0]][self.pos[1]] == '':
-            self.model.robots_internal_map[self.pos[0]][self.pos[1]] = '0'
-        elif (self.model.robots_internal_map[self.pos[0]][self.pos[1]].isnumeric() and self.model.robots_internal_map[self.pos[0]][self.pos[1]] != '0'):
-            if (self.pos[0],self.pos[1]) not in self.model.litterCoords:
-                    self.model.litterCoords.append((self.pos[0],self.pos[1]))
+            #Si la celda no contiene agentes, entonces está 'libre'
+            if internal_map.kind[self.pos] == UNKNOWN:
+                self.model.setInternalCell(self.pos, FREE)
+            elif internal_map.kind[self.pos] == FREE and internal_map.litter[self.pos] > 0:
+                if (self.pos[0],self.pos[1]) not in self.model.litterCoords:
+                        self.model.litterCoords.append((self.pos[0],self.pos[1]))
 
 # --- Definición del Modelo ---
 class GameBoard(Model):
     
     #--- Constructor del Modelo---
-    def __init__(self, width, height, gameboard, robots_count):
+    # exploration: "nearest" (cada robot elige la celda sin explorar más cercana) o
+    # "frontier" (todos siguen un campo de distancias hacia las celdas sin explorar)
+    # target_metric: "euclidean" o "path" (distancia real de recorrido) para elegir la celda
+    # con basura o sin explorar más cercana
+    # routing: "bfs" (cada robot busca su camino completo en cada paso) o "reuse" (cada robot
+    # conserva su ruta y solo la repara cuando una celda de ella queda bloqueada) o
+    # "cooperative" (al limpiar, los robots reservan sus celdas de los siguientes pasos en una
+    # tabla compartida y planean alrededor de las reservaciones de los demás)
+    # allocation: "greedy" (cada robot toma la basura más cercana cuando se queda sin celda) o
+    # "assignment" (se asignan las celdas con basura a todos los robots a la vez, por distancia
+    # de recorrido, y se vuelve a resolver cada vez que un robot se queda sin celda) o "tour" (cada
+    # robot planea un recorrido por varias celdas que llena su capacidad; experimental, ver allocation)
+    # collect_data: si es False no se guarda el grid de cada paso (ejecuciones sin visualización)
+    # seed: semilla del generador de números aleatorios del modelo (la toma mesa.Model). Tanto el
+    # orden de activación como los movimientos al azar de los robots usan self.random, así que
+    # con la misma semilla la simulación se repite exactamente
+    # profile: si es True se mide el tiempo de cada fase del paso en self.profiler (ver profiler)
+    def __init__(self, width, height, gameboard, robots_count, exploration="nearest", target_metric="euclidean",
+                 routing="bfs", allocation="greedy", collect_data=True, seed=None, profile=False):
         
         self.grid = MultiGrid(width, height, torus = False)
-        self.schedule = RandomActivation(self)
+        self.schedule = RobotActivation(self)
         self.simulation_continue = True
         
         self.current_id = 0
@@ -466,80 +506,187 @@ class GameBoard(Model):
         self.total_steps = 0
         self.step_exploration_done = 0
         self.robots_finished = 0
+        self.robots_count = robots_count
+        self.collect_data = collect_data
+        self.profiler = StepProfiler() if profile else NullProfiler()
         
         self.paperBin_pos = (0,0)
         
-        self.robots_internal_map = np.zeros((width, height), dtype=str)
-        self.robots_pos_map = np.zeros((width, height), dtype=str)
-        self.cellsGraph = {}
+        # Mapas que construyen los robots, codificados con enteros (ver gridlayer)
+        self.robots_internal_map = GridLayer(width, height)
+        self.robots_pos_map = GridLayer(width, height)
+        # Grafos de ocupación de cada mapa, se actualizan celda por celda al escribir en los mapas
+        self.internalGraph = OccupancyGraph(width, height)
+        self.posGraph = OccupancyGraph(width, height)
+        self.pathfinder = Pathfinder(width, height)
+        self.routing = routing
+        # Grafo solo con los muros conocidos y tabla de reservaciones del routing "cooperative"
+        self.wallGraph = OccupancyGraph(width, height)
+        self.reservations = ReservationTable(self.wallGraph)
+        self.allocation = allocation
+        self.allocator = LitterAllocator(self.wallGraph)
+        self.tourPlanner = TourPlanner(self.wallGraph)
+        
+        # Campos de distancias compartidos por todos los robots, se recalculan solo si el mapa cambió
+        self.exploration = exploration
+        self.binField = DistanceField(self.posGraph)
+        self.unexploredField = DistanceField(self.internalGraph)
 
         self.cellsCount = width*height
         self.exploredCellsCount = 0
-        self.unexploredCells = []
+        # Frontera indexada de celdas sin explorar; update_internal_map la mantiene al día
+        # a través de setInternalCell, sin volver a recorrer el mapa
+        self.unexploredCells = DenseIndex(width, height)
+        self.claimedCells = []
         
-        self.litterCoords = []
+        self.litterCoords = NearestIndex(width, height)
+        self.target_metric = target_metric
         self.litterCount = 0
         
-        for x in range(len(gameboard)):
-            for y in range(len(gameboard[x])):
-                self.initialize_agents(gameboard, x, y, robots_count)
+        # Contadores por celda de lo que hay en el grid, se actualizan al colocar, mover o quitar agentes
+        self.cellKind = np.full((width, height), FREE, dtype=np.uint8)
+        self.cellLitter = np.zeros((width, height), dtype=np.uint8)
+        self.cellRobots = np.zeros((width, height), dtype=np.uint16)
+        # Celdas a las que no se puede mover un robot (muros o robots), con un borde de celdas
+        # bloqueadas alrededor del grid para no revisar los límites: la celda (x, y) está en
+        # cellBlocked[x + 1, y + 1]
+        self.cellBlocked = np.ones((width + 2, height + 2), dtype=bool)
+        self.gridVersion = 0
+        self.frameCache = None
+        self.gridCache = None
+        
+        # El mapa puede venir como GridLayer (GridLayer.from_file) o como la lista de filas con
+        # los códigos de texto del input
+        layer = gameboard if isinstance(gameboard, GridLayer) else GridLayer.from_codes(gameboard)
+        self.initialize_board(layer, robots_count)
 
-        self.datacollector = DataCollector(
-            model_reporters={
-                "GridRepr": lambda m: get_grid(m)[0],
-                "GridColors": lambda m: get_grid(m)[1]
-            })
+        self.recorder = TrajectoryRecorder(width, height)
 
 
     def step(self):
         
-        print("================================")
-        print(self.current_step)
+        log.debug("================================")
+        log.debug("%d", self.current_step)
         
         if self.exploredCellsCount == self.cellsCount:
-            print(f"Hay {len(self.litterCoords)} celdas con basura")
+            log.debug("Hay %d celdas con basura", len(self.litterCoords))
             
             if self.step_exploration_done == 0:
                 self.step_exploration_done = self.current_step
+            
+            if self.allocation == "assignment" and self.allocator.needs_solve(self):
+                self.allocateLitter()
         
-        self.schedule.step()
+        with self.profiler.phase("robots"):
+            self.schedule.step()
         
         self.current_step += 1
-        self.datacollector.collect(self)
+        if self.collect_data:
+            with self.profiler.phase("collect"):
+                self.recorder.record(*self.gridFrame())
+        
+        if self.profiler.enabled:
+            self.profiler.end_step(self.current_step,
+                                   searches=self.pathfinder.search_id + self.reservations.searches,
+                                   expanded=self.pathfinder.expanded + self.reservations.expanded)
         
-        if self.robots_finished >= 5:
-            print(f"El programa ha terminado. xSteps: {self.step_exploration_done} tSteps: {self.current_step}")
+        if self.robots_finished >= self.robots_count:
+            log.info("El programa ha terminado. xSteps: %d tSteps: %d", self.step_exploration_done, self.current_step)
             self.simulation_continue = False
     
-    #Inicializa los agentes de acuerdo a la lectura del input.txt
-    def initialize_agents(self, gameboard, x, y, robots_count):
+    # Contenido inicial del grid a partir de la capa del input: los muros, la papelera y la
+    # basura se copian con NumPy a los contadores por celda y los robots se crean en la celda 'S'
+    def initialize_board(self, layer, robots_count):
         
-        cell = gameboard[x][y]
+        self.cellKind[layer.kind == WALL] = WALL
+        self.cellKind[layer.kind == BIN] = BIN
+        self.cellBlocked[1:-1, 1:-1] = self.cellKind == WALL
+        self.cellLitter[:] = layer.litter
         
-        if cell.isnumeric():
-            litter_count = int(cell)
-            while litter_count > 0:
-                agent = Litter(self.next_id(), self)
-                self.place_agent(agent, (x,y))
-                litter_count -= 1
+        bins = np.argwhere(layer.kind == BIN).tolist()
+        if bins:
+            self.paperBin_pos = tuple(bins[-1])
         
-        elif cell == "X":
-            agent = Wall(self.next_id(), self)
-            self.place_agent(agent, (x,y))
-        
-        elif cell == "P":
-            agent = PaperBin(self.next_id(), self)
-            self.place_agent(agent, (x,y))
-            self.paperBin_pos = (x, y)
-        
-        elif cell == "S":
+        for x, y in np.argwhere(layer.kind == ROBOT).tolist():
             self.initialize_robots(x, y, robots_count)
-            robots_count = 0
     
     
     def place_agent(self, agent, agent_pos):
         self.grid.place_agent(agent, agent_pos)
         self.schedule.add(agent)
+        self.cellRobots[agent_pos] += 1
+        self.cellBlocked[agent_pos[0] + 1, agent_pos[1] + 1] = True
+        self.gridVersion += 1
+    
+    # Todos los movimientos de los robots pasan por aquí para mantener los contadores por celda
+    def move_agent(self, agent, pos):
+        x, y = agent.pos
+        self.cellRobots[x, y] -= 1
+        # Los robots nunca están sobre un muro: la celda que dejan solo sigue bloqueada si hay otro robot
+        self.cellBlocked[x + 1, y + 1] = self.cellRobots[x, y] > 0
+        self.grid.move_agent(agent, pos)
+        self.cellRobots[pos] += 1
+        self.cellBlocked[pos[0] + 1, pos[1] + 1] = True
+        self.gridVersion += 1
+    
+    # Quita las basuras recogidas por un robot
+    def removeLitter(self, pos, count):
+        self.cellLitter[pos] -= count
+        self.gridVersion += 1
+    
+    # Número de cosas en una celda (robots, basuras, muro o papelera), como cuando todas eran agentes
+    def cellAgents(self, pos):
+        return int(self.cellRobots[pos]) + int(self.cellLitter[pos]) + int(self.cellKind[pos] != FREE)
+    
+    # Algún robot despierto tiene la celda 'pos' como objetivo o en el camino que planeó (sus
+    # movimientos en cola, la ruta que conserva con routing "reuse" o su plan reservado)
+    def cellWanted(self, pos):
+        sleeping = self.schedule.sleeping
+        cell = pos[0] * self.grid.height + pos[1]
+        for robot in self.schedule.agents:
+            if robot.unique_id in sleeping or robot.pos == pos:
+                continue
+            if robot.targetCell == pos or pos in robot.queuedMovements:
+                return True
+            route = robot.route
+            if route.path and pos in route.path[route.index:]:
+                return True
+            plan = self.reservations.plans.get(robot.unique_id)
+            if plan and cell in plan[2]:
+                return True
+        return False
+    
+    # Celdas vecinas de 'pos' a las que se puede mover un robot, en el orden de MOVES. Por el
+    # borde de cellBlocked la ventana de 3x3 alrededor de la celda siempre está completa.
+    def freeNeighbors(self, pos):
+        x, y = pos
+        window = self.cellBlocked[x:x + 3, y:y + 3].ravel().tolist()
+        return [(x + dx, y + dy) for (dx, dy), cell in zip(MOVES, MOVES_WINDOW) if not window[cell]]
+    
+    # Robots en las celdas vecinas de 'pos' (sin contar la celda misma)
+    def robotsAround(self, pos):
+        x, y = pos
+        window = self.cellRobots[max(x - 1, 0):x + 2, max(y - 1, 0):y + 2]
+        return int(window.sum()) - int(self.cellRobots[pos])
+    
+    # Cuadro del grid codificado con enteros (tipo de celda y cantidad de basura), armado con los
+    # contadores por celda sin recorrer los agentes. Se guarda en caché hasta que algo cambie.
+    # Sigue las mismas reglas que get_grid: la papelera se muestra sobre el robot y el robot sobre la basura.
+    def gridFrame(self):
+        if self.frameCache is None or self.frameCache[0] != self.gridVersion:
+            kind = self.cellKind.copy()
+            kind[(self.cellRobots > 0) & (kind != BIN)] = ROBOT
+            kind[(self.cellRobots > 0) & (kind == BIN)] = ROBOT_BIN
+            self.frameCache = (self.gridVersion, kind, self.cellLitter.copy())
+            self.gridCache = None
+        return self.frameCache[1], self.frameCache[2]
+    
+    # Representación y colores del grid (ver get_grid), en caché junto con el cuadro
+    def gridSnapshot(self):
+        kind, litter = self.gridFrame()
+        if self.gridCache is None:
+            self.gridCache = decode_frame(kind, litter)
+        return self.gridCache
     
     
     def initialize_robots(self, x, y, robots_count):
@@ -549,201 +696,151 @@ class GameBoard(Model):
             self.place_agent(agent, (x, y))
             robots_count -= 1
     
-    # Creacion de lista con las celdas no exploradas
+    # Un robot toma una celda sin explorar como objetivo y la saca de la frontera
+    def claimUnexplored(self, cell):
+        self.unexploredCells.remove(cell)
+        self.claimedCells.append(cell)
+    
+    # Regresa a la frontera las celdas tomadas como objetivo que siguen sin explorar
     def updateUnexplored(self):
-
-        x = 0
-        for row in self.robots_internal_map:
-            y = 0
-            
-            for _ in row:
-                
-                if self.robots_internal_map[x][y] == '':
-                    if (x,y) not in self.unexploredCells:
-                        self.unexploredCells.append((x,y))
-                y += 1
-            x += 1
-    
-    #Convertir la matriz de las celdas exploradas por los robots en un grafo para el BFS
-    def updateMapToGraph(self, matrix):
-
-        graph = {}
-
-        # Recorrer la matriz y agregar conexiones
-        for i in range(len(matrix)):
-            for j in range(len(matrix[i])):
-                connections = []
-                if matrix[i][j] != 'X':
-                    # Agregar conexiones en todas las direcciones, incluyendo diagonales
-                    for di in [-1, 0, 1]:
-                        for dj in [-1, 0, 1]:
-                            # Se realiza la comparacion para que las celdas vecinas no sean obstaculos o punto de salida
-                            new_i, new_j = i + di, j + dj
-                            if (0 <= new_i < len(matrix) and 
-                                0 <= new_j < len(matrix[i]) 
-                                and (di != 0 or dj != 0) 
-                                and matrix[new_i][new_j] not in ('X', 'S')):
-                                
-                                connections.append((new_i, new_j))
-                # Asignar las conexiones al nodo correspondiente
-                graph[(i, j)] = connections
-
-        self.cellsGraph = graph
-    
-    # Algoritmo de Breadth-First Search para llegar de una cekda a otra
+        for cell in self.claimedCells:
+            if self.robots_internal_map.kind[cell] == UNKNOWN:
+                self.unexploredCells.add(cell)
+        self.claimedCells = []
+    
+    # Escritura de una celda del mapa interno de los robots, manteniendo su grafo al día
+    def setInternalCell(self, pos, kind, litter=0):
+        
+        # La celda acaba de descubrirse: sale de la frontera sin explorar
+        if kind != UNKNOWN and self.robots_internal_map.kind[pos] == UNKNOWN:
+            self.unexploredCells.discard(pos)
+        
+        self.robots_internal_map.set(pos, kind, litter)
+        self.internalGraph.set_cell(pos, kind)
+    
+    # Escritura de una celda del mapa de posiciones de los robots, manteniendo su grafo al día
+    def setPosCell(self, pos, kind):
+        self.robots_pos_map.set(pos, kind)
+        self.posGraph.set_cell(pos, kind)
+        if kind == WALL:
+            self.wallGraph.set_cell(pos, kind)
+    
+    # Celda objetivo más cercana a 'pos' dentro de un índice de celdas. Por distancia euclidiana
+    # (a menos de 71 celdas, como antes) o, con target_metric "path", por distancia de recorrido
+    def nearestTarget(self, pos, targets, graph):
+        with self.profiler.phase("targets"):
+            if self.target_metric == "path":
+                path = self.pathfinder.nearest(graph, pos, targets)
+                if path:
+                    return path[-1]
+            return targets.nearest(pos, 71)
+    
+    # Campo de distancias hacia la papelera sobre el mapa de posiciones
+    def paperBinField(self):
+        if self.binField.key != self.posGraph.version:
+            with self.profiler.phase("fields"):
+                self.binField.compute([self.paperBin_pos], self.posGraph.version)
+        return self.binField
+    
+    # Campo de distancias multi-fuente hacia todas las celdas que faltan por explorar
+    def frontierField(self):
+        key = (self.internalGraph.version, self.exploredCellsCount)
+        if self.unexploredField.key != key:
+            with self.profiler.phase("fields"):
+                unexplored = [tuple(cell) for cell in np.argwhere(self.robots_internal_map.unexplored_mask()).tolist()]
+                self.unexploredField.compute(unexplored, key)
+        return self.unexploredField
+    
+    # Algoritmo de Breadth-First Search para llegar de una celda a otra
     def bfs(self, grafo, inicio, objetivo):
-        visitados = set()  # Conjunto para mantener registro de nodos visitados
-        cola = [(inicio, [inicio])]  # Pares de nodo y el camino hacia el nodo
-
-        while cola:
-            (nodo_actual, camino) = cola.pop(0)  # Obtiene el primer nodo y su camino
-
-            if nodo_actual == objetivo:
-                return camino  # Si es el nodo objetivo, regresa el camino
-            
-            if nodo_actual not in visitados:
-                visitados.add(nodo_actual)
-                
-                # Explora los posibles vecinos
-                for vecino in grafo[nodo_actual]:
-                    nuevo_camino = list(camino)
-                    nuevo_camino.append(vecino)
-                    cola.append((vecino, nuevo_camino))
-        #Si no encuentra un camino, devuelve None
-        return None
+        with self.profiler.phase("pathfinding"):
+            return self.pathfinder.bfs(grafo, inicio, objetivo)
+    
+    # Camino de un robot hacia 'objetivo'; con routing "reuse" se repara la ruta que ya tenía
+    def planPath(self, robot, grafo, objetivo):
+        with self.profiler.phase("pathfinding"):
+            if self.routing == "reuse":
+                return self.pathfinder.follow(robot.route, grafo, robot.pos, objetivo)
+            return self.pathfinder.bfs(grafo, robot.pos, objetivo)
+    
+    # Asigna las celdas con basura a los robots que van por basura (allocation "assignment")
+    def allocateLitter(self):
+        with self.profiler.phase("allocation"):
+            self.allocator.solve(self)
+
+    # Siguiente celda del recorrido de un robot (allocation "tour"); si ya no le quedan, planea
+    # otro con lo que le queda de capacidad y reclama todas sus celdas
+    def nextTourCell(self, robot):
+        with self.profiler.phase("allocation"):
+            if not robot.tour and self.litterCoords:
+                robot.tour = self.tourPlanner.plan(robot.pos, robot.capacity - robot.load, self.litterCoords,
+                                                   self.cellLitter, self.paperBin_pos)
+                for cell in robot.tour:
+                    self.litterCoords.remove(cell)
+            robot.targetCell = robot.tour.pop(0) if robot.tour else ()
+
+    # Siguiente celda de un robot hacia 'objetivo' según la tabla de reservaciones
+    def reservedStep(self, robot, objetivo):
+        if not objetivo:
+            return None
+        with self.profiler.phase("pathfinding"):
+            return self.reservations.next_step(robot, objetivo, self.current_step, self.cellRobots.__getitem__)
 
 # Representacion de los agentes en la animacion con colores
 def get_grid(model):
-    grid_repr = np.zeros((model.grid.width, model.grid.height), dtype=object)
-    grid_colors = np.zeros((model.grid.width, model.grid.height))
-    
-    for (content, (x, y)) in model.grid.coord_iter():
-        has_paper_bin = False  # Variable para rastrear si la celda contiene una papelera
-        
-        for agent in content:
-            # Creacion del contenido de las celdas de acuerdo con su tipo
-            if isinstance(agent, PaperBin):
-                grid_repr[x][y] = "P"
-                grid_colors[x][y] = 4
-                has_paper_bin = True
-            
-            elif isinstance(agent, Litter):
-                grid_repr[x][y] = str(int(grid_repr[x][y]) + 1) if grid_repr[x][y] else "1"
-                grid_colors[x][y] = 2
-            
-            elif isinstance(agent, Wall):
-                grid_repr[x][y] = "X"
-                grid_colors[x][y] = 3
-            
-            elif isinstance(agent, Robot):
-                if not has_paper_bin:  # Solo se coloca un robot si no hay una papelera en la celda
-                    grid_repr[x][y] = "S"
-                    grid_colors[x][y] = 1
-            
-            else:
-                grid_repr[x][y] = "0"
-                grid_colors[x][y] = 0
-    
-    return grid_repr, grid_colors
+    return model.gridSnapshot()
+
+
+# Lee un archivo de input y regresa el mapa como lista de filas con los códigos de texto, sin la
+# línea de dimensiones (lo usan fleet.py y las herramientas que modifican el mapa). Para construir
+# un GameBoard, GridLayer.from_file lee y valida el archivo directo a arreglos de NumPy.
+def load_gameboard(path):
+    with open(path) as file:
+        return [line.split() for line in file.read().splitlines() if line][1:]
+
+
+# Animación de la simulación a partir de lo registrado por el TrajectoryRecorder del modelo.
+# matplotlib se importa dentro de render.py para que las ejecuciones sin visualización no lo carguen.
+# Regresa la ruta del archivo escrito (un .gif si no hay ffmpeg).
+def render_animation(model, step_count, filename="cleaningRobots.mp4"):
+    from render import export_video
+    return export_video(model.recorder, filename, frames=step_count)
 
 
 # --- Ejecucion y visualizacion del grid. Parámetros iniciales del modelo ---
 ROBOTS = 5
-step_count = 0
-gameboard = [line.split() for line in open('./inputs/input1.txt').read().splitlines() if line][1:]
-GRID_SIZE_X = len(gameboard)
-GRID_SIZE_Y = len(gameboard[0])
+INPUT_FILE = './inputs/input1.txt'
+# Corrida en formato binario que sirve Server/tc2008B_server.py
+RUN_FILE = './outputs/model.run'
+# logging.DEBUG para ver cada paso, logging.CRITICAL + 1 para no imprimir nada
+LOG_LEVEL = logging.INFO
+# Perfil por fases de la corrida (.csv, .json o .folded); None para no medir
+PROFILE_FILE = None
 
-model = GameBoard(GRID_SIZE_X, GRID_SIZE_Y, gameboard, ROBOTS)
+def main():
+    step_count = 0
+    gameboard = GridLayer.from_file(INPUT_FILE)
+    GRID_SIZE_X = gameboard.width
+    GRID_SIZE_Y = gameboard.height
 
-##NOTA: SI QUIERES UNA VISUALIZACIÓN SIN UNITY, DESCOMENTA ESTE CODIGO Y COMENTA EL RESTANTE##
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
+    model = GameBoard(GRID_SIZE_X, GRID_SIZE_Y, gameboard, ROBOTS, profile=PROFILE_FILE is not None)
 
-while model.simulation_continue:
-    model.step()
-    step_count += 1
+    ##NOTA: SI QUIERES UNA VISUALIZACIÓN SIN UNITY, DESCOMENTA ESTE CODIGO Y COMENTA EL RESTANTE##
 
-#Optiene todos los colores y registros de celdas por el tipo de agente
-all_grid_repr = model.datacollector.get_model_vars_dataframe()["GridRepr"]
-all_grid_colors = model.datacollector.get_model_vars_dataframe()["GridColors"]
+    while model.simulation_continue:
+        model.step()
+        step_count += 1
 
-#---- Colores puestos para los agentes -----
-my_cmap = ListedColormap(['snow', 'slategray', 'thistle', 'black', 'skyblue'])
+    save_run(model.recorder, RUN_FILE, ROBOTS)
+    if PROFILE_FILE:
+        model.profiler.save(PROFILE_FILE)
+        log.info(model.profiler.summary())
+    render_animation(model, step_count)
 
-fig, axis = plt.subplots(figsize=(7, 7))
 
+if __name__ == "__main__":
+    main()
 
-def animate(i):
-    
-    axis.clear()
-    grid_data_repr = all_grid_repr.iloc[i]
-    grid_data_colors = all_grid_colors.iloc[i]
-    axis.imshow(grid_data_colors, cmap=my_cmap)
-    for x in range(GRID_SIZE_X):
-        for y in range(GRID_SIZE_Y):
-            num = grid_data_repr[x][y]
-            color = 'black'  # Color por defecto
-            
-            # Buscar si hay un robot o papelera en la celda
-            robot = next((agent for agent in model.grid.get_cell_list_contents([(x, y)]) if isinstance(agent, Robot)), None)
-            paper_bin = next((agent for agent in model.grid.get_cell_list_contents([(x, y)]) if isinstance(agent, PaperBin)), None)
-            
-            # Si hay una papelera y un robot en la celda, mostrar el robot encima
-            if paper_bin and robot:
-                num = 'S'
-                color = 'white'  # El color del texto del robot sera blanco para que sea visible sobre la papelera
-                
-            # Cambiar el color del texto en funcion del tipo de agente en la celda
-            elif str(num).isdigit():
-                color = 'black'
-            else:
-                color = 'white'
-            
-            if num != "0":
-                axis.annotate(num, xy=(y, x), ha='center', va='center', color=color)
-
-    axis.set_xlim(-0.5, GRID_SIZE_Y - 0.5)
-    axis.set_ylim(-0.5, GRID_SIZE_X - 0.5)
-    axis.invert_yaxis()
-    axis.annotate(f'Step: {i+1}', xy=(0.5, 1.05), xycoords='axes fraction', ha='center', va='center', fontsize=12, color='black')
-# animacion de la simulacion
-anim = animation.FuncAnimation(fig, animate, frames=step_count, repeat=False)
-anim.save(filename="cleaningRobots.mp4")
-
-##NOTA: SI QUIERES UNA VISUALIZACIÓN En UNITY, DESCOMENTA ESTE CODIGO Y COMENTA EL DE ARRIBA (DESDE EL WHILE)##
-
-# class Server(BaseHTTPRequestHandler):
-
-#     def _set_response(self):
-#         self.send_response(200)
-#         self.send_header('Content-type', 'text/html')
-#         self.end_headers()
-
-#     def do_GET(self):
-#         self._set_response()
-#         self.wfile.write("GET request for {}".format(self.path).encode('utf-8'))
-
-#     def do_POST(self):
-        
-#         if model.simulation_continue == True:
-#             model.step()
-#             grid = get_grid(model)[0]
-#         else:
-#             grid
-#             return
-
-#         self._set_response()
-#         self.wfile.write(str(grid).encode('utf-8'))
-
-# def run(server_class=HTTPServer, handler_class=Server, port=8585):
-#     logging.basicConfig(level=logging.INFO)
-#     server_address = ('', port)
-#     httpd = server_class(server_address, handler_class)
-#     logging.info("Starting httpd...\n")
-#     try:
-#         httpd.serve_forever()
-#     except KeyboardInterrupt:
-#         pass
-#     httpd.server_close()
-#     logging.info("Stopping httpd...\n")
-    
-# run()
\ No newline at end of file
+##NOTA: PARA UNA VISUALIZACIÓN EN UNITY, Server/stream_server.py corre el modelo en vivo y
+## Server/tc2008B_server.py reproduce la corrida guardada en RUN_FILE##
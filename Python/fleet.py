@@ -0,0 +1,307 @@
+# Motor alternativo para flotas grandes (cientos de robots). En lugar de un objeto Robot por
+# agente que se activa uno por uno, la flota se guarda como arreglos de NumPy (posiciones,
+# cargas y estados) y todos los robots eligen y resuelven su movimiento a la vez.
+#
+# Sigue las mismas reglas que Robot.step:
+#   - primero se explora el mapa: cada robot descubre su celda y los muros a su alrededor
+#   - después se recoge la basura, hasta CAPACITY por robot, y se vacía en la papelera
+#   - un robot por celda (salvo la celda inicial, donde empiezan todos) y los muros bloquean
+#   - al explorar los caminos solo ven los muros; al limpiar y al ir a la papelera también
+#     rodean a los demás robots, y mientras hay un robot en la papelera no hay camino hacia ella
+#     (la papelera solo la bloquea un robot, así que los que limpian pueden pasar por ella)
+#   - un robot que limpia y no puede avanzar porque otro ocupa su siguiente celda se mueve al
+#     azar; si explora o va a la papelera espera. Dos robots nunca se intercambian
+#   - un robot sin camino espera, salvo si está sobre la papelera o explorando (se mueve al azar)
+#   - un robot sin nada que hacer se mueve al azar sin entrar a la papelera
+#
+# Con muchos robots estas reglas pueden atorar a la flota para siempre (por ejemplo, los que van
+# a la papelera tapando la salida de los que limpian junto a ella, que a su vez les tapan la
+# papelera). Como aquí todos se mueven a la vez esto pasa más seguido que en GameBoard, así que,
+# a diferencia de Robot.step, un robot que lleva PATIENCE pasos sin moverse se mueve al azar.
+#
+# La diferencia es cómo se elige el destino: en lugar de que cada robot tome su propia celda
+# objetivo y haga su propio BFS, todos siguen campos de distancias compartidos (celdas sin
+# explorar, celdas con basura y papelera), como la exploración "frontier" de GameBoard. Los
+# campos solo ven los muros; si algún robot tiene a otro en su siguiente celda, los de su estado
+# usan el mismo campo calculado sobre las posiciones de los robots al inicio del paso. Como en
+# GameBoard un robot que entra a la papelera la bloquea, después de que uno entra los demás que
+# van a ella ya no avanzan en ese paso.
+import numpy as np
+
+from gridlayer import UNKNOWN, FREE, WALL, GridLayer
+from pathfinding import NEIGHBOR_OFFSETS, DistanceField, OccupancyGraph
+
+CAPACITY = 5
+
+# Pasos sin moverse después de los cuales un robot se mueve al azar
+PATIENCE = 10
+
+# Estados de un robot
+EXPLORE = 0
+CLEAN = 1
+TO_BIN = 2
+DONE = 3
+
+OFFSETS = np.array(NEIGHBOR_OFFSETS)
+
+
+class FleetEngine:
+
+    def __init__(self, gameboard, robots_count, seed=None):
+        layer = GridLayer.from_codes([['0' if cell == 'S' else cell for cell in row] for row in gameboard])
+        self.width = layer.width
+        self.height = layer.height
+        self.rng = np.random.default_rng(seed)
+
+        self.wall = layer.kind == WALL
+        self.litter = layer.litter.astype(np.int32)
+        self.initial_litter = int(self.litter.sum())
+        # Basura vaciada en la papelera y viajes a la papelera
+        self.delivered = 0
+        self.trips = 0
+
+        codes = np.array(gameboard)
+        self.paperBin_pos = tuple(int(v) for v in np.argwhere(codes == 'P')[0])
+        # Todos los robots empiezan en la celda 'S'
+        self.start = tuple(int(v) for v in np.argwhere(codes == 'S')[0])
+
+        # Estado de la flota, un renglón por robot
+        self.pos = np.tile(np.array(self.start), (robots_count, 1))
+        self.load = np.zeros(robots_count, dtype=np.int32)
+        self.state = np.full(robots_count, EXPLORE, dtype=np.uint8)
+        self.still = np.zeros(robots_count, dtype=np.int32)
+
+        # Robots por celda
+        self.occupancy = np.zeros((self.width, self.height), dtype=np.int32)
+        self.occupancy[self.start] = robots_count
+
+        # Mapa que van descubriendo los robots y sus grafos (los muros se conocen al estar junto a
+        # ellos): uno solo con los muros y otro que además bloquea las celdas con robots
+        self.known = GridLayer(self.width, self.height)
+        self.graph = OccupancyGraph(self.width, self.height)
+        self.posGraph = OccupancyGraph(self.width, self.height)
+        self.frontierField = DistanceField(self.graph)
+        self.litterField = DistanceField(self.graph)
+        self.binField = DistanceField(self.graph)
+        # Los mismos campos rodeando a los robots, para cuando alguno tiene a otro en su siguiente celda
+        self.litterDetour = DistanceField(self.posGraph)
+        self.binDetour = DistanceField(self.posGraph)
+
+        self.current_step = 0
+        self.step_exploration_done = 0
+        self.finished = False
+        self.reveal()
+
+    # Cada robot marca su celda como explorada y descubre los muros vecinos
+    def reveal(self):
+        xs, ys = self.pos[:, 0], self.pos[:, 1]
+        self.known.kind[xs, ys] = np.where(self.known.kind[xs, ys] == UNKNOWN, FREE, self.known.kind[xs, ys])
+
+        nx, ny, inside = self.neighbors(self.pos)
+        walls = inside & self.wall[nx, ny]
+        for x, y in zip(nx[walls].tolist(), ny[walls].tolist()):
+            if self.known.kind[x, y] != WALL:
+                self.known.kind[x, y] = WALL
+                self.graph.set_cell((x, y), WALL)
+                self.posGraph.set_cell((x, y), WALL)
+
+    # Celdas vecinas de cada posición, en el orden de NEIGHBOR_OFFSETS: (xs, ys, dentro_del_mapa)
+    def neighbors(self, pos):
+        nx = pos[:, 0, None] + OFFSETS[:, 0]
+        ny = pos[:, 1, None] + OFFSETS[:, 1]
+        inside = (nx >= 0) & (nx < self.width) & (ny >= 0) & (ny < self.height)
+        return np.clip(nx, 0, self.width - 1), np.clip(ny, 0, self.height - 1), inside
+
+    # Siguiente celda de cada robot bajando por un campo de distancias, sin entrar a celdas
+    # bloqueadas de su grafo (como DistanceField.next_step); la misma celda si no hay camino
+    def downhill(self, field, robots):
+        dist = np.array(field.dist).reshape(self.width, self.height)
+        blocked = np.frombuffer(field.graph.blocked, dtype=np.uint8).reshape(self.width, self.height)
+        pos = self.pos[robots]
+        current = dist[pos[:, 0], pos[:, 1]]
+
+        nx, ny, inside = self.neighbors(pos)
+        step = inside & (dist[nx, ny] == current[:, None] - 1) & (current[:, None] > 0) & (blocked[nx, ny] == 0)
+        has_step = step.any(axis=1)
+        choice = step.argmax(axis=1)
+
+        rows = np.arange(len(robots))
+        target = np.where(has_step[:, None],
+                          np.stack([nx[rows, choice], ny[rows, choice]], axis=1), pos)
+        return target, has_step
+
+    # Una celda vecina libre al azar para cada robot (sin muros, robots ni la papelera)
+    def random_neighbors(self, robots):
+        pos = self.pos[robots]
+        nx, ny, inside = self.neighbors(pos)
+        free = inside & ~self.wall[nx, ny] & (self.occupancy[nx, ny] == 0)
+        free &= ~((nx == self.paperBin_pos[0]) & (ny == self.paperBin_pos[1]))
+
+        keys = self.rng.random(free.shape) * free
+        choice = keys.argmax(axis=1)
+        rows = np.arange(len(robots))
+        target = np.stack([nx[rows, choice], ny[rows, choice]], axis=1)
+        return target, free.any(axis=1)
+
+    # Aplica los movimientos pedidos. Un robot solo entra a una celda vacía y, si varios piden
+    # la misma celda, gana el que va primero en 'rank'. Se repite por rondas para que un robot
+    # pueda ocupar la celda que otro acaba de dejar (como cuando se activaban uno por uno).
+    # Regresa una máscara de los robots (de 'robots') que sí se movieron.
+    def apply_moves(self, robots, targets, rank):
+        moved = np.zeros(len(robots), dtype=bool)
+        flat_targets = targets[:, 0] * self.height + targets[:, 1]
+
+        while True:
+            candidates = np.flatnonzero(~moved & (self.occupancy[targets[:, 0], targets[:, 1]] == 0))
+            if len(candidates) == 0:
+                break
+
+            candidates = candidates[np.argsort(rank[robots[candidates]], kind='stable')]
+            _, first = np.unique(flat_targets[candidates], return_index=True)
+            winners = candidates[first]
+
+            agents = robots[winners]
+            np.subtract.at(self.occupancy, (self.pos[agents, 0], self.pos[agents, 1]), 1)
+            self.pos[agents] = targets[winners]
+            self.occupancy[targets[winners, 0], targets[winners, 1]] += 1
+            moved[winners] = True
+
+        return moved
+
+    def step(self):
+        if self.finished:
+            return
+
+        # Orden de prioridad aleatorio en cada paso, como RandomActivation
+        rank = self.rng.permutation(len(self.pos))
+
+        if (self.state == EXPLORE).any():
+            self.update_frontier()
+        self.update_litter()
+        if (self.state == TO_BIN).any() and self.binField.key != self.graph.version:
+            self.binField.compute([self.paperBin_pos], self.graph.version)
+
+        # Destino de cada robot según su estado
+        targets = self.pos.copy()
+        heading = np.zeros(len(self.pos), dtype=bool)
+        fields = ((EXPLORE, self.frontierField, None), (CLEAN, self.litterField, self.litterDetour),
+                  (TO_BIN, self.binField, self.binDetour))
+        for state, field, detour in fields:
+            robots = np.flatnonzero(self.state == state)
+            # Mientras hay un robot en la papelera no hay camino hacia ella
+            if state == TO_BIN and self.occupancy[self.paperBin_pos]:
+                continue
+            if len(robots):
+                targets[robots], heading[robots] = self.downhill(field, robots)
+
+            # Como los caminos de GameBoard sobre el mapa de posiciones: si alguno tiene a otro robot
+            # en su siguiente celda, todos los de este estado rodean a los robots (o esperan si no
+            # hay otro camino)
+            crowded = heading[robots] & (self.occupancy[targets[robots, 0], targets[robots, 1]] > 0)
+            if detour is not None and crowded.any():
+                self.update_detour(detour, self.litterField if state == CLEAN else self.binField)
+                targets[robots], heading[robots] = self.downhill(detour, robots)
+
+        # Primero los que entran a la papelera (uno a lo más); si alguien entró, los demás que van
+        # a ella ya no tienen camino en este paso
+        moved = np.zeros(len(self.pos), dtype=bool)
+        to_bin = heading & (targets[:, 0] == self.paperBin_pos[0]) & (targets[:, 1] == self.paperBin_pos[1])
+        robots = np.flatnonzero(to_bin)
+        moved[robots] = self.apply_moves(robots, targets[robots], rank)
+
+        rest = heading & ~to_bin
+        if moved[robots].any():
+            rest &= self.state != TO_BIN
+        robots = np.flatnonzero(rest)
+        moved[robots] = self.apply_moves(robots, targets[robots], rank)
+
+        # Como en Robot.step se mueven al azar (nunca a una celda ocupada ni a la papelera): los que
+        # limpian y quedaron bloqueados, los que exploran sin camino, los que quedaron sin camino
+        # sobre la papelera y los que ya terminaron. Los demás esperan, salvo si ya esperaron
+        # PATIENCE pasos
+        on_bin = (self.pos[:, 0] == self.paperBin_pos[0]) & (self.pos[:, 1] == self.paperBin_pos[1])
+        wandering = np.flatnonzero(~moved & (((self.state == CLEAN) & heading)
+                                             | ((self.state == EXPLORE) & ~heading)
+                                             | (on_bin & ~heading) | (self.state == DONE)
+                                             | (self.still >= PATIENCE)))
+        if len(wandering):
+            random_targets, has_move = self.random_neighbors(wandering)
+            moved[wandering[has_move]] = self.apply_moves(wandering[has_move], random_targets[has_move], rank)
+        self.still = np.where(moved, 0, self.still + 1)
+
+        self.reveal()
+        self.collect()
+        self.current_step += 1
+
+    # Campo 'detour' con los mismos objetivos que 'field' sobre el grafo de posiciones, que marca
+    # las celdas ocupadas por robots al inicio del paso
+    def update_detour(self, detour, field):
+        blocked = bytearray(((self.known.kind == WALL) | (self.occupancy > 0)).astype(np.uint8).tobytes())
+        if blocked != self.posGraph.blocked:
+            self.posGraph.blocked = blocked
+            self.posGraph.version += 1
+
+        key = (field.key, self.posGraph.version)
+        if detour.key != key:
+            detour.compute(field.targets, key)
+
+    # Campo hacia las celdas sin explorar; al no quedar ninguna alcanzable termina la exploración
+    def update_frontier(self):
+        unexplored_mask = self.known.kind == UNKNOWN
+        key = (self.graph.version, int(np.count_nonzero(unexplored_mask)))
+        if self.frontierField.key != key:
+            self.frontierField.compute([tuple(cell) for cell in np.argwhere(unexplored_mask).tolist()], key)
+
+        dist = np.array(self.frontierField.dist).reshape(self.width, self.height)
+        if not (dist[self.pos[:, 0], self.pos[:, 1]] > 0).any():
+            self.state[self.state == EXPLORE] = CLEAN
+            self.step_exploration_done = self.current_step
+
+    # Campo hacia las celdas con basura, se recalcula solo cuando alguna celda se vacía
+    def update_litter(self):
+        key = (int(np.count_nonzero(self.litter)), self.graph.version)
+        if self.litterField.key != key:
+            cells = [tuple(cell) for cell in np.argwhere(self.litter > 0).tolist()]
+            self.litterField.compute(cells, key)
+
+    # Recoger basura, vaciarla en la papelera y cambiar de estado
+    def collect(self):
+        cleaning = np.flatnonzero(self.state == CLEAN)
+        xs, ys = self.pos[cleaning, 0], self.pos[cleaning, 1]
+        # Solo hay un robot por celda (fuera de la inicial, que no tiene basura)
+        taken = np.minimum(CAPACITY - self.load[cleaning], self.litter[xs, ys])
+        self.litter[xs, ys] -= taken
+        self.load[cleaning] += taken
+
+        self.state[(self.state == CLEAN) & (self.load == CAPACITY)] = TO_BIN
+
+        at_bin = (self.state == TO_BIN) & (self.pos[:, 0] == self.paperBin_pos[0]) & (self.pos[:, 1] == self.paperBin_pos[1])
+        self.delivered += int(self.load[at_bin].sum())
+        self.trips += int(np.count_nonzero(self.load[at_bin]))
+        self.load[at_bin] = 0
+        self.state[at_bin] = CLEAN
+
+        if not (self.state == EXPLORE).any() and not self.litter.any():
+            self.state[(self.state == CLEAN) & (self.load > 0)] = TO_BIN
+            self.state[(self.state == CLEAN) & (self.load == 0)] = DONE
+            self.finished = bool((self.state == DONE).all())
+
+    # Verifica las reglas de la flota; regresa una lista de problemas (vacía si todo está bien)
+    def check(self):
+        problems = []
+        counts = np.bincount(self.pos[:, 0] * self.height + self.pos[:, 1],
+                             minlength=self.width * self.height).reshape(self.width, self.height)
+
+        shared = counts > 1
+        shared[self.start] = False
+        if shared.any():
+            problems.append("dos robots en la misma celda")
+        if self.wall[self.pos[:, 0], self.pos[:, 1]].any():
+            problems.append("un robot sobre un muro")
+        if (self.load > CAPACITY).any() or (self.load < 0).any():
+            problems.append("carga fuera de rango")
+        if int(self.litter.sum()) + int(self.load.sum()) + self.delivered != self.initial_litter:
+            problems.append("la basura no se conserva")
+        if not np.array_equal(counts, self.occupancy):
+            problems.append("la ocupación no coincide con las posiciones")
+        return problems
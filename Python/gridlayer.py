@@ -0,0 +1,116 @@
+# Capa de mapa codificada con enteros. Reemplaza a los arreglos de texto ('', '0', 'X',
+# 'S', 'P', '1'..'8') que usaban los robots: el tipo de celda y la cantidad de basura se
+# guardan en dos arreglos uint8, lo que permite consultar el mapa completo con operaciones
+# de NumPy en lugar de comparar texto celda por celda.
+import numpy as np
+
+# Tipos de celda
+UNKNOWN = 0  # ''  celda sin explorar
+FREE = 1     # '0' celda libre (o con basura, ver GridLayer.litter)
+WALL = 2     # 'X'
+ROBOT = 3    # 'S'
+BIN = 4      # 'P'
+ROBOT_BIN = 5  # robot encima de la papelera (solo en los cuadros del grid completo)
+
+# Código de texto de cada tipo de celda, en el mismo orden que las constantes
+KIND_CODES = np.array(['', '0', 'X', 'S', 'P', 'P'])
+
+
+class GridLayer:
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.kind = np.zeros((width, height), dtype=np.uint8)
+        self.litter = np.zeros((width, height), dtype=np.uint8)
+
+    # Construye una capa a partir de una matriz con los códigos de texto del input
+    @classmethod
+    def from_codes(cls, matrix):
+        codes = np.array(matrix, dtype=str)
+        layer = cls(*codes.shape)
+        numeric = np.char.isdigit(codes)
+
+        layer.kind[numeric] = FREE
+        layer.kind[codes == 'X'] = WALL
+        layer.kind[codes == 'S'] = ROBOT
+        layer.kind[codes == 'P'] = BIN
+        layer.litter[numeric] = codes[numeric].astype(np.uint8)
+        return layer
+
+    def set(self, pos, kind, litter=0):
+        self.kind[pos] = kind
+        self.litter[pos] = litter
+
+    # Celdas que no pueden ser destino de un movimiento (muros y robots)
+    def blocked_mask(self):
+        return (self.kind == WALL) | (self.kind == ROBOT)
+
+    def unexplored_mask(self):
+        return self.kind == UNKNOWN
+
+    # Celdas conocidas con basura
+    def litter_mask(self):
+        return (self.kind == FREE) & (self.litter > 0)
+
+    # Lee un archivo de input (encabezado 'filas columnas' y una fila de códigos por línea) sin
+    # cargarlo completo en memoria: cada fila se convierte con NumPy directo a los arreglos de
+    # la capa. Las filas se validan contra las dimensiones del encabezado y los códigos contra
+    # los que entiende el modelo; cualquier error indica la línea del archivo.
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as file:
+            header = file.readline().split()
+            if len(header) != 2 or not all(value.isdigit() for value in header):
+                raise ValueError(f"{path}:1: se esperaba el encabezado 'filas columnas'")
+            rows, columns = int(header[0]), int(header[1])
+            layer = cls(rows, columns)
+
+            row = 0
+            for line_number, line in enumerate(file, start=2):
+                tokens = line.split()
+                if not tokens:
+                    continue
+                if row == rows:
+                    raise ValueError(f"{path}:{line_number}: el archivo tiene más de {rows} filas")
+                if len(tokens) != columns:
+                    raise ValueError(f"{path}:{line_number}: {len(tokens)} celdas, se esperaban {columns}")
+                layer.set_row(row, tokens, f"{path}:{line_number}")
+                row += 1
+
+        if row != rows:
+            raise ValueError(f"{path}: el archivo tiene {row} filas, se esperaban {rows}")
+        return layer
+
+    # Escribe una fila a partir de sus códigos de texto. Si todos los códigos son de un solo
+    # carácter (el caso común) la fila se convierte como bytes, sin crear un arreglo de texto.
+    def set_row(self, row, tokens, where=""):
+        chars = "".join(tokens)
+        if len(chars) == len(tokens) and chars.isascii():
+            codes = np.frombuffer(chars.encode('ascii'), dtype=np.uint8)
+            numeric = (codes >= ord('0')) & (codes <= ord('9'))
+            litter = codes[numeric] - ord('0')
+            values = [ord('X'), ord('S'), ord('P')]
+        else:
+            codes = np.array(tokens)
+            numeric = np.char.isdigit(codes)
+            litter = codes[numeric].astype(np.int64)
+            values = ['X', 'S', 'P']
+
+        kinds = np.select([numeric, codes == values[0], codes == values[1], codes == values[2]],
+                          [FREE, WALL, ROBOT, BIN], UNKNOWN)
+        if (kinds == UNKNOWN).any():
+            raise ValueError(f"{where}: código desconocido {tokens[int(np.argmax(kinds == UNKNOWN))]!r}")
+        if (litter > 255).any():
+            raise ValueError(f"{where}: más de 255 basuras en una celda")
+
+        self.kind[row] = kinds
+        self.litter[row][numeric] = litter
+
+    # Representación con los códigos de texto originales, para visualizar o depurar
+    def to_codes(self):
+        codes = KIND_CODES[self.kind]
+        return np.where(self.litter > 0, self.litter.astype(str), codes)
+
+    def __str__(self):
+        return str(self.to_codes())
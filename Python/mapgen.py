@@ -0,0 +1,67 @@
+# Generador de mapas sintéticos con el mismo formato que los archivos de inputs, para probar
+# cómo escala la simulación en pisos grandes (de 100x100 hasta 1000x1000).
+#
+# El piso se divide en cuartos de 'room' x 'room' celdas separados por muros; cada muro entre
+# dos cuartos vecinos tiene al menos una puerta, así que todas las celdas libres quedan
+# conectadas. La basura se reparte al azar en las celdas libres, la salida (S) queda en una
+# esquina y la papelera (P) en el centro.
+#
+# Uso (desde la carpeta Python):
+#   python mapgen.py 200 200 inputs/synthetic-200.txt [semilla]
+import random
+import sys
+
+WALL = 'X'
+FREE = '0'
+
+
+def generate_map(width, height, room=10, doors=2, litter_density=0.1, max_litter=8, seed=0):
+    rng = random.Random(seed)
+    gameboard = [[FREE] * height for _ in range(width)]
+
+    # Líneas de muros cada 'room' celdas en ambos ejes
+    wall_xs = range(room, width - 1, room)
+    wall_ys = range(room, height - 1, room)
+    for x in wall_xs:
+        for y in range(height):
+            gameboard[x][y] = WALL
+    for y in wall_ys:
+        for x in range(width):
+            gameboard[x][y] = WALL
+
+    # Puertas en cada tramo de muro entre dos cuartos (sin tocar los cruces de muros)
+    for x in wall_xs:
+        for start in range(0, height, room):
+            span = [y for y in range(start, min(start + room, height)) if y not in wall_ys]
+            for y in rng.sample(span, min(doors, len(span))):
+                gameboard[x][y] = FREE
+    for y in wall_ys:
+        for start in range(0, width, room):
+            span = [x for x in range(start, min(start + room, width)) if x not in wall_xs]
+            for x in rng.sample(span, min(doors, len(span))):
+                gameboard[x][y] = FREE
+
+    for x in range(width):
+        for y in range(height):
+            if gameboard[x][y] == FREE and rng.random() < litter_density:
+                gameboard[x][y] = str(rng.randint(1, max_litter))
+
+    # Salida en una esquina y papelera en la celda libre más cercana al centro
+    gameboard[0][0] = 'S'
+    center = min(((x, y) for x in range(width) for y in range(height) if gameboard[x][y] != WALL and (x, y) != (0, 0)),
+                 key=lambda cell: abs(cell[0] - width // 2) + abs(cell[1] - height // 2))
+    gameboard[center[0]][center[1]] = 'P'
+    return gameboard
+
+
+def write_map(gameboard, path):
+    with open(path, 'w') as file:
+        file.write(f"{len(gameboard)} {len(gameboard[0])}\n")
+        for row in gameboard:
+            file.write(" ".join(row) + " \n")
+
+
+if __name__ == '__main__':
+    width, height = int(sys.argv[1]), int(sys.argv[2])
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+    write_map(generate_map(width, height, seed=seed), sys.argv[3])
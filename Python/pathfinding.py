@@ -0,0 +1,350 @@
+# Motor de búsqueda de caminos que usan los robots para moverse por el mapa.
+# Las celdas se identifican con un índice plano (x * height + y), de modo que las
+# marcas de visitado y los padres de cada celda viven en arreglos de tamaño fijo
+# en lugar de copiar el camino completo para cada vecino encolado.
+from collections import deque
+from functools import lru_cache
+
+from gridlayer import ROBOT, WALL
+
+# Orden en que se recorren los vecinos de una celda. Es el mismo orden en el que
+# se construían las conexiones del grafo, por lo que los caminos no cambian.
+NEIGHBOR_OFFSETS = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if di != 0 or dj != 0]
+
+
+# Vecinos dentro del mapa de cada celda, como una tupla por celda. Solo dependen de las
+# dimensiones, así que todos los grafos del mismo tamaño comparten la misma tabla (nadie la
+# modifica). Todas las tuplas apuntan al mismo entero por celda (los de 'ids'), en lugar de
+# crear ocho enteros nuevos por celda: cada columna de vecinos es 'ids' recorrida por el
+# desplazamiento de esa dirección, así que se arma con rebanadas de listas y solo las celdas
+# del borde se corrigen una por una.
+@lru_cache(maxsize=8)
+def neighbor_table(width, height):
+    size = width * height
+    ids = list(range(size))
+    columns = []
+    for dx, dy in NEIGHBOR_OFFSETS:
+        delta = dx * height + dy
+        if delta > 0:
+            columns.append(ids[delta:] + [None] * delta)
+        else:
+            columns.append([None] * -delta + ids[:size + delta])
+    table = list(zip(*columns))
+
+    border = {(x, y) for x in (0, width - 1) for y in range(height)}
+    border |= {(x, y) for x in range(width) for y in (0, height - 1)}
+    for x, y in border:
+        table[x * height + y] = tuple(ids[(x + dx) * height + y + dy]
+                                      for dx, dy in NEIGHBOR_OFFSETS
+                                      if 0 <= x + dx < width and 0 <= y + dy < height)
+    return table
+
+
+# Grafo de celdas que se conserva entre pasos. En lugar de reconstruir las conexiones
+# de todo el mapa, solo se actualiza la celda que cambia:
+#   - un muro (WALL) no tiene conexiones de salida
+#   - un muro o un robot (ROBOT) no puede ser destino de ninguna conexión
+class OccupancyGraph:
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+        # Vecinos dentro del mapa de cada celda, precalculados una sola vez por tamaño de mapa
+        self.neighbors = neighbor_table(width, height)
+
+        self.wall = bytearray(width * height)
+        self.blocked = bytearray(width * height)
+
+        # Aumenta cada vez que cambia alguna conexión del grafo
+        self.version = 0
+
+    # Construye el grafo completo a partir de una GridLayer con operaciones de NumPy
+    @classmethod
+    def from_layer(cls, layer):
+        graph = cls(layer.width, layer.height)
+        graph.wall = bytearray((layer.kind == WALL).astype('uint8').tobytes())
+        graph.blocked = bytearray(layer.blocked_mask().astype('uint8').tobytes())
+        return graph
+
+    # Actualiza las conexiones de una celda de acuerdo con su nuevo tipo
+    def set_cell(self, pos, kind):
+        cell = pos[0] * self.height + pos[1]
+        wall = kind == WALL
+        blocked = wall or kind == ROBOT
+
+        if self.wall[cell] != wall or self.blocked[cell] != blocked:
+            self.wall[cell] = wall
+            self.blocked[cell] = blocked
+            self.version += 1
+
+    # Conexiones de salida de una celda, en el mismo formato que el grafo de diccionario
+    def __getitem__(self, pos):
+        cell = pos[0] * self.height + pos[1]
+        if self.wall[cell]:
+            return []
+        return [divmod(n, self.height) for n in self.neighbors[cell] if not self.blocked[n]]
+
+
+class Pathfinder:
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+        # Padre de cada celda en el árbol del BFS y número de búsqueda en el que se visitó.
+        # Usar un contador de búsquedas evita limpiar el arreglo de visitados en cada llamada.
+        self.parent = [-1] * (width * height)
+        self.visited = [0] * (width * height)
+        self.search_id = 0
+        # Celdas sacadas de la cola en todas las búsquedas
+        self.expanded = 0
+
+    def cell_id(self, pos):
+        return pos[0] * self.height + pos[1]
+
+    def cell_pos(self, cell_id):
+        return divmod(cell_id, self.height)
+
+    # Breadth-First Search de 'inicio' a 'objetivo' sobre un OccupancyGraph. Regresa la lista
+    # de celdas del camino (incluyendo ambas puntas) o None si no existe un camino.
+    def bfs(self, grafo, inicio, objetivo):
+
+        if inicio == objetivo:
+            return [inicio]
+
+        # Sin celda objetivo (por ejemplo, un targetCell vacío) no hay camino posible
+        if not objetivo:
+            return None
+
+        height = self.height
+        start_id = inicio[0] * height + inicio[1]
+        goal_id = objetivo[0] * height + objetivo[1]
+
+        # Un muro no tiene conexiones y el objetivo bloqueado no se puede alcanzar
+        if grafo.wall[start_id] or grafo.blocked[goal_id]:
+            return None
+
+        self.search_id += 1
+        search_id = self.search_id
+        visited = self.visited
+        parent = self.parent
+        neighbors = grafo.neighbors
+        blocked = grafo.blocked
+
+        visited[start_id] = search_id
+        cola = deque([start_id])
+        expanded = 0
+
+        while cola:
+            nodo_id = cola.popleft()
+            expanded += 1
+
+            for vecino_id in neighbors[nodo_id]:
+
+                # La primera vez que se encola una celda define su camino más corto,
+                # igual que en la versión que guardaba el camino completo en la cola
+                if visited[vecino_id] != search_id and not blocked[vecino_id]:
+                    visited[vecino_id] = search_id
+                    parent[vecino_id] = nodo_id
+
+                    if vecino_id == goal_id:
+                        self.expanded += expanded
+                        return self.rebuild_path(start_id, goal_id)
+                    cola.append(vecino_id)
+
+        #Si no encuentra un camino, devuelve None
+        self.expanded += expanded
+        return None
+
+    # BFS desde 'inicio' hasta la primera celda que pertenezca a 'objetivos' (cualquier
+    # contenedor que soporte 'in'). Regresa el camino a la celda más cercana por distancia
+    # real de recorrido, o None si ninguna es alcanzable.
+    def nearest(self, grafo, inicio, objetivos):
+
+        if inicio in objetivos:
+            return [inicio]
+
+        height = self.height
+        start_id = inicio[0] * height + inicio[1]
+        if grafo.wall[start_id]:
+            return None
+
+        self.search_id += 1
+        search_id = self.search_id
+        visited = self.visited
+        parent = self.parent
+        neighbors = grafo.neighbors
+        blocked = grafo.blocked
+
+        visited[start_id] = search_id
+        cola = deque([start_id])
+        expanded = 0
+
+        while cola:
+            nodo_id = cola.popleft()
+            expanded += 1
+
+            for vecino_id in neighbors[nodo_id]:
+                if visited[vecino_id] != search_id and not blocked[vecino_id]:
+                    visited[vecino_id] = search_id
+                    parent[vecino_id] = nodo_id
+
+                    if divmod(vecino_id, height) in objetivos:
+                        self.expanded += expanded
+                        return self.rebuild_path(start_id, vecino_id)
+                    cola.append(vecino_id)
+
+        self.expanded += expanded
+        return None
+
+    # Camino de 'inicio' a 'objetivo' reutilizando la ruta que el robot ya tenía planeada.
+    # Regresa lo mismo que bfs (el camino desde 'inicio' o None), pero solo hace una búsqueda
+    # completa si cambió el objetivo o el grafo, o si el robot no avanzó sobre su ruta. Cuando
+    # una celda de la ruta quedó bloqueada, la ruta se repara con un desvío desde 'inicio'
+    # hasta la primera celda alcanzable después del bloqueo.
+    def follow(self, route, grafo, inicio, objetivo):
+
+        if inicio == objetivo or not objetivo:
+            route.clear()
+            return self.bfs(grafo, inicio, objetivo)
+
+        if route.goal != objetivo or route.graph is not grafo or not route.advance(inicio):
+            return route.assign(self.bfs(grafo, inicio, objetivo), grafo, objetivo)
+
+        if route.version != grafo.version:
+            path = route.path
+            blocked = grafo.blocked
+            height = self.height
+
+            # Último bloqueo sobre lo que falta de la ruta
+            last_blocked = -1
+            for index in range(route.index + 1, len(path)):
+                cell = path[index]
+                if blocked[cell[0] * height + cell[1]]:
+                    last_blocked = index
+
+            if last_blocked == len(path) - 1:
+                return route.assign(None, grafo, objetivo)
+
+            if last_blocked != -1:
+                rest = path[last_blocked + 1:]
+                detour = self.nearest(grafo, inicio, set(rest))
+                if detour is None:
+                    return route.assign(None, grafo, objetivo)
+                route.assign(detour + rest[rest.index(detour[-1]) + 1:], grafo, objetivo)
+            route.version = grafo.version
+
+        return route.path[route.index:]
+
+    # Reconstruye el camino siguiendo los padres desde el objetivo hasta el inicio
+    def rebuild_path(self, start_id, goal_id):
+        path = []
+        cell = goal_id
+        while cell != start_id:
+            path.append(self.cell_pos(cell))
+            cell = self.parent[cell]
+        path.append(self.cell_pos(start_id))
+        path.reverse()
+        return path
+
+
+# Ruta planeada de un robot que se conserva entre pasos (ver Pathfinder.follow). Guarda el
+# camino completo y el índice de la celda donde está el robot; avanzar es mover el índice.
+class Route:
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.path = None
+        self.index = 0
+        self.goal = None
+        self.graph = None
+        self.version = -1
+
+    # Guarda un camino nuevo calculado sobre 'grafo' y lo regresa
+    def assign(self, path, grafo, objetivo):
+        self.path = path
+        self.index = 0
+        self.goal = objetivo if path else None
+        self.graph = grafo
+        self.version = grafo.version
+        return list(path) if path else path
+
+    # Mueve el índice a 'pos' si el robot sigue sobre la ruta (en la misma celda o en la
+    # siguiente). Regresa False si el robot se salió de la ruta.
+    def advance(self, pos):
+        if self.path is None:
+            return False
+        if self.path[self.index] == pos:
+            return True
+        if self.index + 1 < len(self.path) and self.path[self.index + 1] == pos:
+            self.index += 1
+            return True
+        return False
+
+
+# Campo de distancias hacia un conjunto de celdas objetivo (BFS inverso multi-fuente).
+# Se calcula una sola vez para todos los robots y cada robot elige su siguiente celda
+# consultando al vecino "cuesta abajo", sin hacer su propia búsqueda. El primer vecino
+# cuesta abajo, en el orden de NEIGHBOR_OFFSETS, es el mismo primer paso que daría el BFS.
+class DistanceField:
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.dist = [-1] * (graph.width * graph.height)
+        self.targets = ()
+        self.key = None
+
+    # Recalcula las distancias desde las celdas objetivo. 'key' identifica el estado del
+    # mapa con el que se calculó, para saber cuándo hace falta volver a calcularlo.
+    def compute(self, targets, key=None):
+        graph = self.graph
+        height = graph.height
+        neighbors = graph.neighbors
+        wall = graph.wall
+        blocked = graph.blocked
+
+        dist = [-1] * (graph.width * graph.height)
+        cola = deque()
+
+        for target in targets:
+            cell = target[0] * height + target[1]
+            # Un objetivo bloqueado no se puede alcanzar desde ninguna otra celda
+            if dist[cell] == -1 and not blocked[cell]:
+                dist[cell] = 0
+                cola.append(cell)
+
+        while cola:
+            cell = cola.popleft()
+            next_dist = dist[cell] + 1
+
+            # 'vecino' puede llegar a 'cell' si no es un muro; solo se sigue expandiendo
+            # si además puede ser paso intermedio (no es muro ni robot)
+            for vecino in neighbors[cell]:
+                if dist[vecino] == -1 and not wall[vecino]:
+                    dist[vecino] = next_dist
+                    if not blocked[vecino]:
+                        cola.append(vecino)
+
+        self.dist = dist
+        self.targets = targets
+        self.key = key
+
+    def distance(self, pos):
+        return self.dist[pos[0] * self.graph.height + pos[1]]
+
+    # Siguiente celda del camino más corto desde 'pos', o None si ya está en un objetivo
+    # o no existe un camino
+    def next_step(self, pos):
+        graph = self.graph
+        cell = pos[0] * graph.height + pos[1]
+        current = self.dist[cell]
+        if current <= 0:
+            return None
+
+        for vecino in graph.neighbors[cell]:
+            if self.dist[vecino] == current - 1 and not graph.blocked[vecino]:
+                return divmod(vecino, graph.height)
+        return None
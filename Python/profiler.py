@@ -0,0 +1,150 @@
+# Instrumentación opcional de GameBoard.step. Con GameBoard(..., profile=True) cada paso guarda
+# cuánto tiempo se pasó en cada fase (activación de los robots, búsqueda de caminos, campos de
+# distancias, elección de objetivos, actualización de los mapas y guardado del cuadro) y los
+# contadores del paso (búsquedas hechas y nodos expandidos).
+#
+# Las fases se pueden anidar: el tiempo de cada una es exclusivo (sin el de las fases que se
+# abrieron dentro de ella) y se guarda bajo su ruta completa, por ejemplo "robots;pathfinding".
+# Así el formato "folded" se puede pasar directo a flamegraph.pl o a speedscope.
+#
+# Sin profile, GameBoard usa NullProfiler, cuyas fases no hacen nada.
+import contextlib
+import csv
+import json
+import os
+import time
+from collections import defaultdict
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+class NullProfiler:
+    enabled = False
+
+    def phase(self, name):
+        return _NO_PHASE
+
+    def end_step(self, step, **totals):
+        pass
+
+
+class _Phase:
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.stack.append([self.name, time.perf_counter(), 0.0])
+
+    def __exit__(self, *exc):
+        self.profiler.close_phase()
+
+
+class StepProfiler:
+    enabled = True
+
+    def __init__(self):
+        # Un renglón por paso: {"step", "total", "phases": {ruta: segundos}, "counters": {...}}
+        self.rows = []
+        # Fases abiertas: [nombre, inicio, tiempo de las fases hijas]
+        self.stack = []
+        self.phases = {}
+        self.current = defaultdict(float)
+        # Valores acumulados de los contadores al terminar el paso anterior
+        self.last_totals = {}
+        self.step_start = time.perf_counter()
+
+    def phase(self, name):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = _Phase(self, name)
+        return phase
+
+    def close_phase(self):
+        name, start, children = self.stack.pop()
+        elapsed = time.perf_counter() - start
+        path = ";".join([entry[0] for entry in self.stack] + [name])
+        self.current[path] += elapsed - children
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+    # Cierra el paso. 'totals' son contadores acumulados (por ejemplo search_id del
+    # Pathfinder); en el renglón se guarda cuánto aumentaron durante este paso.
+    def end_step(self, step, **totals):
+        now = time.perf_counter()
+        counters = {name: value - self.last_totals.get(name, 0) for name, value in totals.items()}
+        self.last_totals = totals
+
+        self.rows.append({"step": step, "total": now - self.step_start,
+                          "phases": dict(self.current), "counters": counters})
+        self.current.clear()
+        self.step_start = now
+
+    def phase_names(self):
+        return sorted({path for row in self.rows for path in row["phases"]})
+
+    def counter_names(self):
+        return sorted({name for row in self.rows for name in row["counters"]})
+
+    # Tiempo y contadores de toda la corrida. El tiempo que no cayó en ninguna fase queda en "other"
+    def totals(self):
+        phases = defaultdict(float)
+        counters = defaultdict(int)
+        total = 0.0
+        for row in self.rows:
+            total += row["total"]
+            for path, seconds in row["phases"].items():
+                phases[path] += seconds
+            for name, value in row["counters"].items():
+                counters[name] += value
+        phases["other"] = total - sum(phases.values())
+        return {"steps": len(self.rows), "total": total, "phases": dict(phases), "counters": dict(counters)}
+
+    def summary(self):
+        totals = self.totals()
+        total = totals["total"] or 1.0
+        lines = [f"{totals['steps']} pasos en {totals['total']:.3f} s"]
+        for path, seconds in sorted(totals["phases"].items(), key=lambda item: -item[1]):
+            lines.append(f"  {path:<30} {seconds:9.3f} s {100 * seconds / total:6.1f} %")
+        for name, value in sorted(totals["counters"].items()):
+            lines.append(f"  {name:<30} {value:11}")
+        return "\n".join(lines)
+
+    def to_csv(self, path):
+        phases = self.phase_names()
+        counters = self.counter_names()
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["step", "total"] + phases + counters)
+            for row in self.rows:
+                writer.writerow([row["step"], f"{row['total']:.6f}"]
+                                + [f"{row['phases'].get(name, 0.0):.6f}" for name in phases]
+                                + [row["counters"].get(name, 0) for name in counters])
+
+    def to_json(self, path):
+        with open(path, 'w') as file:
+            json.dump({"totals": self.totals(), "steps": self.rows}, file)
+
+    # Una línea por ruta de fases con sus microsegundos totales, bajo la raíz "step"
+    def to_folded(self, path):
+        with open(path, 'w') as file:
+            for name, seconds in sorted(self.totals()["phases"].items()):
+                stack = "step" if name == "other" else "step;" + name
+                file.write(f"{stack} {max(0, round(seconds * 1e6))}\n")
+
+    # Guarda en el formato que indica la extensión: .csv, .json o .folded
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        extension = os.path.splitext(path)[1]
+        if extension == '.csv':
+            self.to_csv(path)
+        elif extension == '.json':
+            self.to_json(path)
+        elif extension == '.folded':
+            self.to_folded(path)
+        else:
+            raise ValueError(f"Formato de perfil desconocido: {path}")
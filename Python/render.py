@@ -0,0 +1,197 @@
+# Exportación de la animación de una simulación a partir de su TrajectoryRecorder.
+# En lugar de limpiar un eje de matplotlib y volver a anotar cada celda en cada cuadro, se
+# pre-renderiza una sola vez una imagen (tile) por cada combinación de color y texto de celda
+# y cada cuadro se arma copiando esos tiles con NumPy. matplotlib solo dibuja los tiles y el
+# encabezado con el número de paso.
+#
+# Uso (desde la carpeta Python), con un modelo ya simulado:
+#   export_video(model.recorder, "cleaningRobots.mp4")
+#   render_frames_parallel(model.recorder, "outputs/frames", workers=4)
+#   encode_video("outputs/frames", "cleaningRobots.mp4")
+import logging
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgb
+from matplotlib.figure import Figure
+
+from gridlayer import BIN, FREE, ROBOT, ROBOT_BIN, WALL
+
+log = logging.getLogger("render")
+
+#---- Colores puestos para los agentes: vacío, robot, basura, muro, papelera -----
+COLORS = ['snow', 'slategray', 'thistle', 'black', 'skyblue']
+
+# Cuadros por segundo, igual que el intervalo por defecto de FuncAnimation (200 ms)
+FPS = 5
+
+# Tamaño aproximado en pixeles del lado más largo del grid (como la figura de 7x7 a 100 dpi)
+IMAGE_SIZE = 700
+HEADER_PX = 32
+
+FRAME_PATTERN = 'frame_%05d.png'
+
+# Códigos de texto de una celda: 1..250 es la cantidad de basura
+LABEL_WALL = 251
+LABEL_ROBOT = 252
+LABEL_BIN = 253
+LABEL_TEXT = {LABEL_WALL: 'X', LABEL_ROBOT: 'S', LABEL_BIN: 'P'}
+
+
+# Clave de tile de cada celda: color * 256 + código de texto. El robot encima de la
+# papelera se muestra como 'S' sobre el color de la papelera.
+def frame_keys(kind, litter):
+    colors = np.zeros(kind.shape, dtype=np.uint16)
+    labels = np.zeros(kind.shape, dtype=np.uint16)
+
+    litter_cells = (kind == FREE) & (litter > 0)
+    colors[litter_cells] = 2
+    labels[litter_cells] = litter[litter_cells]
+
+    for cell_kind, label, color in ((WALL, LABEL_WALL, 3), (ROBOT, LABEL_ROBOT, 1),
+                                    (BIN, LABEL_BIN, 4), (ROBOT_BIN, LABEL_ROBOT, 4)):
+        cells = kind == cell_kind
+        colors[cells] = color
+        labels[cells] = label
+
+    return colors * 256 + labels
+
+
+# Dibuja con matplotlib una imagen RGB de 'width' x 'height' pixeles con un texto centrado
+def text_image(width, height, text, background, color, fontsize):
+    figure = Figure(figsize=(width / 100, height / 100), dpi=100)
+    FigureCanvasAgg(figure)
+    figure.patch.set_facecolor(background)
+    if text:
+        figure.text(0.5, 0.5, text, ha='center', va='center', color=color, fontsize=fontsize)
+    figure.canvas.draw()
+    return np.asarray(figure.canvas.buffer_rgba())[:height, :width, :3].copy()
+
+
+class FrameRenderer:
+
+    def __init__(self, width, height, cell_px=None):
+        self.width = width
+        self.height = height
+        self.cell_px = cell_px or max(8, IMAGE_SIZE // max(width, height))
+
+        # Tiles ya dibujados: clave -> índice en 'atlas'
+        self.tile_index = {}
+        self.atlas = np.zeros((0, self.cell_px, self.cell_px, 3), dtype=np.uint8)
+
+        # Encabezado con el número de paso, se reutiliza la misma figura en cada cuadro
+        self.header = Figure(figsize=(height * self.cell_px / 100, HEADER_PX / 100), dpi=100)
+        FigureCanvasAgg(self.header)
+        self.header.patch.set_facecolor('white')
+        self.title = self.header.text(0.5, 0.5, '', ha='center', va='center', fontsize=12, color='black')
+
+    def make_tile(self, key):
+        color, label = divmod(int(key), 256)
+        text = LABEL_TEXT.get(label, str(label) if label else '')
+        # Números en negro; robots, muros y papelera en blanco para que se vean sobre su color
+        text_color = 'black' if text.isdigit() else 'white'
+        fontsize = max(4, self.cell_px * 0.45)
+        return text_image(self.cell_px, self.cell_px, text, to_rgb(COLORS[color]), text_color, fontsize)
+
+    # Índices de tile de cada celda, dibujando solo los tiles que todavía no existen
+    def tile_ids(self, kind, litter):
+        keys, inverse = np.unique(frame_keys(kind, litter), return_inverse=True)
+
+        new_tiles = [self.make_tile(key) for key in keys.tolist() if key not in self.tile_index]
+        if new_tiles:
+            for key in keys.tolist():
+                if key not in self.tile_index:
+                    self.tile_index[key] = len(self.tile_index)
+            self.atlas = np.concatenate([self.atlas, np.stack(new_tiles)])
+
+        ids = np.array([self.tile_index[key] for key in keys.tolist()])
+        return ids[inverse].reshape(kind.shape)
+
+    # Imagen RGB del cuadro 'step' (empezando en 0)
+    def render(self, kind, litter, step):
+        px = self.cell_px
+        ids = self.tile_ids(kind, litter)
+        tiles = self.atlas[ids]
+        grid = tiles.transpose(0, 2, 1, 3, 4).reshape(self.width * px, self.height * px, 3)
+
+        self.title.set_text(f'Step: {step + 1}')
+        self.header.canvas.draw()
+        header = np.asarray(self.header.canvas.buffer_rgba())[:HEADER_PX, :self.height * px, :3]
+        return np.concatenate([header, grid])
+
+
+# Guarda como PNG los cuadros [start, stop) en 'out_dir'. Regresa las rutas escritas.
+def render_frames(recorder, out_dir, start=0, stop=None, cell_px=None):
+    from PIL import Image
+
+    os.makedirs(out_dir, exist_ok=True)
+    renderer = FrameRenderer(recorder.width, recorder.height, cell_px)
+    paths = []
+
+    for step, (kind, litter) in enumerate(recorder.iter_frames(start, stop), start):
+        path = os.path.join(out_dir, FRAME_PATTERN % step)
+        Image.fromarray(renderer.render(kind, litter, step)).save(path)
+        paths.append(path)
+    return paths
+
+
+# Reparte los cuadros en bloques y cada proceso del pool renderiza su bloque
+def render_frames_parallel(recorder, out_dir, workers=None, chunk_size=None, cell_px=None):
+    frames = len(recorder)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-frames // workers))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(render_frames, recorder, out_dir, start, start + chunk_size, cell_px)
+                   for start in range(0, frames, chunk_size)]
+        return [path for future in futures for path in future.result()]
+
+
+# Une una secuencia de imágenes en un video con ffmpeg
+def encode_video(frames_dir, filename, fps=FPS):
+    if shutil.which('ffmpeg') is None:
+        raise RuntimeError("Se necesita ffmpeg para crear el video; los cuadros quedaron en " + frames_dir)
+
+    subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-framerate', str(fps),
+                    '-i', os.path.join(frames_dir, FRAME_PATTERN),
+                    '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', filename], check=True)
+
+
+# Exporta la animación en un solo proceso, mandando cada cuadro directo al video, y regresa la
+# ruta del archivo escrito (None si no hay cuadros). Con ffmpeg los cuadros se escriben sin
+# comprimir por su entrada estándar; sin ffmpeg se guarda un GIF con Pillow junto a 'filename'
+# (misma ruta con extensión .gif), que recibe los cuadros uno por uno.
+def export_video(recorder, filename, frames=None, fps=FPS, cell_px=None):
+    renderer = FrameRenderer(recorder.width, recorder.height, cell_px)
+    images = (renderer.render(kind, litter, step)
+              for step, (kind, litter) in enumerate(recorder.iter_frames(0, frames)))
+
+    first = next(images, None)
+    if first is None:
+        return None
+
+    if shutil.which('ffmpeg') is None:
+        from PIL import Image
+
+        path = os.path.splitext(filename)[0] + '.gif'
+        log.warning("No se encontró ffmpeg; la animación se guarda como GIF en %s", path)
+        Image.fromarray(first).save(path, save_all=True, append_images=(Image.fromarray(image) for image in images),
+                                    duration=1000 // fps, loop=0)
+        return path
+
+    height, width = first.shape[:2]
+    command = ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+               '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+               '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', filename]
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as ffmpeg:
+        ffmpeg.stdin.write(first.tobytes())
+        for image in images:
+            ffmpeg.stdin.write(image.tobytes())
+        ffmpeg.stdin.close()
+    if ffmpeg.returncode:
+        raise RuntimeError(f"ffmpeg terminó con código {ffmpeg.returncode}")
+    return filename
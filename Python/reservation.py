@@ -0,0 +1,155 @@
+# Tabla de reservaciones espacio-tiempo para que los robots planeen sus movimientos unos
+# alrededor de otros (A* cooperativo con ventana). Cada robot busca su camino sobre pares
+# (celda, paso) evitando las celdas que otros robots ya reservaron para ese paso, y reserva
+# las celdas de su propio camino. Así, en lugar de chocar con otro robot y moverse al azar,
+# espera o lo rodea desde antes.
+#
+# El camino se planea solo WINDOW pasos hacia adelante; la heurística es la distancia real
+# al objetivo considerando solo los muros (un DistanceField por objetivo), así que al llegar
+# al final de la ventana el robot vuelve a planear desde donde quedó.
+import heapq
+
+from pathfinding import DistanceField
+
+WINDOW = 16
+
+# Pasos que un robot conserva su reservación al llegar al objetivo (recoger o vaciar la basura)
+DWELL = 2
+
+# Límite de nodos expandidos por búsqueda
+MAX_EXPANSIONS = 1000
+
+# Campos de distancias que se conservan (uno por objetivo reciente)
+MAX_FIELDS = 64
+
+
+class ReservationTable:
+
+    def __init__(self, graph, window=WINDOW):
+        # Grafo solo con los muros: los demás robots se evitan con las reservaciones
+        self.graph = graph
+        self.window = window
+
+        # (celda, paso) -> unique_id del robot que la reservó
+        self.reserved = {}
+        # unique_id -> (objetivo, paso inicial, camino como lista de celdas, llaves reservadas)
+        self.plans = {}
+        # Campos de distancias por objetivo, para la heurística
+        self.fields = {}
+
+        # Búsquedas hechas y nodos expandidos en todas ellas
+        self.searches = 0
+        self.expanded = 0
+
+    def field(self, goal):
+        field = self.fields.get(goal)
+        if field is None:
+            if len(self.fields) >= MAX_FIELDS:
+                del self.fields[next(iter(self.fields))]
+            field = self.fields[goal] = DistanceField(self.graph)
+        if field.key != self.graph.version:
+            field.compute([divmod(goal, self.graph.height)], self.graph.version)
+        return field
+
+    def cancel(self, agent):
+        plan = self.plans.pop(agent.unique_id, None)
+        if plan:
+            for key in plan[3]:
+                if self.reserved.get(key) == agent.unique_id:
+                    del self.reserved[key]
+
+    # Siguiente celda del robot hacia 'objetivo' en el paso 'now', según su plan o uno nuevo.
+    # 'occupied(cell)' dice si hay otro robot en la celda en este momento. Regresa la posición
+    # actual si el robot debe esperar, o None si no existe ningún camino.
+    def next_step(self, agent, objetivo, now, occupied):
+        height = self.graph.height
+        cell = agent.pos[0] * height + agent.pos[1]
+        goal = objetivo[0] * height + objetivo[1]
+
+        plan = self.plans.get(agent.unique_id)
+        if plan and plan[0] == goal:
+            index = now - plan[1]
+            path = plan[2]
+            if 0 <= index < len(path) - 1 and path[index] == cell:
+                return divmod(path[index + 1], height)
+
+        self.cancel(agent)
+        path = self.search(agent.unique_id, cell, goal, now, occupied)
+        if path is None:
+            return None
+
+        keys = [(step_cell, now + i) for i, step_cell in enumerate(path)]
+        if path[-1] == goal:
+            keys += [(goal, now + len(path) - 1 + i) for i in range(1, DWELL + 1)]
+        keys = [key for key in keys if self.reserved.setdefault(key, agent.unique_id) == agent.unique_id]
+        self.plans[agent.unique_id] = (goal, now, path, keys)
+
+        return divmod(path[1], height) if len(path) > 1 else agent.pos
+
+    # A* sobre (celda, paso) desde 'start' en el paso 'now'. Termina al llegar a 'goal' o al
+    # final de la ventana; regresa la lista de celdas de cada paso (incluyendo 'start'). Si se
+    # agota el límite de expansiones, regresa el camino al nodo que quedó más cerca del objetivo.
+    def search(self, agent_id, start, goal, now, occupied):
+        dist = self.field(goal).dist
+        if dist[start] == -1:
+            return None
+
+        neighbors = self.graph.neighbors
+        wall = self.graph.wall
+        reserved = self.reserved
+        height = self.graph.height
+
+        # Nodos: (celda, g, índice del padre)
+        nodes = [(start, 0, -1)]
+        heap = [(dist[start], 0, 0)]
+        # Todos los movimientos cuestan 1 y la heurística es consistente, así que la primera vez
+        # que se encola un (celda, g) ya tiene el mejor costo: no se vuelve a encolar
+        seen = {(start, 0)}
+        expansions = 0
+        best = (dist[start], 0, 0)
+
+        self.searches += 1
+        while heap and expansions < MAX_EXPANSIONS:
+            _, _, index = heapq.heappop(heap)
+            cell, g, _ = nodes[index]
+            expansions += 1
+            best = min(best, (dist[cell], -g, index))
+
+            if cell == goal or g == self.window:
+                self.expanded += expansions
+                return self.rebuild(nodes, index)
+
+            t = now + g + 1
+            for nxt in (cell, *neighbors[cell]):
+                if wall[nxt] or dist[nxt] == -1 or (nxt, g + 1) in seen:
+                    continue
+
+                owner = reserved.get((nxt, t))
+                if owner is not None and owner != agent_id:
+                    continue
+                # En el primer paso no se puede entrar a una celda ocupada en este momento
+                if g == 0 and nxt != cell and occupied(divmod(nxt, height)):
+                    continue
+                # Tampoco se puede intercambiar de celda con otro robot
+                other = reserved.get((nxt, t - 1))
+                if other is not None and other != agent_id and reserved.get((cell, t)) == other:
+                    continue
+
+                seen.add((nxt, g + 1))
+                nodes.append((nxt, g + 1, index))
+                # Entre nodos con el mismo costo estimado se prefiere el más avanzado
+                heapq.heappush(heap, (g + 1 + dist[nxt], -(g + 1), len(nodes) - 1))
+
+        self.expanded += expansions
+        if heap:
+            return self.rebuild(nodes, best[2])
+        return None
+
+    @staticmethod
+    def rebuild(nodes, index):
+        path = []
+        while index != -1:
+            cell, _, index = nodes[index]
+            path.append(cell)
+        path.reverse()
+        return path
@@ -0,0 +1,96 @@
+# Formato binario de una corrida completa, pensado para que el servidor la lea con mmap.
+# Reemplaza al volcado de texto de los arreglos de NumPy (outputs/model.txt), que había
+# que parsear completo para obtener cualquier paso.
+#
+#   encabezado (HEADER):  firma b'CRUN', versión, ancho, alto, robots, número de cuadros
+#   cuadros:              uno tras otro, cada uno de 2 * ancho * alto bytes uint8: primero
+#                         el tipo de cada celda y después la cantidad de basura (ver gridlayer)
+#
+# Como todos los cuadros miden lo mismo, la posición del cuadro N se calcula directamente
+# (HEADER.size + N * frame_size) y leerlo es tomar una vista del mmap, sin copiar.
+import mmap
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b'CRUN'
+VERSION = 1
+HEADER = struct.Struct('<4sHHHHI')
+
+
+class RunWriter:
+
+    def __init__(self, path, width, height, robots=0):
+        self.width = width
+        self.height = height
+        self.robots = robots
+        self.frames = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'wb')
+        self.write_header()
+
+    def write_header(self):
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.width, self.height, self.robots, self.frames))
+
+    def write(self, kind, litter):
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(np.ascontiguousarray(kind, dtype=np.uint8).tobytes())
+        self.file.write(np.ascontiguousarray(litter, dtype=np.uint8).tobytes())
+        self.frames += 1
+
+    # Escribe el número final de cuadros en el encabezado
+    def close(self):
+        self.write_header()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RunFile:
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.width, self.height, self.robots, frames = HEADER.unpack_from(self.mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} no es un archivo de corrida válido")
+
+        self.cells = self.width * self.height
+        self.frame_size = 2 * self.cells
+        # Si el simulador no cerró el archivo el encabezado dice 0; se usan los cuadros completos
+        self.frames = frames or (len(self.mmap) - HEADER.size) // self.frame_size
+
+    def __len__(self):
+        return self.frames
+
+    # Cuadro 'index' como (kind, litter): vistas de solo lectura sobre el archivo
+    def frame(self, index):
+        if index < 0:
+            index += self.frames
+        if not 0 <= index < self.frames:
+            raise IndexError(f"El cuadro {index} no existe, hay {self.frames} registrados")
+
+        offset = HEADER.size + index * self.frame_size
+        kind = np.frombuffer(self.mmap, dtype=np.uint8, count=self.cells, offset=offset)
+        litter = np.frombuffer(self.mmap, dtype=np.uint8, count=self.cells, offset=offset + self.cells)
+        return kind.reshape(self.width, self.height), litter.reshape(self.width, self.height)
+
+    def close(self):
+        self.mmap.close()
+
+
+# Guarda todos los cuadros de un TrajectoryRecorder en un archivo de corrida
+def save_run(recorder, path, robots=0):
+    with RunWriter(path, recorder.width, recorder.height, robots) as writer:
+        for kind, litter in recorder.iter_frames():
+            writer.write(kind, litter)
@@ -0,0 +1,44 @@
+# Scheduler de GameBoard. Solo los robots son agentes: las basuras, los muros y la papelera
+# viven como datos del grid (los contadores por celda de GameBoard), así que cada paso
+# activa a los robots y nada más.
+#
+# Un robot que no tiene nada que hacer puede dormirse con una condición para despertar; mientras
+# la condición sea falsa el scheduler se lo salta en lugar de llamar a su step.
+from mesa.time import RandomActivation
+
+
+class RobotActivation(RandomActivation):
+
+    def __init__(self, model):
+        super().__init__(model)
+        # unique_id del robot -> función sin argumentos que regresa True cuando debe despertar
+        self.sleeping = {}
+
+    def sleep(self, agent, wake):
+        self.sleeping[agent.unique_id] = wake
+
+    def wake(self, agent):
+        self.sleeping.pop(agent.unique_id, None)
+
+    def remove(self, agent):
+        super().remove(agent)
+        self.wake(agent)
+
+    def step(self):
+        # El orden se sigue barajando con todos los robots, dormidos o no, para que dormir a uno
+        # no cambie el orden en el que se activan los demás
+        for agent_key in self.get_agent_keys(shuffle=True):
+            agent = self._agents.get(agent_key)
+            if agent is None:
+                continue
+
+            wake = self.sleeping.get(agent_key)
+            if wake is not None:
+                if not wake():
+                    continue
+                del self.sleeping[agent_key]
+
+            agent.step()
+
+        self.steps += 1
+        self.time += 1
@@ -0,0 +1,260 @@
+# Índice espacial para buscar la celda objetivo más cercana a un robot (basura o celdas
+# sin explorar). Las celdas se guardan en cubetas de BUCKET_SIZE x BUCKET_SIZE y la
+# búsqueda revisa anillos de cubetas alrededor del robot, deteniéndose en cuanto ningún
+# anillo más lejano puede tener una celda más cercana.
+#
+# El índice se comporta como la lista que reemplaza: conserva el orden de inserción y,
+# ante empates de distancia, gana la celda que se agregó primero.
+#
+# NearestIndex guarda las celdas en diccionarios y sirve para conjuntos chicos (la basura).
+# DenseIndex empieza con todas las celdas del mapa (las que faltan por explorar) y las guarda
+# en una máscara de NumPy con un conteo por cubeta, así que ocupa unos bytes por celda.
+import numpy as np
+
+BUCKET_SIZE = 8
+
+# Radio alrededor del robot que DenseIndex revisa celda por celda antes de buscar por cubetas
+SPIRAL_RADIUS = 4
+
+
+# Desplazamientos a menos de 'radius' agrupados por distancia al cuadrado, de menor a mayor
+def spiral(radius):
+    groups = {}
+    for dx in range(-radius, radius + 1):
+        for dy in range(-radius, radius + 1):
+            d2 = dx * dx + dy * dy
+            if d2 <= radius * radius:
+                groups.setdefault(d2, []).append((dx, dy))
+    return sorted(groups.items())
+
+
+SPIRAL = spiral(SPIRAL_RADIUS)
+
+
+class NearestIndex:
+
+    def __init__(self, width, height, bucket_size=BUCKET_SIZE):
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self.buckets_x = (width + bucket_size - 1) // bucket_size
+        self.buckets_y = (height + bucket_size - 1) // bucket_size
+
+        # Celda -> número de inserción (el diccionario conserva el orden de inserción)
+        self.cells = {}
+        self.buckets = {}
+        self.next_seq = 0
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __bool__(self):
+        return bool(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.cells
+
+    def __iter__(self):
+        return iter(list(self.cells))
+
+    def __repr__(self):
+        return f"NearestIndex({list(self.cells)})"
+
+    def append(self, cell):
+        self.add(cell)
+
+    def add(self, cell):
+        if cell in self.cells:
+            return
+        self.cells[cell] = self.next_seq
+        self.next_seq += 1
+        bucket = (cell[0] // self.bucket_size, cell[1] // self.bucket_size)
+        self.buckets.setdefault(bucket, {})[cell] = self.cells[cell]
+
+    def remove(self, cell):
+        del self.cells[cell]
+        bucket = (cell[0] // self.bucket_size, cell[1] // self.bucket_size)
+        del self.buckets[bucket][cell]
+
+    def discard(self, cell):
+        if cell in self.cells:
+            self.remove(cell)
+
+    # Celda más cercana a 'pos' en distancia euclidiana que esté a menos de 'max_dist'.
+    # Regresa None si no hay ninguna.
+    def nearest(self, pos, max_dist=None):
+        if not self.cells:
+            return None
+
+        size = self.bucket_size
+        x, y = pos
+        bx, by = x // size, y // size
+        ox, oy = x - bx * size, y - by * size
+
+        # (distancia al cuadrado, número de inserción, celda)
+        best = None
+        limit = max_dist * max_dist if max_dist is not None else None
+        max_ring = max(bx, self.buckets_x - 1 - bx, by, self.buckets_y - 1 - by)
+
+        for ring in range(max_ring + 1):
+
+            # Distancia mínima posible a cualquier celda de este anillo
+            if ring > 0:
+                lower = min(ox + (ring - 1) * size + 1, ring * size - ox,
+                            oy + (ring - 1) * size + 1, ring * size - oy)
+                if best is not None and lower * lower > best[0]:
+                    break
+                if best is None and limit is not None and lower * lower >= limit:
+                    break
+
+            for cbx in range(bx - ring, bx + ring + 1):
+                # En las columnas intermedias del anillo solo se revisan las cubetas de los extremos
+                step = 1 if cbx in (bx - ring, bx + ring) else 2 * ring
+                for cby in range(by - ring, by + ring + 1, step):
+                    bucket = self.buckets.get((cbx, cby))
+                    if not bucket:
+                        continue
+
+                    for cell, seq in bucket.items():
+                        d2 = (x - cell[0]) ** 2 + (y - cell[1]) ** 2
+                        if best is None:
+                            if limit is None or d2 < limit:
+                                best = (d2, seq, cell)
+                        elif d2 < best[0] or (d2 == best[0] and seq < best[1]):
+                            best = (d2, seq, cell)
+
+        return best[2] if best else None
+
+
+# Índice con todas las celdas del mapa, en el mismo orden en que las agregaría un recorrido por
+# x y luego por y. Tiene la misma interfaz y los mismos resultados que NearestIndex, pero cada
+# celda ocupa un lugar en una máscara y en un arreglo con su número de inserción.
+class DenseIndex:
+
+    def __init__(self, width, height, bucket_size=BUCKET_SIZE):
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self.buckets_x = (width + bucket_size - 1) // bucket_size
+        self.buckets_y = (height + bucket_size - 1) // bucket_size
+
+        self.mask = np.ones((width, height), dtype=bool)
+        self.seq = np.arange(width * height, dtype=np.int64).reshape(width, height)
+        self.next_seq = width * height
+        self.count = width * height
+
+        # Celdas de cada cubeta; una cubeta vacía no se revisa
+        xs = np.minimum(bucket_size, width - np.arange(self.buckets_x) * bucket_size)
+        ys = np.minimum(bucket_size, height - np.arange(self.buckets_y) * bucket_size)
+        self.counts = np.outer(xs, ys).astype(np.int32)
+
+        # Desplazamiento de cada celda de una cubeta respecto a su esquina
+        self.offsets_x, self.offsets_y = (offsets.ravel() for offsets in np.indices((bucket_size, bucket_size)))
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __contains__(self, cell):
+        x, y = cell
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.mask[x, y])
+
+    def __iter__(self):
+        xs, ys = np.nonzero(self.mask)
+        order = np.argsort(self.seq[xs, ys], kind='stable')
+        return iter(list(zip(xs[order].tolist(), ys[order].tolist())))
+
+    def __repr__(self):
+        return f"DenseIndex({list(self)})"
+
+    def append(self, cell):
+        self.add(cell)
+
+    def add(self, cell):
+        if cell in self:
+            return
+        self.mask[cell] = True
+        self.seq[cell] = self.next_seq
+        self.next_seq += 1
+        self.count += 1
+        self.counts[cell[0] // self.bucket_size, cell[1] // self.bucket_size] += 1
+
+    def remove(self, cell):
+        if cell not in self:
+            raise KeyError(cell)
+        self.mask[cell] = False
+        self.count -= 1
+        self.counts[cell[0] // self.bucket_size, cell[1] // self.bucket_size] -= 1
+
+    def discard(self, cell):
+        if cell in self:
+            self.remove(cell)
+
+    # Mismo resultado que NearestIndex.nearest. Casi siempre hay una celda pegada al robot, así
+    # que primero se revisan las celdas de SPIRAL de la más cercana a la más lejana y solo si no
+    # hay ninguna se hace la búsqueda por anillos de cubetas
+    def nearest(self, pos, max_dist=None):
+        if not self.count:
+            return None
+
+        x, y = pos
+        limit = max_dist * max_dist if max_dist is not None else None
+        for d2, offsets in SPIRAL:
+            if limit is not None and d2 >= limit:
+                return None
+            found = [(self.seq[cx, cy], (cx, cy)) for cx, cy in ((x + dx, y + dy) for dx, dy in offsets)
+                     if 0 <= cx < self.width and 0 <= cy < self.height and self.mask[cx, cy]]
+            if found:
+                return min(found)[1]
+
+        size = self.bucket_size
+        bx, by = x // size, y // size
+        ox, oy = x - bx * size, y - by * size
+
+        # (distancia al cuadrado, número de inserción, celda)
+        best = None
+        max_ring = max(bx, self.buckets_x - 1 - bx, by, self.buckets_y - 1 - by)
+
+        for ring in range(max_ring + 1):
+
+            # Distancia mínima posible a cualquier celda de este anillo
+            if ring > 0:
+                lower = min(ox + (ring - 1) * size + 1, ring * size - ox,
+                            oy + (ring - 1) * size + 1, ring * size - oy)
+                if best is not None and lower * lower > best[0]:
+                    break
+                if best is None and limit is not None and lower * lower >= limit:
+                    break
+
+            # Cubetas del anillo con alguna celda; sus celdas se revisan todas juntas
+            cbxs, cbys = [], []
+            for cbx in range(max(bx - ring, 0), min(bx + ring + 1, self.buckets_x)):
+                # En las columnas intermedias del anillo solo se revisan las cubetas de los extremos
+                step = 1 if cbx in (bx - ring, bx + ring) else 2 * ring
+                for cby in range(by - ring, by + ring + 1, step):
+                    if 0 <= cby < self.buckets_y and self.counts[cbx, cby]:
+                        cbxs.append(cbx)
+                        cbys.append(cby)
+            if not cbxs:
+                continue
+
+            xs = (np.array(cbxs)[:, None] * size + self.offsets_x).ravel()
+            ys = (np.array(cbys)[:, None] * size + self.offsets_y).ravel()
+            inside = (xs < self.width) & (ys < self.height)
+            xs, ys = xs[inside], ys[inside]
+            present = self.mask[xs, ys]
+            xs, ys = xs[present], ys[present]
+            d2 = (xs - x) ** 2 + (ys - y) ** 2
+            seqs = self.seq[xs, ys]
+            i = np.lexsort((seqs, d2))[0]
+
+            candidate = (int(d2[i]), int(seqs[i]), (int(xs[i]), int(ys[i])))
+            if best is None:
+                if limit is None or candidate[0] < limit:
+                    best = candidate
+            elif candidate[:2] < best[:2]:
+                best = candidate
+
+        return best[2] if best else None
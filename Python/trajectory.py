@@ -0,0 +1,135 @@
+# Registro compacto de la simulación paso a paso. En lugar de guardar el grid completo de
+# cada paso (como hacía el DataCollector), se guarda un cuadro inicial y después solo las
+# celdas que cambiaron en cada paso, en un buffer binario. Cualquier cuadro se reconstruye
+# bajo demanda a partir del cuadro clave más cercano.
+#
+# Un cuadro usa la codificación de gridlayer: un arreglo uint8 con el tipo de celda y otro
+# con la cantidad de basura.
+from array import array
+
+import numpy as np
+
+from gridlayer import BIN, FREE, KIND_CODES, ROBOT, ROBOT_BIN, WALL
+
+# Cada cambio ocupa 6 bytes: índice plano de la celda, nuevo tipo y nueva cantidad de basura
+CHANGE_DTYPE = np.dtype([('cell', '<u4'), ('kind', 'u1'), ('litter', 'u1')])
+
+# Cada cuántos pasos se guarda un cuadro completo para acotar el costo de reconstrucción
+KEYFRAME_INTERVAL = 256
+
+
+class TrajectoryRecorder:
+
+    def __init__(self, width, height, keyframe_interval=KEYFRAME_INTERVAL):
+        self.width = width
+        self.height = height
+        self.keyframe_interval = keyframe_interval
+
+        self.changes = bytearray()
+        # offsets[i] es la posición (en cambios) donde empiezan los cambios del cuadro i
+        self.offsets = array('Q')
+        self.keyframes = {}
+        self.last_kind = None
+        self.last_litter = None
+
+    def __len__(self):
+        return len(self.offsets)
+
+    # Tamaño aproximado en bytes de todo lo registrado
+    @property
+    def nbytes(self):
+        keyframes = sum(kind.nbytes + litter.nbytes for kind, litter in self.keyframes.values())
+        return len(self.changes) + self.offsets.itemsize * len(self.offsets) + keyframes
+
+    # Registra el cuadro del paso actual
+    def record(self, kind, litter):
+        index = len(self.offsets)
+        self.offsets.append(len(self.changes) // CHANGE_DTYPE.itemsize)
+
+        if index % self.keyframe_interval == 0:
+            self.keyframes[index] = (kind.copy(), litter.copy())
+        else:
+            changed = np.flatnonzero((kind != self.last_kind) | (litter != self.last_litter))
+            entries = np.empty(len(changed), dtype=CHANGE_DTYPE)
+            entries['cell'] = changed
+            entries['kind'] = kind.ravel()[changed]
+            entries['litter'] = litter.ravel()[changed]
+            self.changes += entries.tobytes()
+
+        self.last_kind = kind.copy()
+        self.last_litter = litter.copy()
+
+    # Cambios registrados en el cuadro 'index' (vacío para los cuadros clave)
+    def frame_changes(self, index):
+        start = self.offsets[index]
+        end = self.offsets[index + 1] if index + 1 < len(self.offsets) else len(self.changes) // CHANGE_DTYPE.itemsize
+        return np.frombuffer(self.changes, dtype=CHANGE_DTYPE,
+                             count=end - start, offset=start * CHANGE_DTYPE.itemsize)
+
+    # Reconstruye el cuadro 'index' como (kind, litter)
+    def frame(self, index):
+        if index < 0:
+            index += len(self.offsets)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError(f"El cuadro {index} no existe, hay {len(self.offsets)} registrados")
+
+        key = index - index % self.keyframe_interval
+        kind, litter = (layer.copy() for layer in self.keyframes[key])
+        flat_kind = kind.reshape(-1)
+        flat_litter = litter.reshape(-1)
+
+        for step in range(key + 1, index + 1):
+            entries = self.frame_changes(step)
+            flat_kind[entries['cell']] = entries['kind']
+            flat_litter[entries['cell']] = entries['litter']
+        return kind, litter
+
+    # Recorre los cuadros [start, stop) aplicando los cambios uno tras otro, sin volver al
+    # cuadro clave en cada paso. Los arreglos que regresa se reutilizan entre iteraciones.
+    def iter_frames(self, start=0, stop=None):
+        stop = len(self.offsets) if stop is None else min(stop, len(self.offsets))
+        if start >= stop:
+            return
+
+        kind, litter = self.frame(start)
+        yield kind, litter
+        flat_kind = kind.reshape(-1)
+        flat_litter = litter.reshape(-1)
+
+        for index in range(start + 1, stop):
+            if index in self.keyframes:
+                kind[...], litter[...] = self.keyframes[index]
+            else:
+                entries = self.frame_changes(index)
+                flat_kind[entries['cell']] = entries['kind']
+                flat_litter[entries['cell']] = entries['litter']
+            yield kind, litter
+
+    # Cuadro 'index' en el formato de get_grid: (representación, colores)
+    def grid(self, index):
+        return decode_frame(*self.frame(index))
+
+
+# Convierte un cuadro a la representación y colores que usa la animación:
+# 0 vacío, 'S' robot (1), número de basuras (2), 'X' muro (3), 'P' papelera (4)
+def decode_frame(kind, litter):
+    grid_repr = np.zeros(kind.shape, dtype=object)
+    grid_colors = np.zeros(kind.shape)
+
+    litter_cells = (kind == FREE) & (litter > 0)
+    grid_repr[litter_cells] = litter[litter_cells].astype(str)
+    grid_colors[litter_cells] = 2
+
+    for cell_kind, code, color in ((WALL, 'X', 3), (ROBOT, 'S', 1), (BIN, 'P', 4), (ROBOT_BIN, 'P', 4)):
+        cells = kind == cell_kind
+        grid_repr[cells] = code
+        grid_colors[cells] = color
+
+    return grid_repr, grid_colors
+
+
+# Códigos de texto de cada celda de un cuadro, como en los archivos de input: '0' vacío,
+# número de basuras, 'X' muro, 'S' robot y 'P' papelera (también con un robot encima)
+def frame_codes(kind, litter):
+    litter_cells = (kind == FREE) & (litter > 0)
+    return np.where(litter_cells, litter.astype(str), KIND_CODES[kind])
@@ -0,0 +1,64 @@
+# Prueba de carga para tc2008B_server.py o stream_server.py: muchos clientes locales piden
+# el mismo endpoint al mismo tiempo durante unos segundos y se reportan las peticiones por
+# segundo y la latencia de las respuestas.
+#
+# Uso (desde la carpeta Server, con el servidor corriendo):
+#   python load_test.py --port 8585 --clients 32 --seconds 10               (POST / como WebClient.cs)
+#   python load_test.py --port 8585 --clients 32 --path /step/-1 --method GET
+#   python load_test.py --port 8585 --clients 32 --path /state --method GET  (stream_server.py)
+import argparse
+import statistics
+import threading
+import time
+import urllib.request
+
+
+def run_client(url, method, seconds, latencies, errors):
+    data = b'{}' if method == 'POST' else None
+    end = time.perf_counter() + seconds
+
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, data=data, method=method)) as response:
+                response.read()
+            latencies.append(time.perf_counter() - start)
+        except OSError:
+            errors.append(1)
+
+
+def main(host, port, path, method, clients, seconds):
+    url = f"http://{host}:{port}{path}"
+    latencies = []
+    errors = []
+
+    threads = [threading.Thread(target=run_client, args=(url, method, seconds, latencies, errors))
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{method} {url} con {clients} clientes durante {elapsed:.1f} s")
+    print(f"{len(latencies)} respuestas ({len(latencies) / elapsed:.0f} por segundo), {len(errors)} errores")
+    if latencies:
+        print(f"latencia: media {statistics.mean(latencies) * 1000:.2f} ms | "
+              f"p50 {latencies[len(latencies) // 2] * 1000:.2f} ms | "
+              f"p95 {latencies[int(0.95 * (len(latencies) - 1))] * 1000:.2f} ms | "
+              f"máxima {latencies[-1] * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Prueba de carga con muchos clientes locales")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8585)
+    parser.add_argument('--path', default='/')
+    parser.add_argument('--method', default='POST', choices=['GET', 'POST'])
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    main(args.host, args.port, args.path, args.method, args.clients, args.seconds)
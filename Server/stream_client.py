@@ -0,0 +1,86 @@
+# Cliente de prueba para stream_server.py. Se conecta a /events, reconstruye el grid con los
+# eventos "changes" y mide cuántos pasos por segundo llegan y la latencia de cada paso (el
+# servidor pone en cada evento la hora a la que lo publicó; cliente y servidor corren en la
+# misma máquina).
+#
+# Uso (desde la carpeta Server, con stream_server.py corriendo):
+#   python stream_client.py --port 8585 --clients 4 --seconds 10
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+
+async def read_events(reader):
+    name, data = None, []
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        line = line.decode('utf-8').rstrip('\r\n')
+        if line.startswith('event:'):
+            name = line[6:].strip()
+        elif line.startswith('data:'):
+            data.append(line[5:].strip())
+        elif not line and name:
+            yield name, json.loads('\n'.join(data))
+            name, data = None, []
+
+
+async def run_client(host, port, seconds):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /events HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+
+    # Encabezados de la respuesta
+    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+        pass
+
+    grid = None
+    latencies = []
+    steps = 0
+    start = time.perf_counter()
+
+    async for name, payload in read_events(reader):
+        if name == 'frame':
+            grid = [row.split() for row in payload['map_data']]
+        elif name == 'changes':
+            for x, y, code in payload['changes']:
+                grid[x][y] = code
+            latencies.append(time.time() - payload['time'])
+            steps += 1
+        elif name == 'end':
+            break
+        if time.perf_counter() - start >= seconds:
+            break
+
+    elapsed = time.perf_counter() - start
+    writer.close()
+    return steps, elapsed, latencies
+
+
+def summary(results):
+    latencies = sorted(latency for _, _, client in results for latency in client)
+    for i, (steps, elapsed, _) in enumerate(results):
+        print(f"cliente {i}: {steps} pasos en {elapsed:.2f} s ({steps / elapsed:.1f} pasos/s)")
+    if latencies:
+        print(f"latencia: media {statistics.mean(latencies) * 1000:.2f} ms | "
+              f"p95 {latencies[int(0.95 * (len(latencies) - 1))] * 1000:.2f} ms | "
+              f"máxima {latencies[-1] * 1000:.2f} ms")
+
+
+async def main(host, port, clients, seconds):
+    results = await asyncio.gather(*(run_client(host, port, seconds) for _ in range(clients)))
+    summary(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Mide pasos por segundo y latencia de stream_server.py")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8585)
+    parser.add_argument('--clients', type=int, default=1)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.host, args.port, args.clients, args.seconds))
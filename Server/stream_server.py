@@ -0,0 +1,212 @@
+# Servidor que corre una simulación en vivo y manda cada paso a los clientes conectados
+# con Server-Sent Events, en lugar de volver a leer y parsear outputs/model.txt en cada POST.
+# El paso se serializa una sola vez y se reparte a todos los clientes; cada evento lleva
+# solo las celdas que cambiaron, así que su costo no crece con la duración de la corrida.
+#
+#   GET /events   flujo SSE: un evento "frame" con el grid completo al conectarse, un evento
+#                 "changes" por paso con las celdas que cambiaron y un evento "end" al terminar
+#   GET /state    grid completo del paso actual en JSON (POST / regresa lo mismo, para WebClient.cs)
+#
+# La simulación avanza a su propio ritmo (--fps), sin importar cuántos clientes haya ni qué tan
+# seguido pidan el estado; pedir /state no adelanta la simulación.
+#
+# Uso (desde la carpeta Server):
+#   python stream_server.py --input ../Python/inputs/input1.txt --robots 5 --fps 4 --port 8585
+#   python stream_client.py --port 8585
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+
+from cleaningRobots import GameBoard
+from gridlayer import GridLayer
+from trajectory import frame_codes
+
+# Eventos que puede acumular un cliente lento; si se llena, se le vuelve a mandar el grid completo
+CLIENT_QUEUE_SIZE = 64
+
+END_EVENT = b'event: end\ndata: {}\n\n'
+
+
+def sse_event(name, payload):
+    return f"event: {name}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n".encode('utf-8')
+
+
+class LiveSimulation:
+
+    def __init__(self, model, fps=4):
+        self.model = model
+        self.interval = 1 / fps if fps else 0
+        self.clients = set()
+        self.finished = False
+
+        kind, litter = model.gridFrame()
+        self.kind = kind.copy()
+        self.litter = litter.copy()
+        self.codes = frame_codes(kind, litter).astype('<U3')
+        self.step = model.current_step
+        self.frame_cache = None
+        self.state_cache = None
+
+    # Grid completo del paso actual, en el mismo formato que regresa tc2008B_server.py
+    def state(self):
+        return {
+            'step': self.step,
+            'time': time.time(),
+            'map_data': [' '.join(row) for row in self.codes.tolist()],
+            'total_robots': self.model.robots_count,
+            'rows': self.model.grid.width,
+            'cols': self.model.grid.height,
+        }
+
+    # Evento "frame" del paso actual, se serializa una sola vez por paso
+    def frame_event(self):
+        if self.frame_cache is None or self.frame_cache[0] != self.step:
+            self.frame_cache = (self.step, sse_event('frame', self.state()))
+        return self.frame_cache[1]
+
+    # Respuesta JSON de /state del paso actual, también serializada una sola vez por paso
+    def state_body(self):
+        if self.state_cache is None or self.state_cache[0] != self.step:
+            self.state_cache = (self.step, json.dumps(self.state()).encode('utf-8'))
+        return self.state_cache[1]
+
+    # Avanza la simulación un paso y calcula las celdas que cambiaron. Corre en un hilo aparte
+    # para no detener a los clientes; el grid compartido solo se modifica en apply_changes.
+    def advance(self):
+        self.model.step()
+
+        kind, litter = self.model.gridFrame()
+        changed = np.flatnonzero((kind != self.kind) | (litter != self.litter))
+        return self.model.current_step, changed, kind.ravel()[changed], litter.ravel()[changed]
+
+    # Aplica los cambios de un paso al grid compartido y los regresa como [x, y, código]
+    def apply_changes(self, step, changed, kind, litter):
+        xs, ys = np.divmod(changed, self.kind.shape[1])
+        codes = frame_codes(kind, litter)
+
+        self.kind[xs, ys] = kind
+        self.litter[xs, ys] = litter
+        self.codes[xs, ys] = codes
+        self.step = step
+        return [[x, y, code] for x, y, code in zip(xs.tolist(), ys.tolist(), codes.tolist())]
+
+    def publish(self, event):
+        for queue in self.clients:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # El cliente se quedó atrás: se descarta lo pendiente y se le manda el grid completo
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+                if event is END_EVENT:
+                    queue.put_nowait(END_EVENT)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+
+        # simulation_continue solo se lee entre pasos, cuando el hilo de la simulación ya terminó
+        while self.model.simulation_continue:
+            started = loop.time()
+            changes = self.apply_changes(*await loop.run_in_executor(None, self.advance))
+            self.publish(sse_event('changes', {'step': self.step,
+                                               'time': time.time(),
+                                               'changes': changes}))
+            await asyncio.sleep(max(0, self.interval - (loop.time() - started)))
+
+        self.finished = True
+        self.publish(END_EVENT)
+        logging.info(f"Simulación terminada en {self.step} pasos")
+
+    async def stream(self, writer):
+        writer.write(b'HTTP/1.1 200 OK\r\n'
+                     b'Content-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-cache\r\n'
+                     b'Connection: keep-alive\r\n\r\n')
+
+        # None en la cola significa "mandar el grid completo del paso actual"
+        queue = asyncio.Queue(CLIENT_QUEUE_SIZE)
+        queue.put_nowait(None)
+        if self.finished:
+            queue.put_nowait(END_EVENT)
+        self.clients.add(queue)
+
+        try:
+            while True:
+                event = await queue.get()
+                writer.write(self.frame_event() if event is None else event)
+                await writer.drain()
+                if event is END_EVENT:
+                    break
+        finally:
+            self.clients.discard(queue)
+
+    async def handle(self, reader, writer):
+        try:
+            request = await reader.readline()
+            method, path, _ = request.decode('latin-1').split(' ', 2)
+
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'content-length':
+                    length = int(value)
+            if length:
+                await reader.readexactly(length)
+
+            if method == 'GET' and path == '/events':
+                await self.stream(writer)
+            elif (method == 'GET' and path == '/state') or (method == 'POST' and path == '/'):
+                body = self.state_body()
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                             b'Content-Length: %d\r\nConnection: close\r\n\r\n' % len(body) + body)
+                await writer.drain()
+            else:
+                writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                await writer.drain()
+
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(simulation, port):
+    server = await asyncio.start_server(simulation.handle, '', port)
+    logging.info(f"Sirviendo la simulación en el puerto {port}...")
+    async with server:
+        simulation_task = asyncio.create_task(simulation.run())
+        try:
+            await server.serve_forever()
+        finally:
+            simulation_task.cancel()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulación en vivo con Server-Sent Events")
+    parser.add_argument('--input', default=os.path.join('..', 'Python', 'inputs', 'input1.txt'))
+    parser.add_argument('--robots', type=int, default=5)
+    parser.add_argument('--fps', type=float, default=4, help="pasos por segundo (0 = sin límite)")
+    parser.add_argument('--port', type=int, default=8585)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    gameboard = GridLayer.from_file(args.input)
+    model = GameBoard(gameboard.width, gameboard.height, gameboard, args.robots, collect_data=False)
+
+    try:
+        asyncio.run(serve(LiveSimulation(model, args.fps), args.port))
+    except KeyboardInterrupt:
+        pass
+    logging.info("Stopping server...\n")
@@ -1,74 +1,100 @@
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import logging
 import json
 import os
+import sys
+import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python'))
+
+from runfile import RunFile
+from trajectory import frame_codes
+
+# Corrida que escribe cleaningRobots.py (ver runfile.py)
+RUN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Python', 'outputs', 'model.run')
+
+# Pasos por segundo de la reproducción que sigue POST (WebClient.cs pide uno cada 0.25 s)
+PLAYBACK_FPS = 4
+
+# Respuesta JSON ya serializada de cada paso. Todos los clientes que piden el mismo paso
+# comparten los mismos bytes en lugar de volver a armar el grid.
+@lru_cache(maxsize=1024)
+def step_body(index):
+    run_file = Server.run_file
+    kind, litter = run_file.frame(index)
+    return json.dumps({
+        "step": index,
+        "map_data": [' '.join(row) for row in frame_codes(kind, litter).tolist()],
+        "total_robots": run_file.robots,
+        "rows": run_file.width,
+        "cols": run_file.height
+    }).encode('utf-8')
+
+
+# El archivo de corrida se abre una sola vez con mmap; cada paso se lee directamente de su
+# posición en el archivo, sin parsear los demás. Cada petición se atiende en su propio hilo.
+#   GET /info     dimensiones, robots y número de pasos de la corrida
+#   GET /step/N   grid del paso N (se aceptan índices negativos, -1 es el último)
+#   POST          grid del paso que toca según el reloj de reproducción (PLAYBACK_FPS), que
+#                 empieza con el primer POST; pedir más seguido no adelanta la reproducción
 class Server(BaseHTTPRequestHandler):
 
-    def _set_response(self):
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
+    run_file = None
+    start_time = None
+
+    def _set_response(self, status=200, content_type='text/html', length=None):
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        if length is not None:
+            self.send_header('Content-Length', str(length))
         self.end_headers()
 
+    def _send_json(self, body):
+        self._set_response(content_type='application/json', length=len(body))
+        self.wfile.write(body)
+
     def do_GET(self):
-        self._set_response()
-        self.wfile.write("GET request for {}".format(self.path).encode('utf-8'))
+        if self.path == '/info':
+            self._send_json(json.dumps({
+                "steps": len(self.run_file),
+                "total_robots": self.run_file.robots,
+                "rows": self.run_file.width,
+                "cols": self.run_file.height
+            }).encode('utf-8'))
+
+        elif self.path.startswith('/step/'):
+            try:
+                index = int(self.path[len('/step/'):])
+                if not -len(self.run_file) <= index < len(self.run_file):
+                    raise IndexError(f"El paso {index} no existe, hay {len(self.run_file)} registrados")
+                self._send_json(step_body(index % len(self.run_file)))
+            except (ValueError, IndexError) as error:
+                self._set_response(404)
+                self.wfile.write(str(error).encode('utf-8'))
+
+        else:
+            self._set_response()
+            self.wfile.write("GET request for {}".format(self.path).encode('utf-8'))
 
     def do_POST(self):
+        # Se descarta el cuerpo de la petición, el cliente solo pide el siguiente paso
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if Server.start_time is None:
+            Server.start_time = time.monotonic()
+        index = int((time.monotonic() - Server.start_time) * PLAYBACK_FPS)
+        self._send_json(step_body(min(index, len(self.run_file) - 1)))
+
+# Servidor con un hilo por petición y una cola de conexiones más grande que la de omisión (5),
+# para que varios clientes conectándose a la vez no esperen a que se reintente la conexión
+class ReplayServer(ThreadingHTTPServer):
+    request_queue_size = 128
+
 
-        listado = []
-        steps = []
-        board = []
-        rows = 0
-        cols = 0
-
-        with open('../Python/outputs/model.txt', 'r') as file:
-            
-            lines = file.readlines()
-            # Buscamos la primera línea que comienza con '[[' para identificar el comienzo de la primera "lista de listas"
-            start_index = next(i for i, line in enumerate(lines) if line.strip().startswith("[["))
-            # Ahora, buscamos la primera línea que termina con ']]' para identificar el final de la primera "lista de listas"
-            end_index = next(i for i, line in enumerate(lines[start_index:]) if line.strip().endswith("]]")) + start_index
-            # Calculamos las dimensiones
-            rows = end_index - start_index + 1
-            cols = len(lines[start_index].strip().split())  # Usamos split para contar los elementos en la primera línea
-
-            steps = []
-
-        with open('../Python/outputs/model.txt', 'r') as file:
-            for linea in file:
-                # Quita los corchetes y elimina espacios en blanco de los extremos
-                linea_limpia = linea.replace('[', '').replace(']', '').strip()
-                # Si la línea no está vacía después de limpiarla, añade a la lista
-                if linea_limpia:
-                    listado.append(linea_limpia)
-        
-        for i in range(len(listado)):
-            if i % (rows+1) == (rows):
-                print(board)
-                steps.append(board)
-                board = []
-            else:
-                board.append(listado[i])
-                
-        map_data = steps[2]
-        # Calcular la cantidad de cada tipo de elemento
-
-        total_robots = 5
-
-        # Preparar el JSON para enviar
-        response ={
-            "map_data": map_data,
-            "total_robots": total_robots,
-            "rows": rows,
-            "cols": cols
-        }
-
-        self._set_response()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
-
-def run(server_class=HTTPServer, handler_class=Server, port=8585):
+def run(server_class=ReplayServer, handler_class=Server, port=8585, run_path=RUN_FILE):
     logging.basicConfig(level=logging.INFO)
+    handler_class.run_file = RunFile(run_path)
     server_address = ('', port)
     httpd = server_class(server_address, handler_class)
     logging.info("Starting httpd...\n")
@@ -81,7 +107,9 @@ def run(server_class=HTTPServer, handler_class=Server, port=8585):
 
 if __name__ == '__main__':
     from sys import argv
-    if len(argv) == 2:
+    if len(argv) == 3:
+        run(port=int(argv[1]), run_path=argv[2])
+    elif len(argv) == 2:
         run(port=int(argv[1]))
     else:
         run()
\ No newline at end of file